@@ -2,6 +2,7 @@
 import contextvars
 import functools
 import inspect
+import sys
 from typing import (
     Callable,
     Any,
@@ -16,9 +17,15 @@ from typing import (
     Set,
 )
 
-import icontract._represent
 from icontract._globals import CallableT, ClassT
-from icontract._types import Contract, Snapshot, InvariantCheckEvent
+from icontract._types import (
+    Contract,
+    Snapshot,
+    InvariantCheckEvent,
+    Invariant,
+    inspect_arguments,
+    is_plain_function,
+)
 from icontract.errors import ViolationError
 
 
@@ -68,6 +75,10 @@ def kwargs_from_call(
     :param kwargs: keyword arguments supplied to the call
     :return: resolved arguments as they would be passed to the function
     """
+    # Start with the default argument values which have been resolved once at decoration.
+    # Copying a dictionary is much cheaper than setting the defaults one by one.
+    resolved_kwargs = kwdefaults.copy()
+
     # (Marko Ristin, 2020-12-01)
     # Insert _ARGS and _KWARGS preemptively even if they are not needed by any contract.
     # This makes the code logic much simpler since we do not explicitly check if a contract would
@@ -75,28 +86,18 @@ def kwargs_from_call(
     # (*e.g.*, when the contracts do not need them or don't use any argument at all).
     # We need to have a concrete issue where profiling helps us determine if this is a real
     # bottleneck or not and not optimize for no real benefit.
-    resolved_kwargs = {"_ARGS": args, "_KWARGS": kwargs}
-
-    # Set the default argument values as condition parameters.
-    for param_name, param_value in kwdefaults.items():
-        resolved_kwargs[param_name] = param_value
+    resolved_kwargs["_ARGS"] = args
+    resolved_kwargs["_KWARGS"] = kwargs
 
     # Override the defaults with the values actually supplied to the function.
-    for i, func_arg in enumerate(args):
-        if i < len(param_names):
-            resolved_kwargs[param_names[i]] = func_arg
-        else:
-            # Silently ignore call arguments that were not specified in the function.
-            # This way we let the underlying decorated function raise the exception
-            # instead of frankensteining the exception here.
-
-            # It seems that this line can not be covered,
-            # see https://github.com/nedbat/coveragepy/issues/1041.
-            # The branch was covered manually in ``tests.test_checkers``.
-            pass  # pragma: no cover
+    #
+    # The call arguments that were not specified in the function are silently ignored since ``zip`` stops
+    # at the shorter sequence. This way we let the underlying decorated function raise the exception
+    # instead of frankensteining the exception here.
+    if args:
+        resolved_kwargs.update(zip(param_names, args))
 
-    for key, val in kwargs.items():
-        resolved_kwargs[key] = val
+    resolved_kwargs.update(kwargs)
 
     return resolved_kwargs
 
@@ -133,6 +134,13 @@ def select_condition_kwargs(
         resolved keyword arguments of the call (including the default argument values of the decorated function)
     :return: a subset of resolved_kwargs
     """
+    # Fast path for the most common case where the condition has a single mandatory argument,
+    # *e.g.*, ``lambda x: x > 0``, so that we do not need to iterate over all the resolved arguments.
+    if len(contract.condition_args) == 1 and len(contract.mandatory_args) == 1:
+        arg_name = contract.mandatory_args[0]
+        if arg_name in resolved_kwargs:
+            return {arg_name: resolved_kwargs[arg_name]}
+
     # Check that all arguments to the condition function have been set.
     missing_args = [
         arg_name
@@ -158,15 +166,56 @@ def select_condition_kwargs(
 
         raise TypeError("".join(msg_parts))
 
+    # Iterate over the arguments of the condition, which were determined once at decoration, instead of over
+    # all the resolved arguments of the call since the condition usually needs only a few of them.
     condition_kwargs = {
-        arg_name: value
-        for arg_name, value in resolved_kwargs.items()
-        if arg_name in contract.condition_arg_set
+        arg_name: resolved_kwargs[arg_name]
+        for arg_name in contract.condition_args
+        if arg_name in resolved_kwargs
     }
 
     return condition_kwargs
 
 
+def _call_condition(
+    condition: Callable[..., Any],
+    contract: Contract,
+    resolved_kwargs: Mapping[str, Any],
+) -> Any:
+    """
+    Call the condition with the arguments selected from the resolved arguments of the call.
+
+    :param condition: condition function of the contract
+    :param contract: contract to be verified
+    :param resolved_kwargs:
+        resolved keyword arguments of the call (including the default argument values of the decorated function)
+    :return: result of the condition
+    """
+    # Some arguments might be missing in the look-ups below. We let ``select_condition_kwargs`` report them
+    # in an informative error.
+    single_arg = contract.single_arg
+    if single_arg is not None:
+        try:
+            value = resolved_kwargs[single_arg]
+        except KeyError:
+            pass
+        else:
+            return condition(value)
+
+    getter = contract.positional_arg_getter
+    if getter is not None:
+        try:
+            args = getter(resolved_kwargs)
+        except KeyError:
+            pass
+        else:
+            return condition(*args)
+
+    return condition(
+        **select_condition_kwargs(contract=contract, resolved_kwargs=resolved_kwargs)
+    )
+
+
 def _assert_no_invalid_kwargs(kwargs: Any) -> Optional[TypeError]:
     """Check that kwargs of a function contain no unexpected arguments."""
     if "_ARGS" in kwargs:
@@ -184,19 +233,85 @@ def _assert_no_invalid_kwargs(kwargs: Any) -> Optional[TypeError]:
     return None
 
 
+# Pre-bound postcondition as (condition, whether condition is a coroutine function, contract)
+_PreBoundPostcondition = Tuple[Callable[..., Any], bool, Contract]
+
+# Pre-bound snapshot as (capture, whether capture is a coroutine function, snapshot)
+_PreBoundSnapshot = Tuple[Callable[..., Any], bool, Snapshot]
+
+
+def _pre_bind_postconditions(
+    postconditions: List[Contract],
+) -> Tuple[_PreBoundPostcondition, ...]:
+    """Extract the attributes of the postconditions needed at every call so that we do not look them up repeatedly."""
+    return tuple(
+        (contract.condition, contract.is_async_condition, contract)
+        for contract in postconditions
+    )
+
+
+def _pre_bind_snapshots(snapshots: List[Snapshot]) -> Tuple[_PreBoundSnapshot, ...]:
+    """Extract the attributes of the snapshots needed at every call so that we do not look them up repeatedly."""
+    return tuple(
+        (snap.capture, inspect.iscoroutinefunction(snap.capture), snap)
+        for snap in snapshots
+    )
+
+
 def _unpack_pre_snap_posts(
     wrapper: CallableT,
-) -> Tuple[List[List[Contract]], List[Snapshot], List[Contract]]:
-    """Retrieve the preconditions, snapshots and postconditions defined for the given wrapper checker."""
-    preconditions = getattr(wrapper, "__preconditions__")  # type: List[List[Contract]]
-    snapshots = getattr(wrapper, "__postcondition_snapshots__")  # type: List[Snapshot]
-    postconditions = getattr(wrapper, "__postconditions__")  # type: List[Contract]
+) -> Tuple[
+    List[List[Contract]],
+    Tuple[_PreBoundSnapshot, ...],
+    Tuple[_PreBoundPostcondition, ...],
+]:
+    """
+    Retrieve the preconditions, pre-bound snapshots and pre-bound postconditions of the given wrapper checker.
 
-    return preconditions, snapshots, postconditions
+    The pre-bound tuples are cached on the checker. They are re-computed on the next call after
+    :func:`reset_pre_bound_contracts` has been called.
+    """
+    # We look up the attributes directly in the dictionary of the checker since this is called on every call and
+    # a dictionary lookup is cheaper than going through ``getattr``.
+    attributes = wrapper.__dict__
+
+    preconditions = attributes["__preconditions__"]  # type: List[List[Contract]]
+
+    pre_bound_snapshots = attributes[
+        "__pre_bound_snapshots__"
+    ]  # type: Optional[Tuple[_PreBoundSnapshot, ...]]
+    if pre_bound_snapshots is None:
+        pre_bound_snapshots = _pre_bind_snapshots(
+            attributes["__postcondition_snapshots__"]
+        )
+        attributes["__pre_bound_snapshots__"] = pre_bound_snapshots
+
+    pre_bound_postconditions = attributes[
+        "__pre_bound_postconditions__"
+    ]  # type: Optional[Tuple[_PreBoundPostcondition, ...]]
+    if pre_bound_postconditions is None:
+        pre_bound_postconditions = _pre_bind_postconditions(
+            attributes["__postconditions__"]
+        )
+        attributes["__pre_bound_postconditions__"] = pre_bound_postconditions
+
+    return preconditions, pre_bound_snapshots, pre_bound_postconditions
+
+
+def reset_pre_bound_contracts(checker: CallableT) -> None:
+    """
+    Make the checker re-compute the pre-bound snapshots and postconditions on the next call.
+
+    Call this function whenever you modify ``__postcondition_snapshots__`` or ``__postconditions__`` of the
+    checker directly instead of through :func:`add_snapshot_to_checker` or :func:`add_postcondition_to_checker`.
+    """
+    setattr(checker, "__pre_bound_snapshots__", None)
+    setattr(checker, "__pre_bound_postconditions__", None)
 
 
 def _assert_resolved_kwargs_valid(
-    postconditions: List[Contract], resolved_kwargs: Mapping[str, Any]
+    postconditions: Tuple[_PreBoundPostcondition, ...],
+    resolved_kwargs: Mapping[str, Any],
 ) -> Optional[TypeError]:
     """Check that the resolved kwargs of a decorated function are valid."""
     if postconditions:
@@ -220,6 +335,11 @@ def _create_violation_error(
     exception = None  # type: Optional[BaseException]
 
     if contract.error is None:
+        # We import the representation module only when we need to generate the message since it pulls in
+        # the parsing of the source code, which most of the programs never need and which makes
+        # ``import icontract`` slow. The errors given as functions or instances do not need it at all.
+        import icontract._represent  # pylint: disable=import-outside-toplevel
+
         try:
             msg = icontract._represent.generate_message(
                 contract=contract, resolved_kwargs=resolved_kwargs
@@ -267,6 +387,8 @@ def _create_violation_error(
                 )
             )
 
+        import icontract._represent  # pylint: disable=import-outside-toplevel
+
         msg = icontract._represent.generate_message(
             contract=contract, resolved_kwargs=resolved_kwargs
         )
@@ -302,14 +424,18 @@ async def _assert_preconditions_async(
                 exception is None
             ), "No exception as long as pre-condition group is satisfiable."
 
-            condition_kwargs = select_condition_kwargs(
-                contract=contract, resolved_kwargs=resolved_kwargs
-            )
-
-            if inspect.iscoroutinefunction(contract.condition):
-                check = await contract.condition(**condition_kwargs)
+            if contract.is_async_condition:
+                check = await _call_condition(
+                    condition=contract.condition,
+                    contract=contract,
+                    resolved_kwargs=resolved_kwargs,
+                )
             else:
-                check_or_coroutine = contract.condition(**condition_kwargs)
+                check_or_coroutine = _call_condition(
+                    condition=contract.condition,
+                    contract=contract,
+                    resolved_kwargs=resolved_kwargs,
+                )
                 if inspect.iscoroutine(check_or_coroutine):
                     check = await check_or_coroutine
                 else:
@@ -347,18 +473,23 @@ def _assert_preconditions(
                 exception is None
             ), "No exception as long as pre-condition group is satisfiable."
 
-            condition_kwargs = select_condition_kwargs(
-                contract=contract, resolved_kwargs=resolved_kwargs
-            )
-
-            if inspect.iscoroutinefunction(contract.condition):
+            if contract.is_async_condition:
                 raise ValueError(
                     "Unexpected coroutine (async) condition {} for a sync function {}.".format(
                         contract.condition, func
                     )
                 )
 
-            check = contract.condition(**condition_kwargs)
+            check = _call_condition(
+                condition=contract.condition,
+                contract=contract,
+                resolved_kwargs=resolved_kwargs,
+            )
+
+            # Most conditions return a plain boolean, so we skip the further inspection of the result
+            # if the condition held.
+            if check is True:
+                continue
 
             if inspect.iscoroutine(check):
                 raise ValueError(
@@ -381,11 +512,11 @@ def _assert_preconditions(
 
 
 async def _capture_old_async(
-    snapshots: List[Snapshot], resolved_kwargs: Mapping[str, Any]
+    snapshots: Tuple[_PreBoundSnapshot, ...], resolved_kwargs: Mapping[str, Any]
 ) -> "Old":
     """Capture all snapshots of an async function and return the captured values bundled in an ``Old``."""
     old_as_mapping = dict()  # type: MutableMapping[str, Any]
-    for snap in snapshots:
+    for capture, capture_is_coroutine_function, snap in snapshots:
         # This assert is just a last defense.
         # Conflicting snapshot names should have been caught before, either during the decoration or
         # in the meta-class.
@@ -397,10 +528,10 @@ async def _capture_old_async(
             a_snapshot=snap, resolved_kwargs=resolved_kwargs
         )
 
-        if inspect.iscoroutinefunction(snap.capture):
-            old_as_mapping[snap.name] = await snap.capture(**capture_kwargs)
+        if capture_is_coroutine_function:
+            old_as_mapping[snap.name] = await capture(**capture_kwargs)
         else:
-            captured_or_coroutine = snap.capture(**capture_kwargs)
+            captured_or_coroutine = capture(**capture_kwargs)
             if inspect.iscoroutine(captured_or_coroutine):
                 captured = await captured_or_coroutine
             else:
@@ -412,11 +543,13 @@ async def _capture_old_async(
 
 
 def _capture_old(
-    snapshots: List[Snapshot], resolved_kwargs: Mapping[str, Any], func: CallableT
+    snapshots: Tuple[_PreBoundSnapshot, ...],
+    resolved_kwargs: Mapping[str, Any],
+    func: CallableT,
 ) -> "Old":
     """Capture all snapshots of a sync function and return the captured values bundled in an ``Old``."""
     old_as_mapping = dict()  # type: MutableMapping[str, Any]
-    for snap in snapshots:
+    for capture, capture_is_coroutine_function, snap in snapshots:
         # This assert is just a last defense.
         # Conflicting snapshot names should have been caught before, either during the decoration or
         # in the meta-class.
@@ -424,10 +557,10 @@ def _capture_old(
             snap.name not in old_as_mapping
         ), "Snapshots with the conflicting name: {}"
 
-        if inspect.iscoroutinefunction(snap.capture):
+        if capture_is_coroutine_function:
             raise ValueError(
                 "Unexpected coroutine (async) snapshot capture {} for a sync function {}.".format(
-                    snap.capture, func
+                    capture, func
                 )
             )
 
@@ -435,13 +568,13 @@ def _capture_old(
             a_snapshot=snap, resolved_kwargs=resolved_kwargs
         )
 
-        captured = snap.capture(**capture_kwargs)
+        captured = capture(**capture_kwargs)
         if inspect.iscoroutine(captured):
             raise ValueError(
                 (
                     "Unexpected coroutine resulting from the snapshot capture {} "
                     "of a sync function {}."
-                ).format(snap.capture, func)
+                ).format(capture, func)
             )
 
         old_as_mapping[snap.name] = captured
@@ -450,22 +583,23 @@ def _capture_old(
 
 
 async def _assert_postconditions_async(
-    postconditions: List[Contract], resolved_kwargs: Mapping[str, Any]
+    postconditions: Tuple[_PreBoundPostcondition, ...],
+    resolved_kwargs: Mapping[str, Any],
 ) -> Optional[BaseException]:
     """Assert that the postconditions of an async function hold."""
     assert (
         "result" in resolved_kwargs
     ), "Expected 'result' to be already set in resolved kwargs before calling this function."
 
-    for contract in postconditions:
-        condition_kwargs = select_condition_kwargs(
-            contract=contract, resolved_kwargs=resolved_kwargs
-        )
-
-        if inspect.iscoroutinefunction(contract.condition):
-            check = await contract.condition(**condition_kwargs)
+    for condition, condition_is_coroutine_function, contract in postconditions:
+        if condition_is_coroutine_function:
+            check = await _call_condition(
+                condition=condition, contract=contract, resolved_kwargs=resolved_kwargs
+            )
         else:
-            check_or_coroutine = contract.condition(**condition_kwargs)
+            check_or_coroutine = _call_condition(
+                condition=condition, contract=contract, resolved_kwargs=resolved_kwargs
+            )
             if inspect.iscoroutine(check_or_coroutine):
                 check = await check_or_coroutine
             else:
@@ -482,31 +616,35 @@ async def _assert_postconditions_async(
 
 
 def _assert_postconditions(
-    postconditions: List[Contract], resolved_kwargs: Mapping[str, Any], func: CallableT
+    postconditions: Tuple[_PreBoundPostcondition, ...],
+    resolved_kwargs: Mapping[str, Any],
+    func: CallableT,
 ) -> Optional[BaseException]:
     """Assert that the postconditions of a sync function hold."""
     assert (
         "result" in resolved_kwargs
     ), "Expected 'result' to be already set in resolved kwargs before calling this function."
 
-    for contract in postconditions:
-        if inspect.iscoroutinefunction(contract.condition):
+    for condition, condition_is_coroutine_function, contract in postconditions:
+        if condition_is_coroutine_function:
             raise ValueError(
                 "Unexpected coroutine (async) condition {} for a sync function {}.".format(
-                    contract.condition, func
+                    condition, func
                 )
             )
 
-        condition_kwargs = select_condition_kwargs(
-            contract=contract, resolved_kwargs=resolved_kwargs
+        check = _call_condition(
+            condition=condition, contract=contract, resolved_kwargs=resolved_kwargs
         )
 
-        check = contract.condition(**condition_kwargs)
+        # See the comment in ``_assert_preconditions`` on why we short-circuit here.
+        if check is True:
+            continue
 
         if inspect.iscoroutine(check):
             raise ValueError(
                 "Unexpected coroutine resulting from the condition {} for a sync function {}.".format(
-                    contract.condition, func
+                    condition, func
                 )
             )
 
@@ -520,17 +658,24 @@ def _assert_postconditions(
     return None
 
 
-def _assert_invariant(contract: Contract, instance: Any) -> None:
-    """Assert that the contract holds as a class invariant given the instance of the class."""
-    if "self" in contract.condition_arg_set:
-        check = contract.condition(self=instance)
-    else:
-        check = contract.condition()
+def _assert_invariants(invariants: Iterable[Contract], instance: Any) -> None:
+    """Assert that the contracts hold as class invariants given the instance of the class."""
+    # We loop over the invariants here instead of calling a function for each invariant, since most
+    # invariants are simple conditions where the overhead of the extra call would dominate.
+    for contract in invariants:
+        # The invariants have at most the mandatory argument ``self``, so a single positional argument can only
+        # be ``self``. Passing it positionally is faster than passing it as a keyword argument.
+        if contract.single_arg is not None:
+            check = contract.condition(instance)
+        elif "self" in contract.condition_arg_set:
+            check = contract.condition(self=instance)
+        else:
+            check = contract.condition()
 
-    if not_check(check=check, contract=contract):
-        raise _create_violation_error(
-            contract=contract, resolved_kwargs={"self": instance}
-        )
+        if check is not True and not_check(check=check, contract=contract):
+            raise _create_violation_error(
+                contract=contract, resolved_kwargs={"self": instance}
+            )
 
 
 def select_capture_kwargs(
@@ -560,11 +705,8 @@ def select_capture_kwargs(
 
         raise TypeError("".join(msg_parts))
 
-    return {
-        arg_name: arg_value
-        for arg_name, arg_value in resolved_kwargs.items()
-        if arg_name in a_snapshot.arg_set
-    }
+    # All the arguments of the capture have been checked to be present.
+    return {arg_name: resolved_kwargs[arg_name] for arg_name in a_snapshot.args}
 
 
 def select_error_kwargs(
@@ -643,6 +785,49 @@ def resolve_kwdefaults(sign: inspect.Signature) -> Dict[str, Any]:
     return kwdefaults
 
 
+def _resolve_kwdefaults_of_plain_function(func: Callable[..., Any]) -> Dict[str, Any]:
+    """Resolve default values for the arguments of a plain function without constructing its signature."""
+    kwdefaults = dict()  # type: Dict[str, Any]
+
+    defaults = getattr(func, "__defaults__")  # type: Optional[Tuple[Any, ...]]
+    if defaults:
+        code = getattr(func, "__code__")
+        positional_names = code.co_varnames[: code.co_argcount]
+        kwdefaults.update(
+            zip(positional_names[len(positional_names) - len(defaults) :], defaults)
+        )
+
+    keyword_only_defaults = getattr(
+        func, "__kwdefaults__"
+    )  # type: Optional[Dict[str, Any]]
+    if keyword_only_defaults:
+        kwdefaults.update(keyword_only_defaults)
+
+    return kwdefaults
+
+
+def _update_wrapper_of_plain_function(wrapper: Any, func: Any) -> None:
+    """
+    Copy the attributes of a plain function to its wrapper in the same way as ``functools.update_wrapper``.
+
+    A plain function is guaranteed to have all the copied attributes so that we can assign them directly
+    instead of probing for each one of them.
+    """
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__annotations__ = func.__annotations__
+
+    if sys.version_info >= (3, 12):
+        wrapper.__type_params__ = func.__type_params__
+
+    if func.__dict__:
+        wrapper.__dict__.update(func.__dict__)
+
+    wrapper.__wrapped__ = func
+
+
 # This flag is used to avoid recursively checking contracts for the same function or instance while
 # contract checking is already in progress.
 #
@@ -667,24 +852,29 @@ def decorate_with_checker(func: CallableT) -> CallableT:
         "per function)."
     )
 
-    sign = inspect.signature(func)
-    if "_ARGS" in sign.parameters:
+    # The signature of a plain function is costly to construct, so we re-use the inspection of the functions
+    # with the same code and read the default values directly from the function.
+    plain = is_plain_function(func)
+    if plain:
+        param_names = list(inspect_arguments(func)[0])
+        kwdefaults = _resolve_kwdefaults_of_plain_function(func=func)
+    else:
+        sign = inspect.signature(func)
+        param_names = list(sign.parameters.keys())
+        kwdefaults = resolve_kwdefaults(sign=sign)
+
+    if "_ARGS" in param_names:
         raise TypeError(
             'The arguments of the function to be decorated with a contract checker include "_ARGS" which is '
             "a reserved placeholder for positional arguments in the condition."
         )
 
-    if "_KWARGS" in sign.parameters:
+    if "_KWARGS" in param_names:
         raise TypeError(
             'The arguments of the function to be decorated with a contract checker include "_KWARGS" which is '
             "a reserved placeholder for keyword arguments in the condition."
         )
 
-    param_names = list(sign.parameters.keys())
-
-    # Determine the default argument values
-    kwdefaults = resolve_kwdefaults(sign=sign)
-
     id_func = id(func)
 
     # (mristin, 2021-02-16)
@@ -701,9 +891,12 @@ def decorate_with_checker(func: CallableT) -> CallableT:
 
         async def wrapper(*args, **kwargs):  # type: ignore
             """Wrap func by checking the preconditions and postconditions."""
-            kwargs_error = _assert_no_invalid_kwargs(kwargs)
-            if kwargs_error:
-                raise kwargs_error
+            # Most calls either pass no keyword arguments at all or do not include placeholders, so we check
+            # the keyword arguments only if there are any.
+            if kwargs:
+                kwargs_error = _assert_no_invalid_kwargs(kwargs)
+                if kwargs_error:
+                    raise kwargs_error
 
             # We need to create a new in-progress set if it is None as the ``ContextVar`` does not accept
             # a factory function for the default argument. If we didn't do this, and simply set an empty
@@ -734,11 +927,12 @@ def decorate_with_checker(func: CallableT) -> CallableT:
                     kwargs=kwargs,
                 )
 
-                type_error = _assert_resolved_kwargs_valid(
-                    postconditions, resolved_kwargs
-                )
-                if type_error:
-                    raise type_error
+                if postconditions:
+                    type_error = _assert_resolved_kwargs_valid(
+                        postconditions=postconditions, resolved_kwargs=resolved_kwargs
+                    )
+                    if type_error:
+                        raise type_error
 
                 violation_error = await _assert_preconditions_async(
                     preconditions=preconditions, resolved_kwargs=resolved_kwargs
@@ -774,9 +968,12 @@ def decorate_with_checker(func: CallableT) -> CallableT:
 
         def wrapper(*args, **kwargs):  # type: ignore
             """Wrap func by checking the preconditions and postconditions."""
-            kwargs_error = _assert_no_invalid_kwargs(kwargs)
-            if kwargs_error:
-                raise kwargs_error
+            # Most calls either pass no keyword arguments at all or do not include placeholders, so we check
+            # the keyword arguments only if there are any.
+            if kwargs:
+                kwargs_error = _assert_no_invalid_kwargs(kwargs)
+                if kwargs_error:
+                    raise kwargs_error
 
             # We need to create a new in-progress set if it is None as the ``ContextVar`` does not accept
             # a factory function for the default argument. If we didn't do this, and simply set an empty
@@ -807,11 +1004,12 @@ def decorate_with_checker(func: CallableT) -> CallableT:
                     kwargs=kwargs,
                 )
 
-                type_error = _assert_resolved_kwargs_valid(
-                    postconditions=postconditions, resolved_kwargs=resolved_kwargs
-                )
-                if type_error:
-                    raise type_error
+                if postconditions:
+                    type_error = _assert_resolved_kwargs_valid(
+                        postconditions=postconditions, resolved_kwargs=resolved_kwargs
+                    )
+                    if type_error:
+                        raise type_error
 
                 violation_error = _assert_preconditions(
                     preconditions=preconditions,
@@ -848,7 +1046,10 @@ def decorate_with_checker(func: CallableT) -> CallableT:
                 in_progress.discard(id_func)
 
     # Copy __doc__ and other properties so that doctests can run
-    functools.update_wrapper(wrapper=wrapper, wrapped=func)
+    if plain:
+        _update_wrapper_of_plain_function(wrapper=wrapper, func=func)
+    else:
+        functools.update_wrapper(wrapper=wrapper, wrapped=func)
 
     assert not hasattr(
         wrapper, "__preconditions__"
@@ -865,9 +1066,16 @@ def decorate_with_checker(func: CallableT) -> CallableT:
     #
     # This is necessary in order to implement "require else" logic when a class weakens the preconditions of
     # its base class.
-    setattr(wrapper, "__preconditions__", [])
-    setattr(wrapper, "__postcondition_snapshots__", [])
-    setattr(wrapper, "__postconditions__", [])
+    preconditions = []  # type: List[List[Contract]]
+    snapshots = []  # type: List[Snapshot]
+    postconditions = []  # type: List[Contract]
+
+    setattr(wrapper, "__preconditions__", preconditions)
+    setattr(wrapper, "__postcondition_snapshots__", snapshots)
+    setattr(wrapper, "__postconditions__", postconditions)
+
+    # The snapshots and postconditions are pre-bound lazily in the wrapper, see ``_unpack_pre_snap_posts``.
+    reset_pre_bound_contracts(checker=wrapper)
 
     return wrapper  # type: ignore
 
@@ -917,6 +1125,7 @@ def add_snapshot_to_checker(checker: CallableT, snapshot: Snapshot) -> None:
             )
 
     snapshots.append(snapshot)
+    reset_pre_bound_contracts(checker=checker)
 
 
 def add_postcondition_to_checker(checker: CallableT, contract: Contract) -> None:
@@ -930,20 +1139,23 @@ def add_postcondition_to_checker(checker: CallableT, contract: Contract) -> None
     assert hasattr(checker, "__postconditions__")
     assert isinstance(getattr(checker, "__postconditions__"), list)
     getattr(checker, "__postconditions__").append(contract)
+    reset_pre_bound_contracts(checker=checker)
 
 
 def _find_self(
-    param_names: List[str], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    self_index: Optional[int], args: Tuple[Any, ...], kwargs: Dict[str, Any]
 ) -> Any:
-    """Find the instance of ``self`` in the arguments."""
-    instance_i = None
-    try:
-        instance_i = param_names.index("self")
-    except ValueError:
-        pass
+    """
+    Find the instance of ``self`` in the arguments.
 
-    if instance_i is not None and instance_i < len(args):
-        return args[instance_i]
+    :param self_index: index of ``self`` in the parameters of the function, if any
+    :param args: positional arguments of the call
+    :param kwargs: keyword arguments of the call
+    :return: the instance
+    :raise: KeyError if ``self`` was given neither as a positional nor as a keyword argument
+    """
+    if self_index is not None and self_index < len(args):
+        return args[self_index]
 
     return kwargs["self"]
 
@@ -966,8 +1178,9 @@ def _decorate_new_with_invariants(new_func: CallableT) -> CallableT:
         """Pass the arguments to __new__ and check invariants on the result."""
         instance = new_func(*args, **kwargs)
 
-        for invariant in instance.__class__.__invariants__:
-            _assert_invariant(contract=invariant, instance=instance)
+        _assert_invariants(
+            invariants=instance.__class__.__invariants__, instance=instance
+        )
 
         return instance
 
@@ -994,12 +1207,17 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
     sign = inspect.signature(func)
     param_names = list(sign.parameters.keys())
 
+    # We resolve the position of ``self`` and whether the function is ``__setattr__`` only once here
+    # so that we do not need to repeat it on every call.
+    self_index = param_names.index("self") if "self" in param_names else None
+    is_setattr = func.__name__ == "__setattr__"
+
     if is_init:
 
         def wrapper(*args, **kwargs):  # type: ignore
             """Wrap __init__ method of a class by checking the invariants *after* the invocation."""
             try:
-                instance = _find_self(param_names=param_names, args=args, kwargs=kwargs)
+                instance = _find_self(self_index=self_index, args=args, kwargs=kwargs)
             except KeyError as err:
                 raise KeyError(
                     (
@@ -1019,15 +1237,22 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
                 in_progress = set()
                 _IN_PROGRESS.set(in_progress)
 
+            # If the constructor has been called from another constructor of the same instance (*e.g.*, through
+            # ``super().__init__``), the outer-most constructor checks the invariants once it finishes. Mind that
+            # we must not discard the instance from the in-progress set here, since the outer constructor still runs.
             id_instance = id(instance)
+            if id_instance in in_progress:
+                return func(*args, **kwargs)
+
             in_progress.add(id_instance)
 
             # ExitStack is not used here due to performance.
             try:
                 result = func(*args, **kwargs)
 
-                for invariant in instance.__class__.__invariants__:
-                    _assert_invariant(contract=invariant, instance=instance)
+                _assert_invariants(
+                    invariants=instance.__class__.__invariants__, instance=instance
+                )
 
                 return result
             finally:
@@ -1051,7 +1276,7 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
                 """Wrap a function of a class by checking the invariants *before* and *after* the invocation."""
                 try:
                     instance = _find_self(
-                        param_names=param_names, args=args, kwargs=kwargs
+                        self_index=self_index, args=args, kwargs=kwargs
                     )
                 except KeyError as err:
                     raise KeyError(
@@ -1063,7 +1288,7 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
 
                 invariants = (
                     instance.__class__.__invariants_on_setattr__
-                    if func.__name__ == "__setattr__"
+                    if is_setattr
                     else instance.__class__.__invariants_on_call__
                 )
 
@@ -1087,13 +1312,11 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
 
                 # ExitStack is not used here due to performance.
                 try:
-                    for invariant in invariants:
-                        _assert_invariant(contract=invariant, instance=instance)
+                    _assert_invariants(invariants=invariants, instance=instance)
 
                     result = await func(*args, **kwargs)
 
-                    for invariant in invariants:
-                        _assert_invariant(contract=invariant, instance=instance)
+                    _assert_invariants(invariants=invariants, instance=instance)
 
                     return result
                 finally:
@@ -1105,7 +1328,7 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
                 """Wrap a function of a class by checking the invariants *before* and *after* the invocation."""
                 try:
                     instance = _find_self(
-                        param_names=param_names, args=args, kwargs=kwargs
+                        self_index=self_index, args=args, kwargs=kwargs
                     )
                 except KeyError as err:
                     raise KeyError(
@@ -1117,7 +1340,7 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
 
                 invariants = (
                     instance.__class__.__invariants_on_setattr__
-                    if func.__name__ == "__setattr__"
+                    if is_setattr
                     else instance.__class__.__invariants_on_call__
                 )
 
@@ -1142,13 +1365,11 @@ def _decorate_with_invariants(func: CallableT, is_init: bool) -> CallableT:
 
                 # ExitStack is not used here due to performance.
                 try:
-                    for invariant in invariants:
-                        _assert_invariant(contract=invariant, instance=instance)
+                    _assert_invariants(invariants=invariants, instance=instance)
 
                     result = func(*args, **kwargs)
 
-                    for invariant in invariants:
-                        _assert_invariant(contract=invariant, instance=instance)
+                    _assert_invariants(invariants=invariants, instance=instance)
 
                     return result
                 finally:
@@ -1200,7 +1421,10 @@ def add_invariant_checks(cls: ClassT) -> None:
         "{}".format(add_invariant_checks.__name__)
     )
     last_invariant = cls.__invariants__[-1]  # type: ignore
-    assert isinstance(last_invariant, icontract._types.Invariant)
+    assert isinstance(last_invariant, Invariant)
+
+    check_on_call = InvariantCheckEvent.CALL in last_invariant.check_on
+    check_on_setattr = InvariantCheckEvent.SETATTR in last_invariant.check_on
 
     # Filter out entries in the directory which are certainly not candidates for decoration
     # regarding the ``last_invariant``. Note that the functions which are already decorated
@@ -1226,16 +1450,10 @@ def add_invariant_checks(cls: ClassT) -> None:
             init_func = value
             continue
 
-        if (
-            name != "__setattr__"
-            and InvariantCheckEvent.CALL not in last_invariant.check_on
-        ):
+        if name != "__setattr__" and not check_on_call:
             continue
 
-        if (
-            name == "__setattr__"
-            and InvariantCheckEvent.SETATTR not in last_invariant.check_on
-        ):
+        if name == "__setattr__" and not check_on_setattr:
             continue
 
         if (
@@ -1249,6 +1467,29 @@ def add_invariant_checks(cls: ClassT) -> None:
         if name.startswith("_") and not (name.startswith("__") and name.endswith("__")):
             continue
 
+        # The magic methods inherited unchanged from ``object`` (*e.g.*, ``__str__`` or ``__eq__``) can not
+        # alter the instance, so the invariants can not break in them. The exceptions are ``__setattr__``
+        # and ``__delattr__``.
+        if (
+            isinstance(value, _SLOT_WRAPPER_TYPE)
+            and name not in ("__setattr__", "__delattr__")
+            and value is getattr(object, name, None)
+        ):
+            continue
+
+        # The methods and properties inherited from a base with invariants have been already decorated.
+        # We skip them early since most of the entries of a subclass are inherited.
+        if inspect.isfunction(value):
+            if _already_decorated_with_invariants(func=value):
+                continue
+
+        elif isinstance(value, property):
+            if all(
+                accessor is None or _already_decorated_with_invariants(func=accessor)
+                for accessor in (value.fget, value.fset, value.fdel)
+            ):
+                continue
+
         if inspect.isfunction(value) or isinstance(value, _SLOT_WRAPPER_TYPE):
             # Ignore class methods
             if getattr(value, "__self__", None) is cls:
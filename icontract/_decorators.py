@@ -1,7 +1,6 @@
 """Define public decorators."""
 import inspect
 import reprlib
-import traceback
 from typing import (
     Callable,
     Optional,
@@ -12,10 +11,41 @@ from typing import (
 )  # pylint: disable=unused-import
 
 import icontract._checkers
+import icontract._globals
 from icontract._globals import CallableT, ExceptionT, ClassT
 from icontract._types import Contract, Snapshot, InvariantCheckEvent, Invariant
 
 
+def _location_of_instantiation() -> Optional[str]:
+    """
+    Determine where the decorator has been instantiated.
+
+    We inspect the frames directly instead of calling :py:func:`traceback.extract_stack` since the latter
+    additionally reads the source lines, which we do not need and which dominates the cost of the decoration.
+
+    :return: location of the caller of the decorator's ``__init__``, if available
+    """
+    # We need to go two frames back: from this function to ``__init__`` and from ``__init__`` to its caller.
+    frame = inspect.currentframe()
+    try:
+        for _ in range(2):
+            if frame is None:
+                return None
+
+            frame = frame.f_back
+
+        if frame is None:
+            return None
+
+        return "File {}, line {} in {}".format(
+            frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+        )
+    finally:
+        # Break the reference cycle between the frame and this function,
+        # see https://docs.python.org/3/library/inspect.html#the-interpreter-stack
+        del frame
+
+
 class require:  # pylint: disable=invalid-name
     """
     Decorate a function with a precondition.
@@ -23,12 +53,14 @@ class require:  # pylint: disable=invalid-name
     The arguments of the precondition are expected to be a subset of the arguments of the wrapped function.
     """
 
+    __slots__ = ("enabled", "_contract")
+
     def __init__(
         self,
         condition: Callable[..., Any],
         description: Optional[str] = None,
         a_repr: reprlib.Repr = icontract._globals.aRepr,
-        enabled: bool = __debug__,
+        enabled: bool = icontract._globals.ENABLED,
         error: Optional[
             Union[Callable[..., ExceptionT], Type[ExceptionT], BaseException]
         ] = None,
@@ -48,7 +80,7 @@ class require:  # pylint: disable=invalid-name
             Otherwise, the condition check is disabled and there is no run-time overhead.
 
             The default is to always check the condition unless the interpreter runs in optimized mode (``-O`` or
-            ``-OO``).
+            ``-OO``) or the environment variable ``ICONTRACT_DISABLE`` is set to a non-empty string.
         :param error:
             The error is expected to denote either:
 
@@ -88,13 +120,7 @@ class require:  # pylint: disable=invalid-name
                     ).format(error)
                 )
 
-        location = None  # type: Optional[str]
-        tb_stack = traceback.extract_stack(limit=2)[:1]
-        if len(tb_stack) > 0:
-            frame = tb_stack[0]
-            location = "File {}, line {} in {}".format(
-                frame.filename, frame.lineno, frame.name
-            )
+        location = _location_of_instantiation()
 
         self._contract = Contract(
             condition=condition,
@@ -146,11 +172,13 @@ class snapshot:  # pylint: disable=invalid-name
     Snapshots are inherited from the base classes and must not have conflicting names in the class hierarchy.
     """
 
+    __slots__ = ("enabled", "_snapshot")
+
     def __init__(
         self,
         capture: Callable[..., Any],
         name: Optional[str] = None,
-        enabled: bool = __debug__,
+        enabled: bool = icontract._globals.ENABLED,
     ) -> None:
         """
         Initialize.
@@ -165,7 +193,7 @@ class snapshot:  # pylint: disable=invalid-name
             Otherwise, the snapshot is disabled and there is no run-time overhead.
 
             The default is to always capture the snapshot unless the interpreter runs in optimized mode (``-O`` or
-            ``-OO``).
+            ``-OO``) or the environment variable ``ICONTRACT_DISABLE`` is set to a non-empty string.
 
         """
         self._snapshot = None  # type: Optional[Snapshot]
@@ -173,13 +201,7 @@ class snapshot:  # pylint: disable=invalid-name
 
         # Resolve the snapshot only if enabled so that no overhead is incurred
         if enabled:
-            location = None  # type: Optional[str]
-            tb_stack = traceback.extract_stack(limit=2)[:1]
-            if len(tb_stack) > 0:
-                frame = tb_stack[0]
-                location = "File {}, line {} in {}".format(
-                    frame.filename, frame.lineno, frame.name
-                )
+            location = _location_of_instantiation()
 
             self._snapshot = Snapshot(capture=capture, name=name, location=location)
 
@@ -224,12 +246,14 @@ class ensure:  # pylint: disable=invalid-name
     not have "result" among its arguments.
     """
 
+    __slots__ = ("enabled", "_contract")
+
     def __init__(
         self,
         condition: Callable[..., Any],
         description: Optional[str] = None,
         a_repr: reprlib.Repr = icontract._globals.aRepr,
-        enabled: bool = __debug__,
+        enabled: bool = icontract._globals.ENABLED,
         error: Optional[
             Union[Callable[..., ExceptionT], Type[ExceptionT], BaseException]
         ] = None,
@@ -250,7 +274,7 @@ class ensure:  # pylint: disable=invalid-name
             Otherwise, the condition check is disabled and there is no run-time overhead.
 
             The default is to always check the condition unless the interpreter runs in optimized mode (``-O`` or
-            ``-OO``).
+            ``-OO``) or the environment variable ``ICONTRACT_DISABLE`` is set to a non-empty string.
         :param error:
             The error is expected to denote either:
 
@@ -289,13 +313,7 @@ class ensure:  # pylint: disable=invalid-name
                     ).format(error)
                 )
 
-        location = None  # type: Optional[str]
-        tb_stack = traceback.extract_stack(limit=2)[:1]
-        if len(tb_stack) > 0:
-            frame = tb_stack[0]
-            location = "File {}, line {} in {}".format(
-                frame.filename, frame.lineno, frame.name
-            )
+        location = _location_of_instantiation()
 
         self._contract = Contract(
             condition=condition,
@@ -355,12 +373,14 @@ class invariant:  # pylint: disable=invalid-name
     the argument ``check_on`` accordingly.
     """
 
+    __slots__ = ("enabled", "_invariant")
+
     def __init__(
         self,
         condition: Callable[..., Any],
         description: Optional[str] = None,
         a_repr: reprlib.Repr = icontract._globals.aRepr,
-        enabled: bool = __debug__,
+        enabled: bool = icontract._globals.ENABLED,
         error: Optional[
             Union[Callable[..., ExceptionT], Type[ExceptionT], BaseException]
         ] = None,
@@ -382,7 +402,7 @@ class invariant:  # pylint: disable=invalid-name
                 Otherwise, the condition check is disabled and there is no run-time overhead.
 
                 The default is to always check the condition unless the interpreter runs in optimized mode (``-O`` or
-                ``-OO``).
+                ``-OO``) or the environment variable ``ICONTRACT_DISABLE`` is set to a non-empty string.
         :param error:
             The error is expected to denote either:
 
@@ -429,13 +449,7 @@ class invariant:  # pylint: disable=invalid-name
                     ).format(error)
                 )
 
-        location = None  # type: Optional[str]
-        tb_stack = traceback.extract_stack(limit=2)[:1]
-        if len(tb_stack) > 0:
-            frame = tb_stack[0]
-            location = "File {}, line {} in {}".format(
-                frame.filename, frame.lineno, frame.name
-            )
+        location = _location_of_instantiation()
 
         if inspect.iscoroutinefunction(condition):
             raise ValueError(
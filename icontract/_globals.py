@@ -27,6 +27,13 @@ aRepr.maxother = 256
 #
 # Contracts marked with SLOW are also disabled if the interpreter is run in optimized mode (``-O`` or ``-OO``).
 SLOW = __debug__ and os.environ.get("ICONTRACT_SLOW", "") != ""
+
+# ENABLED is the default of the ``enabled`` argument of all the decorators. The environment variable
+# (ICONTRACT_DISABLE) switches off all the contracts which do not set ``enabled`` explicitly so that the decorators
+# return the undecorated functions and classes, and incur no run-time overhead.
+#
+# The contracts are also disabled if the interpreter is run in optimized mode (``-O`` or ``-OO``).
+ENABLED = __debug__ and os.environ.get("ICONTRACT_DISABLE", "") == ""
 CallableT = TypeVar("CallableT", bound=Callable[..., Any])
 ClassT = TypeVar("ClassT", bound=type)
 ExceptionT = TypeVar("ExceptionT", bound=BaseException)
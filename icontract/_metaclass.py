@@ -41,10 +41,17 @@ def _collapse_invariants(
     # region Invariants
     invariants = []  # type: List[Contract]
 
-    # Add invariants of the bases
+    # Add invariants of the bases.
+    #
+    # The bases in a diamond inheritance share the invariants of their common ancestor. We add each invariant
+    # only once so that it is not checked repeatedly on every call.
+    seen = set()  # type: Set[int]
     for base in bases:
         if hasattr(base, invariants_dunder):
-            invariants.extend(getattr(base, invariants_dunder))
+            for invariant in getattr(base, invariants_dunder):
+                if id(invariant) not in seen:
+                    seen.add(id(invariant))
+                    invariants.append(invariant)
 
     # Add invariants in the current namespace
     if invariants_dunder in namespace:
@@ -217,6 +224,7 @@ def _decorate_namespace_function(
         contract_checker.__preconditions__ = preconditions  # type: ignore
         contract_checker.__postcondition_snapshots__ = snapshots  # type: ignore
         contract_checker.__postconditions__ = postconditions  # type: ignore
+        icontract._checkers.reset_pre_bound_contracts(checker=contract_checker)
 
 
 def _decorate_namespace_property(
@@ -324,6 +332,7 @@ def _decorate_namespace_property(
             contract_checker.__preconditions__ = preconditions  # type: ignore
             contract_checker.__postcondition_snapshots__ = snapshots  # type: ignore
             contract_checker.__postconditions__ = postconditions  # type: ignore
+            icontract._checkers.reset_pre_bound_contracts(checker=contract_checker)
 
     if fget != value.fget or fset != value.fset or fdel != value.fdel:
         namespace[key] = property(fget=fget, fset=fset, fdel=fdel)
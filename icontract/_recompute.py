@@ -2,6 +2,7 @@
 
 import ast
 import builtins
+import collections
 import copy
 import functools
 import inspect
@@ -9,6 +10,7 @@ import sys
 import uuid
 from typing import (
     Any,
+    ChainMap,
     Mapping,
     Dict,
     List,
@@ -101,19 +103,19 @@ def _collect_name_loads(nodes: Iterable[ast.expr]) -> List[ast.expr]:
 def _translate_all_expression_to_a_module(
     generator_exp: ast.GeneratorExp,
     generated_function_name: str,
-    name_to_value: Mapping[str, Any],
+    arg_names: Tuple[str, ...],
 ) -> ast.Module:
     """
     Generate the AST of the module to trace an all quantifier on an generator expression.
 
     :param generator_exp: generator expression to be translated
     :param generated_function_name: UUID of the tracing function to be used in the code
-    :param name_to_value:
-        mapping of all resolved values to the variable names
+    :param arg_names:
+        names of the variables used by the generator expression
         (passed as arguments to the function so that the generation can access them)
     :return: translation to a module
     """
-    assert generated_function_name not in name_to_value
+    assert generated_function_name not in arg_names
     assert not hasattr(builtins, generated_function_name)
 
     # Collect all the names involved in the generation
@@ -208,7 +210,7 @@ def _translate_all_expression_to_a_module(
 
     is_async = any(comprehension.is_async for comprehension in generator_exp.generators)
 
-    args = [ast.arg(arg=name, annotation=None) for name in sorted(name_to_value.keys())]
+    args = [ast.arg(arg=name, annotation=None) for name in arg_names]
 
     if sys.version_info < (3, 5):
         raise NotImplementedError(
@@ -289,7 +291,128 @@ def _translate_all_expression_to_a_module(
     return module_node
 
 
+@functools.lru_cache(maxsize=1024)
+def _names_loaded_in_comprehension(
+    node: Union[ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp]
+) -> Tuple[str, ...]:
+    """
+    Collect the names loaded in the comprehension, sorted and without duplicates.
+
+    The comprehension only needs the values of these names so that we do not need to pass in all the
+    variables of the condition, including the globals, on every violation.
+    """
+    return tuple(
+        sorted(
+            set(
+                cast(ast.Name, name_node).id
+                for name_node in _collect_name_loads([node])
+            )
+        )
+    )
+
+
 # noinspection PyTypeChecker
+@functools.lru_cache(maxsize=1024)
+def _compile_comprehension(
+    node: Union[ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp],
+    arg_names: Tuple[str, ...],
+) -> Callable[..., Any]:
+    """
+    Compile the generator or comprehension from the node as a function of the given arguments.
+
+    The inspection of a condition is cached together with its AST nodes so that the comprehension
+    needs to be compiled only once for the same set of variables instead of on every violation.
+
+    :param node: AST node of the comprehension
+    :param arg_names: names of the variables used by the comprehension, sorted
+    :return: compiled function which computes the comprehension given the variables as keyword arguments
+    """
+    args = [ast.arg(arg=name, annotation=None) for name in arg_names]
+
+    if sys.version_info < (3,):
+        raise NotImplementedError(
+            "Python versions below 3 not supported, got: {}".format(sys.version_info)
+        )
+
+    if sys.version_info < (3, 8):
+        func_def_node = ast.FunctionDef(
+            name="generator_expr",
+            args=ast.arguments(args=args, kwonlyargs=[], kw_defaults=[], defaults=[]),
+            decorator_list=[],
+            body=[ast.Return(node)],
+        )
+
+        module_node = ast.Module(body=[func_def_node])
+    else:
+        func_def_node = ast.FunctionDef(
+            name="generator_expr",
+            args=ast.arguments(
+                args=args,
+                posonlyargs=[],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            decorator_list=[],
+            body=[ast.Return(node)],
+        )
+
+        module_node = ast.Module(body=[func_def_node], type_ignores=[])
+
+    ast.fix_missing_locations(module_node)
+
+    code = compile(source=module_node, filename="<ast>", mode="exec")
+
+    module_locals = {}  # type: Dict[str, Any]
+    module_globals = {}  # type: Dict[str, Any]
+    exec(code, module_globals, module_locals)  # pylint: disable=exec-used
+
+    generator_expr_func = module_locals["generator_expr"]
+    assert callable(generator_expr_func)
+
+    return cast(Callable[..., Any], generator_expr_func)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_all_tracing(
+    generator_exp: ast.GeneratorExp, arg_names: Tuple[str, ...]
+) -> Callable[..., Any]:
+    """
+    Compile the function which traces the first offending item of an all quantifier on the generator expression.
+
+    Analogous to the comprehensions, the tracing function is compiled only once for the same set of variables
+    instead of on every violation.
+
+    :param generator_exp: generator expression given to the all quantifier
+    :param arg_names: names of the variables used by the generator expression, sorted
+    :return: compiled tracing function which expects the variables as keyword arguments
+    """
+    generated_function_name = "icontract_tracing_all_with_generator_expr_{}".format(
+        uuid.uuid4().hex
+    )
+
+    module_node = _translate_all_expression_to_a_module(
+        generator_exp=generator_exp,
+        generated_function_name=generated_function_name,
+        arg_names=arg_names,
+    )
+
+    # In case you want to debug the generated function at this point,
+    # you probably want to use ``astor`` module to generate the source code
+    # based on the ``module_node``.
+
+    code = compile(source=module_node, filename="<ast>", mode="exec")
+
+    module_locals = {}  # type: Dict[str, Any]
+    module_globals = {}  # type: Dict[str, Any]
+    exec(code, module_globals, module_locals)  # pylint: disable=exec-used
+
+    generated_func = module_locals[generated_function_name]
+    assert callable(generated_func)
+
+    return cast(Callable[..., Any], generated_func)
+
+
 class Visitor(ast.NodeVisitor):
     """
     Traverse the abstract syntax tree and recompute the values of each node defined by the function frame.
@@ -309,13 +432,16 @@ class Visitor(ast.NodeVisitor):
         """
         # _name_to_value maps the variable names to variable values.
         # This is important for Load contexts as well as Store contexts in, e.g., named expressions.
-        self._name_to_value = dict()  # type: Dict[str, Any]
-
-        # Resolve precedence of variable lookups
-        for lookup in variable_lookup:
-            for name, value in lookup.items():
-                if name not in self._name_to_value:
-                    self._name_to_value[name] = value
+        #
+        # We chain the lookups instead of merging them into a single dictionary so that we do not need to copy
+        # all the globals on every re-computation. The chain resolves the precedence of the lookups, while
+        # the stored names are written only to the first, initially empty, mapping.
+        #
+        # The lookups are never written to, so we pass them in without casting them to mutable mappings
+        # as the subscription of generic types is evaluated at runtime on every violation.
+        self._name_to_value = collections.ChainMap(
+            dict(), *variable_lookup  # type: ignore
+        )  # type: ChainMap[str, Any]
 
         # value assigned to each visited node
         self.recomputed_values = dict()  # type: Dict[ast.AST, Any]
@@ -848,7 +974,7 @@ class Visitor(ast.NodeVisitor):
         if recomputed_arg is PLACEHOLDER:
             return PLACEHOLDER
 
-        result = func(*(self.visit(node=node.args[0]),))
+        result = func(recomputed_arg)
         if result:
             return result
 
@@ -859,29 +985,19 @@ class Visitor(ast.NodeVisitor):
         generator_exp = node.args[0]
         assert isinstance(generator_exp, ast.GeneratorExp)
 
-        generated_function_name = "icontract_tracing_all_with_generator_expr_{}".format(
-            uuid.uuid4().hex
+        arg_names = tuple(
+            name
+            for name in _names_loaded_in_comprehension(generator_exp)
+            if name in self._name_to_value
         )
 
-        module_node = _translate_all_expression_to_a_module(
-            generator_exp=generator_exp,
-            generated_function_name=generated_function_name,
-            name_to_value=self._name_to_value,
+        generated_func = _compile_all_tracing(
+            generator_exp=generator_exp, arg_names=arg_names
         )
 
-        # In case you want to debug the generated function at this point,
-        # you probably want to use ``astor`` module to generate the source code
-        # based on the ``module_node``.
-
-        code = compile(source=module_node, filename="<ast>", mode="exec")
-
-        module_locals = {}  # type: Dict[str, Any]
-        module_globals = {}  # type: Dict[str, Any]
-        exec(code, module_globals, module_locals)  # pylint: disable=exec-used
-
-        generated_func = module_locals[generated_function_name]
-
-        result, inputs = generated_func(**self._name_to_value)
+        result, inputs = generated_func(
+            **{name: self._name_to_value[name] for name in arg_names}
+        )
 
         assert not bool(result), "Expected the unhappy path here"
         assert isinstance(inputs, tuple)
@@ -899,59 +1015,23 @@ class Visitor(ast.NodeVisitor):
     ) -> Any:
         """Compile the generator or comprehension from the node and execute the compiled code."""
         # Please see "NOTE ABOUT NAME 🠒 VALUE STACKING".
-        if any(value is PLACEHOLDER for value in self._name_to_value.values()):
+        #
+        # The placeholders are only ever stored in the first mapping of the chain, so we do not need to
+        # iterate over all the variables, including the globals.
+        if any(value is PLACEHOLDER for value in self._name_to_value.maps[0].values()):
             return PLACEHOLDER
 
-        args = [
-            ast.arg(arg=name, annotation=None)
-            for name in sorted(self._name_to_value.keys())
-        ]
-
-        if sys.version_info < (3,):
-            raise NotImplementedError(
-                "Python versions below 3 not supported, got: {}".format(
-                    sys.version_info
-                )
-            )
-
-        if sys.version_info < (3, 8):
-            func_def_node = ast.FunctionDef(
-                name="generator_expr",
-                args=ast.arguments(
-                    args=args, kwonlyargs=[], kw_defaults=[], defaults=[]
-                ),
-                decorator_list=[],
-                body=[ast.Return(node)],
-            )
-
-            module_node = ast.Module(body=[func_def_node])
-        else:
-            func_def_node = ast.FunctionDef(
-                name="generator_expr",
-                args=ast.arguments(
-                    args=args,
-                    posonlyargs=[],
-                    kwonlyargs=[],
-                    kw_defaults=[],
-                    defaults=[],
-                ),
-                decorator_list=[],
-                body=[ast.Return(node)],
-            )
-
-            module_node = ast.Module(body=[func_def_node], type_ignores=[])
-
-        ast.fix_missing_locations(module_node)
-
-        code = compile(source=module_node, filename="<ast>", mode="exec")
-
-        module_locals = {}  # type: Dict[str, Any]
-        module_globals = {}  # type: Dict[str, Any]
-        exec(code, module_globals, module_locals)  # pylint: disable=exec-used
+        arg_names = tuple(
+            name
+            for name in _names_loaded_in_comprehension(node)
+            if name in self._name_to_value
+        )
 
-        generator_expr_func = module_locals["generator_expr"]
+        generator_expr_func = _compile_comprehension(node=node, arg_names=arg_names)
 
-        return generator_expr_func(**self._name_to_value)
+        return generator_expr_func(
+            **{name: self._name_to_value[name] for name in arg_names}
+        )
 
     def visit_GeneratorExp(self, node: ast.GeneratorExp) -> Any:
         """Compile the generator expression as a function and call it."""
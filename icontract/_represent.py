@@ -1,10 +1,13 @@
 """Handle representations necessary for informative error messages."""
 import ast
+import functools
 import inspect
+import linecache
 import re
 import reprlib
 import sys
 import textwrap
+import types
 import uuid
 from typing import (
     Any,
@@ -12,15 +15,15 @@ from typing import (
     MutableMapping,
     Callable,
     List,
-    Dict,
-    cast,
     Optional,
+    Tuple,
+    Iterator,
 )  # pylint: disable=unused-import
 
 import asttokens.asttokens
 
 import icontract._recompute
-from icontract._types import Contract
+from icontract._types import Contract, inspect_arguments
 from icontract._globals import CallableT
 
 # pylint does not play with typing.Mapping.
@@ -45,141 +48,135 @@ def _representable(value: Any) -> bool:
     )
 
 
+# AST node,
+# its text in the violation message,
+# whether the value is represented only if it is representable, and
+# the name of the variable if the node is a name (which is represented only if it is not a built-in).
+_ReprStep = Tuple[ast.AST, str, bool, Optional[str]]
+
+
 class Visitor(ast.NodeVisitor):
-    """Traverse the abstract syntax tree and collect the representations of the selected nodes."""
+    """
+    Traverse the abstract syntax tree and plan the representations of the selected nodes.
+
+    The plan depends only on the source code of the condition so that it can be made once and re-used
+    on each violation.
+    """
 
     # pylint: disable=invalid-name
     # pylint: disable=missing-docstring
 
-    def __init__(
-        self,
-        recomputed_values: Mapping[ast.AST, Any],
-        variable_lookup: List[Mapping[str, Any]],
-        atok: asttokens.asttokens.ASTTokens,
-    ) -> None:
+    def __init__(self, atok: asttokens.asttokens.ASTText) -> None:
         """
         Initialize.
 
-        :param recomputed_values: AST node of a condition function -> value associated with the node
-        :param variable_lookup:
-            list of lookup tables to look-up the values of the variables, sorted by precedence.
-            The visitor needs it here to check whether we overrode a built-in variable (like ``id``).
-        :param atok: parsed AST tree and tokens with additional positions in source code
-
+        :param atok: parsed AST tree with the source code of the nodes
         """
-        self._recomputed_values = recomputed_values
-        self._variable_lookup = variable_lookup
-        self.reprs = dict()  # type: MutableMapping[str, str]
         self._atok = atok
+        self.steps = []  # type: List[_ReprStep]
+
+    def _add_step(
+        self, node: ast.AST, only_representable: bool, name: Optional[str] = None
+    ) -> None:
+        """Plan to represent the node by its source code."""
+        text = self._atok.get_text(node)
+        assert isinstance(text, str)
+        self.steps.append((node, text, only_representable, name))
 
     if sys.version_info >= (3, 6):
 
         def visit_JoinedStr(self, node: ast.JoinedStr) -> None:
             """Show the whole joined strings without descending into the values."""
-            if node in self._recomputed_values:
-                value = self._recomputed_values[node]
-
-                if _representable(value=value):
-                    text = self._atok.get_text(node)
-                    self.reprs[text] = value
+            self._add_step(node=node, only_representable=True)
 
     def visit_Name(self, node: ast.Name) -> None:
         """
-        Resolve the name from the variable look-up and the built-ins.
+        Represent the name if it is not a built-in.
 
         Due to possible branching (e.g., If-expressions), some nodes might lack the recomputed values. These nodes
-        are ignored.
+        are ignored when the plan is executed.
         """
-        if node in self._recomputed_values:
-            value = self._recomputed_values[node]
-
-            # Check if it is a non-built-in
-            is_builtin = True
-            for lookup in self._variable_lookup:
-                if node.id in lookup:
-                    is_builtin = False
-                    break
-
-            if not is_builtin and _representable(value=value):
-                text = self._atok.get_text(node)
-                self.reprs[text] = value
-
+        self._add_step(node=node, only_representable=True, name=node.id)
         self.generic_visit(node=node)
 
     def visit_Attribute(self, node: ast.Attribute) -> None:
         """Represent the attribute by dumping its source code."""
-        if node in self._recomputed_values:
-            value = self._recomputed_values[node]
-
-            if _representable(value=value):
-                text = self._atok.get_text(node)
-                self.reprs[text] = value
-
+        self._add_step(node=node, only_representable=True)
         self.generic_visit(node=node)
 
     if sys.version_info >= (3, 8):
 
         def visit_NamedExpr(self, node: ast.NamedExpr) -> Any:
             """Represent the target with the value of the node."""
-            if node in self._recomputed_values:
-                value = self._recomputed_values[node]
-
-                target = node.target
-
-                if _representable(value=value):
-                    self.reprs[target.id] = value
-
+            self.steps.append((node, node.target.id, True, None))
             self.generic_visit(node=node)
 
     def visit_Call(self, node: ast.Call) -> None:
         """Represent the call by dumping its source code."""
-        if node in self._recomputed_values:
-            value = self._recomputed_values[node]
-            text = self._atok.get_text(node)
-
-            self.reprs[text] = value
-
+        self._add_step(node=node, only_representable=False)
         self.generic_visit(node=node)
 
     def visit_ListComp(self, node: ast.ListComp) -> None:
         """Represent the list comprehension by dumping its source code."""
-        if node in self._recomputed_values:
-            value = self._recomputed_values[node]
-            text = self._atok.get_text(node)
-
-            self.reprs[text] = value
-
+        self._add_step(node=node, only_representable=False)
         self.generic_visit(node=node)
 
     def visit_SetComp(self, node: ast.SetComp) -> None:
         """Represent the set comprehension by dumping its source code."""
-        if node in self._recomputed_values:
-            value = self._recomputed_values[node]
-            text = self._atok.get_text(node)
-
-            self.reprs[text] = value
-
+        self._add_step(node=node, only_representable=False)
         self.generic_visit(node=node)
 
     def visit_DictComp(self, node: ast.DictComp) -> None:
         """Represent the dictionary comprehension by dumping its source code."""
-        if node in self._recomputed_values:
-            value = self._recomputed_values[node]
-            text = self._atok.get_text(node)
-
-            self.reprs[text] = value
-
+        self._add_step(node=node, only_representable=False)
         self.generic_visit(node=node)
 
     def visit_Subscript(self, node: ast.Subscript) -> None:
         """Represent the subscript with its source code."""
-        if node in self._recomputed_values:
-            value = self._recomputed_values[node]
-            text = self._atok.get_text(node)
+        self._add_step(node=node, only_representable=False)
+        self.generic_visit(node=node)
 
-            self.reprs[text] = value
 
-        self.generic_visit(node=node)
+def _represent_recomputed(
+    steps: List[_ReprStep],
+    recomputed_values: Mapping[ast.AST, Any],
+    variable_lookup: List[Mapping[str, Any]],
+) -> MutableMapping[str, Any]:
+    """
+    Execute the representation plan of a condition on the recomputed values.
+
+    :param steps: representation plan of the condition
+    :param recomputed_values: AST node of a condition function -> value associated with the node
+    :param variable_lookup:
+        list of lookup tables to look-up the values of the variables, sorted by precedence.
+        We need it here to check whether we overrode a built-in variable (like ``id``).
+    :return: source code of the node -> value to be represented
+    """
+    reprs = dict()  # type: MutableMapping[str, Any]
+
+    for node, text, only_representable, name in steps:
+        if node not in recomputed_values:
+            continue
+
+        value = recomputed_values[node]
+
+        if name is not None:
+            # Check if it is a non-built-in
+            is_builtin = True
+            for lookup in variable_lookup:
+                if name in lookup:
+                    is_builtin = False
+                    break
+
+            if is_builtin:
+                continue
+
+        if only_representable and not _representable(value=value):
+            continue
+
+        reprs[text] = value
+
+    return reprs
 
 
 def is_lambda(a_function: CallableT) -> bool:
@@ -202,11 +199,11 @@ def is_lambda(a_function: CallableT) -> bool:
 class ConditionLambdaInspection:
     """Represent the inspection of the condition function given as a lambda."""
 
-    def __init__(self, atok: asttokens.asttokens.ASTTokens, node: ast.Lambda) -> None:
+    def __init__(self, atok: asttokens.asttokens.ASTText, node: ast.Lambda) -> None:
         """
         Initialize.
 
-        :param atok: parsed AST tree and tokens with added positional properties
+        :param atok: parsed AST tree with the source code of the nodes
         :param node: lambda AST node corresponding to the condition
         """
         self.atok = atok
@@ -216,6 +213,12 @@ class ConditionLambdaInspection:
         assert isinstance(text, str)
         self.text = text
 
+        visitor = Visitor(atok=atok)
+        visitor.visit(node=node.body)
+
+        # Plan of the representations in the violation message, made once per condition
+        self.repr_steps = visitor.steps
+
 
 _DECORATOR_RE = re.compile(r"^\s*@[a-zA-Z_]")
 _DEF_CLASS_RE = re.compile(r"^\s*(async\s+def|def |class )")
@@ -224,11 +227,11 @@ _DEF_CLASS_RE = re.compile(r"^\s*(async\s+def|def |class )")
 class DecoratorInspection:
     """Represent the inspection of a decorator extracted from a source file and embedded in a dummy dynamic module."""
 
-    def __init__(self, atok: asttokens.asttokens.ASTTokens, node: ast.Call) -> None:
+    def __init__(self, atok: asttokens.asttokens.ASTText, node: ast.Call) -> None:
         """
         Initialize.
 
-        :param atok: parsed AST tree and tokens with added positional properties
+        :param atok: parsed AST tree with the source code of the nodes
         :param node: lambda AST node corresponding to the condition
         """
         self.atok = atok
@@ -293,7 +296,9 @@ def inspect_decorator(
         "".join(decorator_lines)
     ) + "def dummy_{}(): pass".format(uuid.uuid4().hex)
 
-    atok = asttokens.asttokens.ASTTokens(decorator_text, parse=True)
+    # We do not need the tokens, only the source code of the nodes. ``ASTText`` takes it directly from the positions
+    # of the nodes instead of tokenizing the text and marking all the nodes with the tokens.
+    atok = asttokens.asttokens.ASTText(decorator_text)
 
     if not isinstance(atok.tree, ast.Module):
         raise ValueError(
@@ -404,6 +409,51 @@ def find_lambda_condition(
     return ConditionLambdaInspection(atok=decorator_inspection.atok, node=lambda_node)
 
 
+@functools.lru_cache(maxsize=1024)
+def _inspect_lambda_code(
+    co_filename: str, code: types.CodeType  # pylint: disable=unused-argument
+) -> ConditionLambdaInspection:
+    """
+    Parse the decorator in which the lambda with the given code has been defined.
+
+    The inspection depends only on the source code so that we can cache it per code object.
+    The values of the closure and the globals are looked up anew on each violation.
+
+    The ``co_filename`` is a part of the key since the code objects with the same content
+    compare equal even though they originate from different files.
+    """
+    # We resolve the source file here so that the file system is not queried again on repeated violations.
+    filename = inspect.getsourcefile(code)
+    if filename is None:
+        # Let ``inspect`` raise the error which explains why the source code is not available.
+        inspect.findsource(code)
+
+    assert filename is not None
+
+    # We read the lines directly from the line cache instead of using ``inspect.findsource``, since the latter
+    # also needs to find the module of the code, which iterates over all the loaded modules.
+    # The line of a lambda is the line of its code object so that we do not need to search for it.
+    linecache.checkcache(filename)
+    lines = linecache.getlines(filename)
+    if len(lines) > 0:
+        condition_lineno = code.co_firstlineno - 1
+    else:
+        # Fallback to ``inspect`` for the sources which are not available in the line cache so that
+        # it either finds them or raises an informative error.
+        lines, condition_lineno = inspect.findsource(code)
+
+    decorator_inspection = inspect_decorator(
+        lines=lines, lineno=condition_lineno, filename=filename
+    )
+
+    lambda_inspection = find_lambda_condition(decorator_inspection=decorator_inspection)
+    assert (
+        lambda_inspection is not None
+    ), "Expected to find the lambda condition in the inspected decorator."
+
+    return lambda_inspection
+
+
 def inspect_lambda_condition(
     condition: Callable[..., Any]
 ) -> Optional[ConditionLambdaInspection]:
@@ -415,17 +465,38 @@ def inspect_lambda_condition(
     if not is_lambda(condition):
         return None
 
-    lines, condition_lineno = inspect.findsource(condition)
-    filename = inspect.getsourcefile(condition)
-    assert filename is not None
+    code = condition.__code__
+    return _inspect_lambda_code(code.co_filename, code)
 
-    decorator_inspection = inspect_decorator(
-        lines=lines, lineno=condition_lineno, filename=filename
-    )
 
-    lambda_inspection = find_lambda_condition(decorator_inspection=decorator_inspection)
+class _ClosureLookup(Mapping[str, Any]):
+    """
+    Look up the values of the closure of a condition function.
 
-    return lambda_inspection
+    The contents of the cells are read only on access. Most of the free variables are usually looked up
+    at most once, so we avoid copying all of them into a dictionary on every violation.
+    """
+
+    def __init__(self, freevars: Tuple[str, ...], cells: Tuple[Any, ...]) -> None:
+        """
+        Initialize.
+
+        :param freevars: names of the free variables of the condition function
+        :param cells: closure cells of the condition function corresponding to ``freevars``
+        """
+        self._cells = dict(zip(freevars, cells))
+
+    def __getitem__(self, key: str) -> Any:
+        """Read the current content of the cell corresponding to the variable ``key``."""
+        return self._cells[key].cell_contents
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the free variables."""
+        return iter(self._cells)
+
+    def __len__(self) -> int:
+        """Return the number of the free variables."""
+        return len(self._cells)
 
 
 # fmt: off
@@ -457,8 +528,6 @@ def collect_variable_lookup(
     # Add closure to the lookup
     ##
 
-    closure_dict = dict()  # type: Dict[str, Any]
-
     if condition.__closure__ is not None:
         closure_cells = condition.__closure__
         freevars = condition.__code__.co_freevars
@@ -467,10 +536,9 @@ def collect_variable_lookup(
             "Number of closure cells of a condition function ({}) == number of free vars ({})".format(
                 len(closure_cells), len(freevars))
 
-        for cell, freevar in zip(closure_cells, freevars):
-            closure_dict[freevar] = cell.cell_contents
-
-    variable_lookup.append(closure_dict)
+        variable_lookup.append(_ClosureLookup(freevars=freevars, cells=closure_cells))
+    else:
+        variable_lookup.append(dict())
 
     ##
     # Add globals to the lookup
@@ -496,12 +564,16 @@ def repr_values(condition: Callable[..., bool], lambda_inspection: Optional[Cond
     :return: list of value representations
     """
     # Hide _ARGS and _KWARGS if they are not part of the condition for better readability
+    #
+    # We annotate with type comments instead of casting since the subscription of generic types
+    # is evaluated at runtime on every violation.
+    selected_kwargs = resolved_kwargs  # type: Mapping[str, Any]
+
     if '_ARGS' in resolved_kwargs or '_KWARGS' in resolved_kwargs:
-        parameters = inspect.signature(condition).parameters
-        malleable_kwargs = cast(
-            MutableMapping[str, Any],
-            resolved_kwargs.copy()  # type: ignore
-        )
+        # The inspection of the arguments is cached so that we do not construct the signature
+        # of the condition on every violation.
+        parameters = inspect_arguments(condition)[0]
+        malleable_kwargs = dict(resolved_kwargs)
 
         if '_ARGS' not in parameters:
             malleable_kwargs.pop('_ARGS', None)
@@ -509,9 +581,7 @@ def repr_values(condition: Callable[..., bool], lambda_inspection: Optional[Cond
         if '_KWARGS' not in parameters:
             malleable_kwargs.pop('_KWARGS', None)
 
-        selected_kwargs = cast(Mapping[str, Any], malleable_kwargs)
-    else:
-        selected_kwargs = resolved_kwargs
+        selected_kwargs = malleable_kwargs
 
     # Don't use ``resolved_kwargs`` from this point on.
     # ``selected_kwargs`` is meant to be used instead for better readability of error messages.
@@ -531,11 +601,8 @@ def repr_values(condition: Callable[..., bool], lambda_inspection: Optional[Cond
         recompute_visitor.visit(node=lambda_inspection.node.body)
         recomputed_values = recompute_visitor.recomputed_values
 
-        repr_visitor = Visitor(
-            recomputed_values=recomputed_values, variable_lookup=variable_lookup, atok=lambda_inspection.atok)
-        repr_visitor.visit(node=lambda_inspection.node.body)
-
-        reprs = repr_visitor.reprs
+        reprs = _represent_recomputed(
+            steps=lambda_inspection.repr_steps, recomputed_values=recomputed_values, variable_lookup=variable_lookup)
 
     # Add original arguments from the call unless they shadow a variable in the re-computation.
     #
@@ -545,8 +612,8 @@ def repr_values(condition: Callable[..., bool], lambda_inspection: Optional[Cond
     if reprs is None:
         reprs = dict()
 
-    for key in sorted(selected_kwargs.keys()):
-        val = selected_kwargs[key]
+    # The order does not matter here since the representations are sorted below.
+    for key, val in selected_kwargs.items():
         if key not in reprs and _representable(value=val):
             reprs[key] = val
 
@@ -554,17 +621,21 @@ def repr_values(condition: Callable[..., bool], lambda_inspection: Optional[Cond
 
     # We need to sort in order to present the same violation error on repeated violations.
     # Otherwise, the order of the reported arguments may be arbitrary.
-    for key in sorted(reprs.keys()):
-        value = reprs[key]
+    # The keys are unique so that the values are never compared while sorting.
+    for key, value in sorted(reprs.items()):
         if isinstance(value, icontract._recompute.FirstExceptionInAll):
-            writing = ['{} was False, e.g., with'.format(key)]
+            writing = [key, ' was False, e.g., with']
             for input_name, input_value in value.inputs:
-                writing.append('\n')
-                writing.append('  {} = {}'.format(input_name, a_repr.repr(input_value)))
+                writing.append('\n  ')
+                writing.append(input_name)
+                writing.append(' = ')
+                writing.append(a_repr.repr(input_value))
 
             parts.append(''.join(writing))
         else:
-            parts.append('{} was {}'.format(key, a_repr.repr(value)))
+            # We concatenate directly instead of formatting since this is run for every value
+            # of every violation.
+            parts.append(key + ' was ' + a_repr.repr(value))
 
     return parts
 
@@ -584,8 +655,8 @@ def represent_condition(condition: CallableT) -> str:
     return condition_repr
 
 
-def generate_message(contract: Contract, resolved_kwargs: Mapping[str, Any]) -> str:
-    """Generate the message upon contract violation."""
+def _generate_message_prefix(contract: Contract, lambda_inspection: Optional[ConditionLambdaInspection]) -> str:
+    """Generate the part of the violation message which does not depend on the values."""
     parts = []  # type: List[str]
 
     if contract.location is not None:
@@ -594,18 +665,30 @@ def generate_message(contract: Contract, resolved_kwargs: Mapping[str, Any]) ->
     if contract.description is not None:
         parts.append("{}: ".format(contract.description))
 
-    lambda_inspection = None  # type: Optional[ConditionLambdaInspection]
-    if not is_lambda(a_function=contract.condition):
-        condition_text = contract.condition.__name__
+    if lambda_inspection is None:
+        parts.append(contract.condition.__name__)
     else:
+        parts.append(lambda_inspection.text)
+
+    return "".join(parts)
+
+
+def generate_message(contract: Contract, resolved_kwargs: Mapping[str, Any]) -> str:
+    """Generate the message upon contract violation."""
+    lambda_inspection = None  # type: Optional[ConditionLambdaInspection]
+    if is_lambda(a_function=contract.condition):
         # We need to extract the source code corresponding to the decorator since inspect.getsource() is broken with
         # lambdas.
         lambda_inspection = inspect_lambda_condition(condition=contract.condition)
         assert lambda_inspection is not None, \
             "Unexpected no lambda inspection for condition: {}".format(contract.condition)
-        condition_text = lambda_inspection.text
 
-    parts.append(condition_text)
+    # The prefix does not change between the violations so we generate it only once.
+    if contract._message_prefix is None:
+        contract._message_prefix = _generate_message_prefix(
+            contract=contract, lambda_inspection=lambda_inspection)
+
+    parts = [contract._message_prefix]  # type: List[str]
 
     repr_vals = repr_values(
         condition=contract.condition,
@@ -1,9 +1,14 @@
 """Define data structures shared among the modules."""
 import enum
 import inspect
+import operator
 import reprlib
+import types
 from typing import (
     Callable,
+    Dict,
+    FrozenSet,
+    Tuple,
     Optional,
     Union,
     Set,
@@ -18,9 +23,101 @@ import icontract._globals
 from icontract._globals import ExceptionT
 
 
+# Argument names, names of the mandatory arguments and whether there is at least one argument and
+# all the arguments are mandatory and can be passed positionally
+_ArgumentInspection = Tuple[Tuple[str, ...], Tuple[str, ...], bool]
+
+# Cache of the argument inspections of plain functions keyed by
+# (code, number of positional default values, names of keyword-only arguments with default values).
+#
+# The arguments of a plain function depend only on its code and on which of its arguments have default values.
+# The conditions are often re-created from the same code, *e.g.*, when the same function is decorated many times
+# or when the decorated functions are defined in a loop, so that we compute their signatures only once.
+_ArgumentKey = Tuple[types.CodeType, int, FrozenSet[str]]
+_ARGUMENT_INSPECTIONS = dict()  # type: Dict[_ArgumentKey, _ArgumentInspection]
+
+# Limit the size of the cache so that it does not grow unbounded with the dynamically generated code.
+_ARGUMENT_INSPECTIONS_MAXSIZE = 1024
+
+
+def _inspect_arguments_from_signature(
+    signature: inspect.Signature,
+) -> _ArgumentInspection:
+    """Inspect the arguments of a callable based on its signature."""
+    parameters = signature.parameters.values()
+
+    return (
+        tuple(param.name for param in parameters),
+        tuple(
+            param.name
+            for param in parameters
+            if param.default == inspect.Parameter.empty
+        ),
+        len(parameters) > 0
+        and all(
+            param.kind
+            in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+            and param.default == inspect.Parameter.empty
+            for param in parameters
+        ),
+    )
+
+
+def is_plain_function(func: Callable[..., Any]) -> bool:
+    """Check that the arguments of ``func`` are determined by its code and default values alone."""
+    return (
+        inspect.isfunction(func)
+        and not hasattr(func, "__wrapped__")
+        and not hasattr(func, "__signature__")
+    )
+
+
+def inspect_arguments(func: Callable[..., Any]) -> _ArgumentInspection:
+    """Inspect the arguments of ``func``, and re-use the inspection of the plain functions with the same code."""
+    if not is_plain_function(func):
+        return _inspect_arguments_from_signature(inspect.signature(func))
+
+    key = (
+        func.__code__,
+        0 if func.__defaults__ is None else len(func.__defaults__),
+        frozenset() if func.__kwdefaults__ is None else frozenset(func.__kwdefaults__),
+    )
+
+    inspection = _ARGUMENT_INSPECTIONS.get(key, None)
+    if inspection is None:
+        inspection = _inspect_arguments_from_signature(inspect.signature(func))
+
+        if len(_ARGUMENT_INSPECTIONS) >= _ARGUMENT_INSPECTIONS_MAXSIZE:
+            _ARGUMENT_INSPECTIONS.clear()
+
+        _ARGUMENT_INSPECTIONS[key] = inspection
+
+    return inspection
+
+
 class Contract:
     """Represent a contract to be enforced as a precondition, postcondition or as an invariant."""
 
+    __slots__ = (
+        "condition",
+        "is_async_condition",
+        "condition_args",
+        "condition_arg_set",
+        "mandatory_args",
+        "single_arg",
+        "positional_arg_getter",
+        "description",
+        "_a_repr",
+        "error",
+        "error_args",
+        "error_arg_set",
+        "location",
+        "_message_prefix",
+    )
+
     def __init__(
         self,
         condition: Callable[..., Any],
@@ -48,18 +145,31 @@ class Contract:
         """
         self.condition = condition
 
-        signature = inspect.signature(condition)
+        # Checking whether a function is a coroutine function is surprisingly costly, so we do it only once.
+        self.is_async_condition = inspect.iscoroutinefunction(condition)
+
+        condition_args, mandatory_args, all_positional = inspect_arguments(condition)
 
         # All argument names of the condition
-        self.condition_args = list(signature.parameters.keys())  # type: List[str]
+        self.condition_args = list(condition_args)  # type: List[str]
         self.condition_arg_set = set(self.condition_args)  # type: Set[str]
 
         # Names of the mandatory arguments of the condition
-        self.mandatory_args = [
-            name
-            for name, param in signature.parameters.items()
-            if param.default == inspect.Parameter.empty
-        ]
+        self.mandatory_args = list(mandatory_args)  # type: List[str]
+
+        # Calling the condition with positional arguments is much faster than calling it with keyword arguments.
+        # If all the arguments of the condition are mandatory and can be passed positionally, we pick them
+        # from the resolved arguments of a call.
+        #
+        # Most conditions have a single argument so we look it up directly, while we use an item getter
+        # for the conditions with multiple arguments.
+        self.single_arg = None  # type: Optional[str]
+        self.positional_arg_getter = None  # type: Optional[Callable[..., Any]]
+        if all_positional:
+            if len(self.condition_args) == 1:
+                self.single_arg = self.condition_args[0]
+            else:
+                self.positional_arg_getter = operator.itemgetter(*self.condition_args)
 
         self.description = description
         self._a_repr = a_repr
@@ -76,10 +186,16 @@ class Contract:
 
         self.location = location
 
+        # Location, description and condition text are fixed so that we can assemble the beginning
+        # of the violation message only once, on the first violation (see ``icontract._represent``).
+        self._message_prefix = None  # type: Optional[str]
+
 
 class Snapshot:
     """Define a snapshot of an argument *prior* to the function invocation that is later supplied to a postcondition."""
 
+    __slots__ = ("capture", "name", "args", "arg_set", "location")
+
     def __init__(
         self,
         capture: Callable[..., Any],
@@ -146,6 +262,8 @@ class Invariant(Contract):
     # the backwards compatibility with the integrators after introducing
     # the ``check_on`` feature.
 
+    __slots__ = ("check_on",)
+
     def __init__(
         self,
         check_on: InvariantCheckEvent,
@@ -48,7 +48,7 @@ setup(
     keywords="design-by-contract precondition postcondition validation",
     packages=find_packages(exclude=["tests*"]),
     install_requires=[
-        "asttokens>=2,<3",
+        "asttokens>=2.1,<3",
         'contextvars;python_version=="3.6"',
         "typing_extensions",
     ],
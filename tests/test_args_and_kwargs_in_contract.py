@@ -87,13 +87,9 @@ class TestArgs(unittest.TestCase):
         def some_func(*args: Any) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(3)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        assert violation_error is not None
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -102,7 +98,7 @@ class TestArgs(unittest.TestCase):
                 args was 3
                 len(_ARGS) was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -182,13 +178,9 @@ class TestKwargs(unittest.TestCase):
         def some_func(**kwargs: Any) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(y=3)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        assert violation_error is not None
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -196,7 +188,7 @@ class TestKwargs(unittest.TestCase):
                 _KWARGS was {'y': 3}
                 y was 3"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -250,21 +242,16 @@ class TestArgsAndKwargs(unittest.TestCase):
 
 class TestConflictOnARGSReported(unittest.TestCase):
     def test_in_function_definition(self) -> None:
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
 
             @icontract.require(lambda _ARGS: True)
             def some_func(_ARGS: Any) -> None:
                 pass
 
-        except TypeError as error:
-            type_error = error
-
-        assert type_error is not None
         self.assertEqual(
             'The arguments of the function to be decorated with a contract checker include "_ARGS" '
             "which is a reserved placeholder for positional arguments in the condition.",
-            str(type_error),
+            str(context.exception),
         )
 
     def test_in_kwargs_in_call(self) -> None:
@@ -272,37 +259,28 @@ class TestConflictOnARGSReported(unittest.TestCase):
         def some_func(*args, **kwargs) -> None:  # type: ignore
             pass
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             some_func(_ARGS="something")
-        except TypeError as error:
-            type_error = error
 
-        assert type_error is not None
         self.assertEqual(
             'The arguments of the function call include "_ARGS" '
             "which is a placeholder for positional arguments in a condition.",
-            str(type_error),
+            str(context.exception),
         )
 
 
 class TestConflictOnKWARGSReported(unittest.TestCase):
     def test_in_function_definition(self) -> None:
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
 
             @icontract.require(lambda _ARGS: True)
             def some_func(_KWARGS: Any) -> None:
                 pass
 
-        except TypeError as error:
-            type_error = error
-
-        assert type_error is not None
         self.assertEqual(
             'The arguments of the function to be decorated with a contract checker include "_KWARGS" '
             "which is a reserved placeholder for keyword arguments in the condition.",
-            str(type_error),
+            str(context.exception),
         )
 
     def test_in_kwargs_in_call(self) -> None:
@@ -310,17 +288,13 @@ class TestConflictOnKWARGSReported(unittest.TestCase):
         def some_func(*args, **kwargs) -> None:  # type: ignore
             pass
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             some_func(_KWARGS="something")
-        except TypeError as error:
-            type_error = error
 
-        assert type_error is not None
         self.assertEqual(
             'The arguments of the function call include "_KWARGS" '
             "which is a placeholder for keyword arguments in a condition.",
-            str(type_error),
+            str(context.exception),
         )
 
 
@@ -5,8 +5,11 @@
 # pylint: disable=unused-argument
 
 import functools
+import inspect
+import subprocess
+import sys
 import unittest
-from typing import Optional
+from typing import Callable
 
 import icontract._checkers
 from icontract._globals import CallableT
@@ -63,20 +66,55 @@ class TestUnwindDecoratorStack(unittest.TestCase):
 
 
 class TestResolveKwargs(unittest.TestCase):
+    def test_that_defaults_are_not_modified(self) -> None:
+        kwdefaults = {"y": 5, "z": 6}
+
+        resolved_kwargs = icontract._checkers.kwargs_from_call(
+            param_names=["x", "y", "z"], kwdefaults=kwdefaults, args=(1, 2), kwargs={}
+        )
+
+        self.assertDictEqual(
+            {"_ARGS": (1, 2), "_KWARGS": {}, "x": 1, "y": 2, "z": 6},
+            dict(resolved_kwargs),
+        )
+        self.assertDictEqual({"y": 5, "z": 6}, kwdefaults)
+
+    def test_defaults_of_plain_function_match_signature(self) -> None:
+        # pylint: disable=keyword-arg-before-vararg
+        def some_func(a, b=1, c=2, *args, d, e=3, **kwargs):  # type: ignore
+            pass
+
+        self.assertDictEqual(
+            icontract._checkers.resolve_kwdefaults(inspect.signature(some_func)),
+            icontract._checkers._resolve_kwdefaults_of_plain_function(some_func),
+        )
+
+    def test_functions_sharing_code_with_different_defaults(self) -> None:
+        def make_func(y_default: int) -> Callable[..., int]:
+            @icontract.require(lambda x, y: x < y)
+            def some_func(x: int, y: int = y_default) -> int:
+                return x + y
+
+            return some_func
+
+        some_func = make_func(y_default=5)
+        another_func = make_func(y_default=1)
+
+        self.assertEqual(7, some_func(2))
+
+        with self.assertRaises(icontract.ViolationError):
+            another_func(2)
+
     def test_that_extra_args_raise_correct_type_error(self) -> None:
         @icontract.require(lambda: True)
         def some_func(x: int, y: int) -> None:
             pass
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             some_func(1, 2, 3)  # type: ignore
-        except TypeError as error:
-            type_error = error
 
-        assert type_error is not None
         self.assertRegex(
-            str(type_error),
+            str(context.exception),
             r"^([a-zA-Z_0-9<>.]+\.)?some_func\(\) takes 2 positional arguments but 3 were given$",
         )
 
@@ -85,18 +123,12 @@ class TestResolveKwargs(unittest.TestCase):
         def some_func(*args, **kwargs) -> int:  # type: ignore
             return -1
 
-        type_error = None  # type: Optional[TypeError]
-
-        try:
+        with self.assertRaises(TypeError) as context:
             some_func(result=-1)
-        except TypeError as error:
-            type_error = error
-
-        assert type_error is not None
 
         self.assertEqual(
             "Unexpected argument 'result' in a function decorated with postconditions.",
-            str(type_error),
+            str(context.exception),
         )
 
     def test_that_OLD_in_kwargs_raises_an_error(self) -> None:
@@ -104,20 +136,83 @@ class TestResolveKwargs(unittest.TestCase):
         def some_func(*args, **kwargs) -> int:  # type: ignore
             return -1
 
-        type_error = None  # type: Optional[TypeError]
-
-        try:
+        with self.assertRaises(TypeError) as context:
             some_func(OLD=-1)
-        except TypeError as error:
-            type_error = error
-
-        assert type_error is not None
 
         self.assertEqual(
             "Unexpected argument 'OLD' in a function decorated with postconditions.",
-            str(type_error),
+            str(context.exception),
         )
 
 
+class TestUpdateWrapper(unittest.TestCase):
+    def test_plain_function_matches_functools(self) -> None:
+        def some_func(x: int) -> int:
+            """Do something."""
+            return x
+
+        setattr(some_func, "some_attribute", 1984)
+
+        def wrapper(*args, **kwargs):  # type: ignore
+            return some_func(*args, **kwargs)
+
+        def another_wrapper(*args, **kwargs):  # type: ignore
+            return some_func(*args, **kwargs)
+
+        icontract._checkers._update_wrapper_of_plain_function(
+            wrapper=wrapper, func=some_func
+        )
+        functools.update_wrapper(wrapper=another_wrapper, wrapped=some_func)
+
+        for name in functools.WRAPPER_ASSIGNMENTS:
+            self.assertEqual(getattr(another_wrapper, name), getattr(wrapper, name))
+
+        self.assertDictEqual(another_wrapper.__dict__, wrapper.__dict__)
+
+
+class TestImport(unittest.TestCase):
+    def test_representation_not_imported_before_a_violation(self) -> None:
+        code = (
+            "import sys\n"
+            "import icontract\n"
+            "assert 'icontract._represent' not in sys.modules\n"
+            "assert 'asttokens' not in sys.modules\n"
+        )
+
+        with subprocess.Popen(
+            [sys.executable, "-c", code],
+            universal_newlines=True,
+            stderr=subprocess.PIPE,
+        ) as proc:
+            _, err = proc.communicate()
+
+            self.assertEqual(0, proc.returncode, err)
+
+    def test_representation_not_imported_on_a_violation_with_error_function(
+        self,
+    ) -> None:
+        code = (
+            "import sys\n"
+            "import icontract\n"
+            "@icontract.require(lambda x: x > 0, error=lambda x: ValueError(str(x)))\n"
+            "def some_func(x: int) -> None:\n"
+            "    pass\n"
+            "try:\n"
+            "    some_func(-1)\n"
+            "except ValueError:\n"
+            "    pass\n"
+            "assert 'icontract._represent' not in sys.modules\n"
+        )
+
+        with subprocess.Popen(
+            [sys.executable, "-c", code],
+            universal_newlines=True,
+            stderr=subprocess.PIPE,
+        ) as proc:
+            _, err = proc.communicate()
+
+            self.assertEqual(0, proc.returncode, err)
+
+
 if __name__ == "__main__":
     unittest.main()
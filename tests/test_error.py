@@ -4,7 +4,6 @@
 # pylint: disable=unused-variable
 
 import unittest
-from typing import Optional
 
 import icontract
 
@@ -17,15 +16,11 @@ class TestNoneSpecified(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        assert violation_error is not None
         self.assertEqual(
-            "x > 0: x was -1", tests.error.wo_mandatory_location(str(violation_error))
+            "x > 0: x was -1", tests.error.wo_mandatory_location(str(context.exception))
         )
 
 
@@ -38,14 +33,10 @@ class TestSpecifiedAsFunction(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=-1)
-        except ValueError as err:
-            value_error = err
 
-        assert value_error is not None
-        self.assertEqual("x must be positive: -1", str(value_error))
+        self.assertEqual("x must be positive: -1", str(context.exception))
 
     def test_separate_function(self) -> None:
         def error_func(x: int) -> ValueError:
@@ -55,14 +46,10 @@ class TestSpecifiedAsFunction(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=-1)
-        except ValueError as err:
-            value_error = err
 
-        assert value_error is not None
-        self.assertEqual("x must be positive: -1", str(value_error))
+        self.assertEqual("x must be positive: -1", str(context.exception))
 
     def test_separate_method(self) -> None:
         class Errorer:
@@ -75,29 +62,36 @@ class TestSpecifiedAsFunction(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=-1)
-        except ValueError as err:
-            value_error = err
 
-        assert value_error is not None
-        self.assertEqual("x must be positive: -1", str(value_error))
+        self.assertEqual("x must be positive: -1", str(context.exception))
+
+    def test_condition_source_not_inspected(self) -> None:
+        # The condition has no source file so that any inspection of its source code would fail.
+        condition = eval("lambda x: x > 0")  # pylint: disable=eval-used
+
+        @icontract.require(
+            condition, error=lambda x: ValueError("x must be positive: {}".format(x))
+        )
+        def some_func(x: int) -> None:
+            pass
+
+        with self.assertRaises(ValueError) as context:
+            some_func(x=-1)
+
+        self.assertEqual("x must be positive: -1", str(context.exception))
 
     def test_report_if_result_is_not_base_exception(self) -> None:
         @icontract.require(lambda x: x > 0, error=lambda x: "x must be positive")  # type: ignore
         def some_func(x: int) -> None:
             pass
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             some_func(x=-1)
-        except TypeError as err:
-            type_error = err
 
-        assert type_error is not None
         self.assertRegex(
-            str(type_error),
+            str(context.exception),
             r"^The exception returned by the contract's error <function .*> does not inherit from BaseException\.$",
         )
 
@@ -108,15 +102,11 @@ class TestSpecifiedAsType(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=-1)
-        except ValueError as err:
-            value_error = err
 
-        assert value_error is not None
         self.assertEqual(
-            "x > 0: x was -1", tests.error.wo_mandatory_location(str(value_error))
+            "x > 0: x was -1", tests.error.wo_mandatory_location(str(context.exception))
         )
 
 
@@ -126,38 +116,26 @@ class TestSpecifiedAsInstance(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=-1)
-        except ValueError as err:
-            value_error = err
 
-        assert value_error is not None
-        self.assertEqual("negative x", str(value_error))
+        self.assertEqual("negative x", str(context.exception))
 
     def test_repeated_raising(self) -> None:
         @icontract.require(lambda x: x > 0, error=ValueError("negative x"))
         def some_func(x: int) -> None:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=-1)
-        except ValueError as err:
-            value_error = err
 
-        assert value_error is not None
-        self.assertEqual("negative x", str(value_error))
+        self.assertEqual("negative x", str(context.exception))
 
         # Repeat
-        value_error = None
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=-1)
-        except ValueError as err:
-            value_error = err
 
-        assert value_error is not None
-        self.assertEqual("negative x", str(value_error))
+        self.assertEqual("negative x", str(context.exception))
 
 
 class TestSpecifiedAsInvalidType(unittest.TestCase):
@@ -165,19 +143,14 @@ class TestSpecifiedAsInvalidType(unittest.TestCase):
         class A:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
 
             @icontract.require(lambda x: x > 0, error=A)  # type: ignore
             def some_func(x: int) -> None:
                 pass
 
-        except ValueError as err:
-            value_error = err
-
-        assert value_error is not None
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"The error of the contract is given as a type, "
             r"but the type does not inherit from BaseException: <class .*\.A'>",
         )
@@ -186,26 +159,20 @@ class TestSpecifiedAsInvalidType(unittest.TestCase):
         class A:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
 
             @icontract.ensure(lambda result: result > 0, error=A)  # type: ignore
             def some_func() -> int:
                 return -1
 
-        except ValueError as err:
-            value_error = err
-
-        assert value_error is not None
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"The error of the contract is given as a type, "
             r"but the type does not inherit from BaseException: <class .*\.A'>",
         )
 
     def test_in_invariant(self) -> None:
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
 
             class A:
                 pass
@@ -215,12 +182,8 @@ class TestSpecifiedAsInvalidType(unittest.TestCase):
                 def __init__(self) -> None:
                     self.x = -1
 
-        except ValueError as err:
-            value_error = err
-
-        assert value_error is not None
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"The error of the contract is given as a type, "
             r"but the type does not inherit from BaseException: <class .*\.A'>",
         )
@@ -232,19 +195,14 @@ class TestSpecifiedAsInstanceOfInvalidType(unittest.TestCase):
             def __init__(self, msg: str) -> None:
                 self.msg = msg
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
 
             @icontract.require(lambda x: x > 0, error=A("something went wrong"))  # type: ignore
             def some_func(x: int) -> None:
                 pass
 
-        except ValueError as err:
-            value_error = err
-
-        assert value_error is not None
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"^The error of the contract must be either a callable \(a function or a method\), "
             r"a class \(subclass of BaseException\) or an instance of BaseException, "
             r"but got: <.*\.A object at 0x.*>$",
@@ -255,19 +213,14 @@ class TestSpecifiedAsInstanceOfInvalidType(unittest.TestCase):
             def __init__(self, msg: str) -> None:
                 self.msg = msg
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
 
             @icontract.ensure(lambda result: result > 0, error=A("something went wrong"))  # type: ignore
             def some_func() -> int:
                 return -1
 
-        except ValueError as err:
-            value_error = err
-
-        assert value_error is not None
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"^The error of the contract must be either a callable \(a function or a method\), "
             r"a class \(subclass of BaseException\) or an instance of BaseException, "
             r"but got: <.*\.A object at 0x.*>$",
@@ -278,20 +231,15 @@ class TestSpecifiedAsInstanceOfInvalidType(unittest.TestCase):
             def __init__(self, msg: str) -> None:
                 self.msg = msg
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
 
             @icontract.invariant(lambda self: self.x > 0, error=A("something went wrong"))  # type: ignore
             class B:
                 def __init__(self) -> None:
                     self.x = -1
 
-        except ValueError as err:
-            value_error = err
-
-        assert value_error is not None
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"^The error of the contract must be either a callable \(a function or a method\), "
             r"a class \(subclass of BaseException\) or an instance of BaseException, "
             r"but got: <.*\.A object at 0x.*>$",
@@ -5,7 +5,7 @@
 
 import ast
 import unittest
-from typing import List, MutableMapping, Any, Optional
+from typing import List, MutableMapping, Any
 
 import icontract._checkers
 import icontract._represent
@@ -105,15 +105,10 @@ class TestPreconditions(unittest.TestCase):
             ),
         )
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             wrapped(x=-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        assert violation_error is not None
-
-        self.assertEqual("x must be positive, but got: -1", str(violation_error))
+        self.assertEqual("x must be positive, but got: -1", str(context.exception))
 
 
 class TestPostconditions(unittest.TestCase):
@@ -200,16 +195,65 @@ class TestPostconditions(unittest.TestCase):
             ),
         )
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             lst = [1, 2, 3]
             wrapped(lst=lst)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        assert violation_error is not None
+        self.assertEqual("The size of lst must not change.", str(context.exception))
+
+    def test_adding_after_a_call(self) -> None:
+        def some_func(lst: List[int]) -> None:
+            # This will break the post-condition, see below.
+            lst.append(1984)
+
+        wrapped = checker = icontract._checkers.decorate_with_checker(func=some_func)
+
+        # Call the wrapper so that the postconditions and snapshots are pre-bound
+        # before we add any further contracts.
+        wrapped(lst=[1, 2, 3])
+
+        icontract._checkers.add_postcondition_to_checker(
+            checker=checker,
+            contract=icontract._types.Contract(
+                condition=lambda OLD, lst: OLD.len_lst == len(lst),
+                error=icontract.ViolationError("The size of lst must not change."),
+            ),
+        )
+
+        icontract._checkers.add_snapshot_to_checker(
+            checker=checker,
+            snapshot=icontract._types.Snapshot(
+                capture=lambda lst: len(lst), name="len_lst"
+            ),
+        )
+
+        with self.assertRaises(icontract.ViolationError) as context:
+            wrapped(lst=[1, 2, 3])
+
+        self.assertEqual("The size of lst must not change.", str(context.exception))
+
+    def test_replacing_in_place_after_a_call(self) -> None:
+        @icontract.ensure(lambda result: result > 0)
+        def some_func(x: int) -> int:
+            return x
+
+        # Call the function so that the postconditions are pre-bound before we replace them.
+        some_func(1)
+
+        checker = icontract._checkers.find_checker(func=some_func)
+        assert checker is not None
+
+        postconditions = getattr(checker, "__postconditions__")
+        postconditions[0] = icontract._types.Contract(
+            condition=lambda result: result > 100,
+            error=icontract.ViolationError("The result must be larger than 100."),
+        )
+        icontract._checkers.reset_pre_bound_contracts(checker=checker)
+
+        with self.assertRaises(icontract.ViolationError) as context:
+            some_func(1)
 
-        self.assertEqual("The size of lst must not change.", str(violation_error))
+        self.assertEqual("The result must be larger than 100.", str(context.exception))
 
 
 class TestInvariants(unittest.TestCase):
@@ -1,8 +1,14 @@
 # pylint: disable=missing-docstring
 
+import os
+import subprocess
+import sys
+import textwrap
 import unittest
+import unittest.mock
 
 import icontract
+import icontract._globals
 
 
 class TestSlow(unittest.TestCase):
@@ -13,6 +19,49 @@ class TestSlow(unittest.TestCase):
             "before running this test.",
         )
 
+    def test_slow_evaluated_only_at_import(self) -> None:
+        slow = icontract.SLOW
+        self.assertIsInstance(slow, bool)
+
+        with unittest.mock.patch.dict(
+            os.environ, {"ICONTRACT_SLOW": "" if slow else "true"}
+        ):
+            self.assertEqual(slow, icontract.SLOW)
+
+
+class TestDisable(unittest.TestCase):
+    def test_enabled_by_default(self) -> None:
+        self.assertEqual(
+            __debug__ and os.environ.get("ICONTRACT_DISABLE", "") == "",
+            icontract._globals.ENABLED,
+        )
+
+    def test_disable_by_environment_variable(self) -> None:
+        code = textwrap.dedent(
+            """\
+            import icontract
+
+            def some_func(x: int) -> int:
+                return x
+
+            assert icontract.require(lambda x: x > 0)(some_func) is some_func
+            assert icontract.require(lambda x: x > 0, enabled=True)(some_func) is not some_func
+            """
+        )
+
+        env = os.environ.copy()
+        env["ICONTRACT_DISABLE"] = "true"
+
+        with subprocess.Popen(
+            [sys.executable, "-c", code],
+            env=env,
+            universal_newlines=True,
+            stderr=subprocess.PIPE,
+        ) as proc:
+            _, err = proc.communicate()
+
+            self.assertEqual(0, proc.returncode, err)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,6 @@
 import abc
 import textwrap
 import unittest
-from typing import Optional  # pylint: disable=unused-import
 
 import icontract
 import tests.error
@@ -51,6 +50,126 @@ class TestOK(unittest.TestCase):
             "Invariant is expected to run before and after the method call.",
         )
 
+    def test_count_checks_in_diamond_inheritance(self) -> None:
+        class Increment:
+            count = 0
+
+            def __call__(self) -> bool:
+                Increment.count += 1
+                return True
+
+        inc = Increment()
+
+        @icontract.invariant(lambda self: inc())
+        class A(icontract.DBC):
+            def some_func(self) -> int:
+                return 1
+
+        class B(A):
+            pass
+
+        class C(A):
+            pass
+
+        class D(B, C):
+            def some_func(self) -> int:
+                return 2
+
+        inst = D()
+        self.assertEqual(
+            1,
+            Increment.count,
+            "Invariant of the common base is expected to run only once at the initializer.",
+        )
+
+        inst.some_func()
+        self.assertEqual(
+            3,
+            Increment.count,
+            "Invariant of the common base is expected to run only once before and after the method call.",
+        )
+
+    def test_count_checks_in_chained_inits(self) -> None:
+        class Increment:
+            count = 0
+
+            def __call__(self) -> bool:
+                Increment.count += 1
+                return True
+
+        inc = Increment()
+
+        @icontract.invariant(lambda self: inc())
+        class A(icontract.DBC):
+            def __init__(self) -> None:
+                pass
+
+        class B(A):
+            def __init__(self) -> None:
+                super().__init__()
+                self.y = 1
+
+        class C(B):
+            def __init__(self) -> None:
+                super().__init__()
+                self.z = 2
+
+        _ = C()
+        self.assertEqual(
+            1,
+            Increment.count,
+            "Invariant is expected to run only once after the outer-most initializer.",
+        )
+
+    def test_no_checks_in_init_after_super_init(self) -> None:
+        @icontract.invariant(lambda self: self.x > 0)
+        class A(icontract.DBC):
+            def __init__(self) -> None:
+                self.x = 1
+
+            def some_func(self) -> None:
+                pass
+
+        class B(A):
+            def __init__(self) -> None:
+                super().__init__()
+                self.x = -1
+
+                # The instance is still under construction, so the invariant must not be checked.
+                self.some_func()
+
+                self.x = 2
+
+        b = B()
+        self.assertEqual(2, b.x)
+
+    def test_inherited_methods_are_not_wrapped_again(self) -> None:
+        @icontract.invariant(lambda self: self.x > 0)
+        class A(icontract.DBC):
+            def __init__(self) -> None:
+                self.x = 1
+
+            def some_func(self) -> int:
+                return self.x
+
+            @property
+            def some_prop(self) -> int:
+                return self.x
+
+        class B(A):
+            pass
+
+        self.assertNotIn("some_func", B.__dict__)
+        self.assertNotIn("some_prop", B.__dict__)
+
+        b = B()
+        self.assertEqual(1, b.some_func())
+        self.assertEqual(1, b.some_prop)
+
+        b.x = -1
+        with self.assertRaises(icontract.ViolationError):
+            b.some_func()
+
     def test_level_1_inheritance_of_invariants_does_not_leak_to_parents(self) -> None:
         # NOTE (mristin):
         # This is a regression test for:
@@ -181,13 +300,9 @@ class TestViolation(unittest.TestCase):
                 return "instance of B"
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -195,7 +310,7 @@ class TestViolation(unittest.TestCase):
                 self was instance of B
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inherited_violated_in_child(self) -> None:
@@ -218,13 +333,9 @@ class TestViolation(unittest.TestCase):
                 return "instance of B"
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -232,7 +343,7 @@ class TestViolation(unittest.TestCase):
                 self was instance of B
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_additional_invariant_violated_in_childs_init(self) -> None:
@@ -249,13 +360,9 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of B"
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = B()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -263,7 +370,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of B
                 self.x was 10"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_method_violates_in_child(self) -> None:
@@ -284,13 +391,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of B"
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.some_method()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -298,7 +401,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of B
                 self.x was 10"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_triple_inheritance(self) -> None:
@@ -322,13 +425,9 @@ class TestViolation(unittest.TestCase):
                 return "instance of C"
 
         c = C()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             c.func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -336,7 +435,7 @@ class TestViolation(unittest.TestCase):
                 self was instance of C
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_abstract_method(self) -> None:
@@ -360,13 +459,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of B"
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -374,7 +469,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of B
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -396,13 +491,9 @@ class TestProperty(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -410,7 +501,7 @@ class TestProperty(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inherited_setter(self) -> None:
@@ -433,13 +524,9 @@ class TestProperty(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_inst.some_prop = 0
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -447,7 +534,7 @@ class TestProperty(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inherited_deleter(self) -> None:
@@ -470,13 +557,9 @@ class TestProperty(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             del some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -484,7 +567,7 @@ class TestProperty(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inherited_invariant_on_getter(self) -> None:
@@ -504,13 +587,9 @@ class TestProperty(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -518,7 +597,7 @@ class TestProperty(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inherited_invariant_on_setter(self) -> None:
@@ -541,13 +620,9 @@ class TestProperty(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_inst.some_prop = 0
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -555,7 +630,7 @@ class TestProperty(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inherited_invariant_on_deleter(self) -> None:
@@ -578,13 +653,9 @@ class TestProperty(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             del some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -592,7 +663,7 @@ class TestProperty(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -5,7 +5,6 @@ import abc
 import sys
 import textwrap
 import unittest
-from typing import Optional  # pylint: disable=unused-import
 
 import icontract
 import tests.error
@@ -75,8 +74,8 @@ class TestOK(unittest.TestCase):
 
         _ = str(inst)
         self.assertEqual(
-            3, Increment.count
-        )  # Invariant needs to be checked before and after __str__.
+            1, Increment.count
+        )  # Invariant needs not to be checked around __str__ inherited from object.
 
 
 class TestViolation(unittest.TestCase):
@@ -91,13 +90,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of {}".format(self.__class__.__name__)
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -105,7 +100,7 @@ class TestViolation(unittest.TestCase):
                 result was 1000
                 self was an instance of B"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inherited_with_modified_implementation(self) -> None:
@@ -122,13 +117,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of {}".format(self.__class__.__name__)
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -136,7 +127,7 @@ class TestViolation(unittest.TestCase):
                 result was 10000
                 self was an instance of B"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_ensure_then_violated_in_base(self) -> None:
@@ -155,13 +146,9 @@ class TestViolation(unittest.TestCase):
 
         b = B()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -169,7 +156,7 @@ class TestViolation(unittest.TestCase):
                 result was 3
                 self was an instance of B"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_ensure_then_violated_in_child(self) -> None:
@@ -188,13 +175,9 @@ class TestViolation(unittest.TestCase):
 
         b = B()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -202,7 +185,7 @@ class TestViolation(unittest.TestCase):
                 result was 2
                 self was an instance of B"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_abstract_method(self) -> None:
@@ -223,13 +206,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of {}".format(self.__class__.__name__)
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -237,7 +216,7 @@ class TestViolation(unittest.TestCase):
                 result was 1000
                 self was an instance of B"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_that_base_postconditions_apply_to_init_if_not_defined(self) -> None:
@@ -253,13 +232,9 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = B(x=-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -269,7 +244,7 @@ class TestViolation(unittest.TestCase):
                 self.x was -1
                 x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_that_base_postconditions_dont_apply_to_init_if_overridden(self) -> None:
@@ -290,13 +265,9 @@ class TestViolation(unittest.TestCase):
         # postconditions of B need to be satisfied, but not from A
         _ = B(x=-100)
 
-        violation_error = None  # Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = B(x=0)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -306,7 +277,7 @@ class TestViolation(unittest.TestCase):
                 self.x was 0
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -364,13 +335,9 @@ class TestPropertyViolation(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -379,7 +346,7 @@ class TestPropertyViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_setter(self) -> None:
@@ -406,13 +373,9 @@ class TestPropertyViolation(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_inst.some_prop = 0
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -422,7 +385,7 @@ class TestPropertyViolation(unittest.TestCase):
                 self.toggled was True
                 value was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_deleter(self) -> None:
@@ -449,13 +412,9 @@ class TestPropertyViolation(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             del some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -464,7 +423,7 @@ class TestPropertyViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_setter_strengthened(self) -> None:
@@ -491,13 +450,9 @@ class TestPropertyViolation(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_inst.some_prop = 0
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -507,7 +462,7 @@ class TestPropertyViolation(unittest.TestCase):
                 self.toggled was True
                 value was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -523,22 +478,18 @@ class TestInvalid(unittest.TestCase):
         class B(A):
             pass
 
-        type_err = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             _ = B()  # type: ignore
-        except TypeError as err:
-            type_err = err
 
-        self.assertIsNotNone(type_err)
         if sys.version_info < (3, 9):
             self.assertEqual(
                 "Can't instantiate abstract class B with abstract methods func",
-                str(type_err),
+                str(context.exception),
             )
         else:
             self.assertEqual(
                 "Can't instantiate abstract class B with abstract method func",
-                str(type_err),
+                str(context.exception),
             )
 
 
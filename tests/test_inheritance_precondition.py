@@ -5,7 +5,7 @@ import abc
 import sys
 import textwrap
 import unittest
-from typing import Optional, Sequence, cast  # pylint: disable=unused-import
+from typing import Sequence, cast  # pylint: disable=unused-import
 
 import icontract
 import tests.error
@@ -59,13 +59,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of {}".format(self.__class__.__name__)
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func(x=1000)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -73,7 +69,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of B
                 x was 1000"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inherited_with_implementation(self) -> None:
@@ -90,13 +86,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of {}".format(self.__class__.__name__)
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func(x=1000)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -104,7 +96,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of B
                 x was 1000"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_require_else(self) -> None:
@@ -123,13 +115,9 @@ class TestViolation(unittest.TestCase):
 
         b = B()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func(x=5)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -137,7 +125,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of B
                 x was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_triple_inheritance_wo_implementation(self) -> None:
@@ -155,13 +143,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of {}".format(self.__class__.__name__)
 
         c = C()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             c.func(x=1000)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -169,7 +153,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of C
                 x was 1000"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_triple_inheritance_with_implementation(self) -> None:
@@ -189,13 +173,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of {}".format(self.__class__.__name__)
 
         c = C()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             c.func(x=1000)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -203,7 +183,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of C
                 x was 1000"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_triple_inheritance_with_require_else(self) -> None:
@@ -227,13 +207,9 @@ class TestViolation(unittest.TestCase):
 
         c = C()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             c.func(x=7)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -241,7 +217,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of C
                 x was 7"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_abstract_method(self) -> None:
@@ -259,13 +235,9 @@ class TestViolation(unittest.TestCase):
                 return "an instance of {}".format(self.__class__.__name__)
 
         b = B()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.func(x=-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -273,7 +245,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of B
                 x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_that_base_preconditions_apply_to_init_if_not_defined(self) -> None:
@@ -286,13 +258,9 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = B(x=-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -300,7 +268,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of B
                 x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_that_base_preconditions_dont_apply_to_init_if_overridden(self) -> None:
@@ -321,13 +289,9 @@ class TestViolation(unittest.TestCase):
         # Preconditions of B need to be satisfied, but not from A
         _ = B(x=-100)
 
-        violation_error = None  # Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = B(x=0)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -335,7 +299,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of B
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -393,13 +357,9 @@ class TestPropertyViolation(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -407,7 +367,7 @@ class TestPropertyViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_setter(self) -> None:
@@ -431,13 +391,9 @@ class TestPropertyViolation(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_inst.some_prop = 0
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -445,7 +401,7 @@ class TestPropertyViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 value was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_deleter(self) -> None:
@@ -472,13 +428,9 @@ class TestPropertyViolation(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             del some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -486,7 +438,7 @@ class TestPropertyViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -509,13 +461,9 @@ class TestConstructor(unittest.TestCase):
 
         _ = B(3)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = B(-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -523,7 +471,7 @@ class TestConstructor(unittest.TestCase):
                 self was an instance of B
                 x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_new_tightens_preconditions(self) -> None:
@@ -544,13 +492,9 @@ class TestConstructor(unittest.TestCase):
 
         _ = B([1, 2, 3])
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = B([-1, -2, -3])
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -559,7 +503,7 @@ class TestConstructor(unittest.TestCase):
                   x = -1
                 xs was [-1, -2, -3]"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -575,22 +519,18 @@ class TestInvalid(unittest.TestCase):
         class B(A):
             pass
 
-        type_err = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             _ = B()  # type: ignore
-        except TypeError as err:
-            type_err = err
 
-        self.assertIsNotNone(type_err)
         if sys.version_info < (3, 9):
             self.assertEqual(
                 "Can't instantiate abstract class B with abstract methods func",
-                str(type_err),
+                str(context.exception),
             )
         else:
             self.assertEqual(
                 "Can't instantiate abstract class B with abstract method func",
-                str(type_err),
+                str(context.exception),
             )
 
     def test_cant_weaken_base_function_without_preconditions(self) -> None:
@@ -599,25 +539,20 @@ class TestInvalid(unittest.TestCase):
             def func(self, x: int) -> int:
                 raise NotImplementedError()
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
 
             class B(A):  # pylint: disable=unused-variable
                 @icontract.require(lambda x: x < 0)
                 def func(self, x: int) -> int:
                     return 1000
 
-        except TypeError as err:
-            type_error = err
-
-        self.assertIsNotNone(type_error)
         self.assertEqual(
             "The function "
             "TestInvalid.test_cant_weaken_base_function_without_preconditions.<locals>.B.func can not "
             "weaken the preconditions because the bases specify no preconditions at all. Hence this function must "
             "accept all possible input since the preconditions are OR'ed and no precondition implies a dummy "
             "precondition which is always fulfilled.",
-            str(type_error),
+            str(context.exception),
         )
 
 
@@ -2,7 +2,7 @@
 # pylint: disable=invalid-name
 import textwrap
 import unittest
-from typing import Optional, List  # pylint: disable=unused-import
+from typing import List  # pylint: disable=unused-import
 
 import icontract
 
@@ -45,13 +45,9 @@ class TestViolation(unittest.TestCase):
 
         b = B()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.some_func(2)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -63,7 +59,7 @@ class TestViolation(unittest.TestCase):
                 self.lst was [2, 1984]
                 val was 2"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_inherited_snapshot(self) -> None:
@@ -87,13 +83,9 @@ class TestViolation(unittest.TestCase):
 
         b = B()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             b.some_func(2)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -106,7 +98,7 @@ class TestViolation(unittest.TestCase):
                 self.lst was [2, 1984]
                 val was 2"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -188,13 +180,9 @@ class TestPropertyViolation(unittest.TestCase):
         some_inst = SomeClass()
 
         # getter fails
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -205,17 +193,13 @@ class TestPropertyViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.gets was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
         # setter fails
-        violation_error = None
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_inst.some_prop = 1
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -227,17 +211,13 @@ class TestPropertyViolation(unittest.TestCase):
                 self.sets was 0
                 value was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
         # deleter fails
-        violation_error = None
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             del some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -248,14 +228,13 @@ class TestPropertyViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.dels was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
 class TestInvalid(unittest.TestCase):
     def test_conflicting_snapshot_names(self) -> None:
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
 
             class A(icontract.DBC):
                 def __init__(self) -> None:
@@ -275,15 +254,11 @@ class TestInvalid(unittest.TestCase):
                     self.lst.append(val)
                     self.lst.append(1984)
 
-        except ValueError as err:
-            value_error = err
-
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "There are conflicting snapshots with the name: 'len_lst'.\n\n"
             "Please mind that the snapshots are inherited from the base classes. "
             "Does one of the base classes defines a snapshot with the same name?",
-            str(value_error),
+            str(context.exception),
         )
 
 
@@ -300,8 +275,7 @@ class TestPropertyInvalid(unittest.TestCase):
                 self.gets += 1
                 return 0
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             # pylint: disable=unused-variable
 
             class SomeClass(SomeBase):
@@ -311,15 +285,11 @@ class TestPropertyInvalid(unittest.TestCase):
                 def some_prop(self) -> int:
                     return 0
 
-        except ValueError as err:
-            value_error = err
-
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "There are conflicting snapshots with the name: 'gets'.\n\n"
             "Please mind that the snapshots are inherited from the base classes. "
             "Does one of the base classes defines a snapshot with the same name?",
-            str(value_error),
+            str(context.exception),
         )
 
     def test_setter_with_conflicting_snapshot_names(self) -> None:
@@ -338,8 +308,7 @@ class TestPropertyInvalid(unittest.TestCase):
                 # pylint: disable=unused-argument
                 self.sets += 1
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             # pylint: disable=unused-variable
 
             class SomeClass(SomeBase):
@@ -354,15 +323,11 @@ class TestPropertyInvalid(unittest.TestCase):
                     # pylint: disable=unused-argument
                     return
 
-        except ValueError as err:
-            value_error = err
-
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "There are conflicting snapshots with the name: 'sets'.\n\n"
             "Please mind that the snapshots are inherited from the base classes. "
             "Does one of the base classes defines a snapshot with the same name?",
-            str(value_error),
+            str(context.exception),
         )
 
     def test_deleter_with_conflicting_snapshot_names(self) -> None:
@@ -380,8 +345,7 @@ class TestPropertyInvalid(unittest.TestCase):
             def some_prop(self) -> None:
                 self.dels += 1
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             # pylint: disable=unused-variable
 
             class SomeClass(SomeBase):
@@ -395,15 +359,11 @@ class TestPropertyInvalid(unittest.TestCase):
                 def some_prop(self) -> None:
                     return
 
-        except ValueError as err:
-            value_error = err
-
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "There are conflicting snapshots with the name: 'dels'.\n\n"
             "Please mind that the snapshots are inherited from the base classes. "
             "Does one of the base classes defines a snapshot with the same name?",
-            str(value_error),
+            str(context.exception),
         )
 
 
@@ -3,12 +3,12 @@
 # pylint: disable=unused-argument
 import textwrap
 import time
+import timeit
 import unittest
 from typing import (
     Dict,
     Iterator,
     Mapping,
-    Optional,
     Any,
     List,
 )  # pylint: disable=unused-import
@@ -288,13 +288,9 @@ class TestViolation(unittest.TestCase):
 
         _ = SomeClass(x=1)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = SomeClass(x=0)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -302,7 +298,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inv_as_precondition(self) -> None:
@@ -317,15 +313,11 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             inst = SomeClass()
             inst.x = -1
             inst.some_method()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -333,7 +325,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_method(self) -> None:
@@ -348,14 +340,10 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             inst = SomeClass()
             inst.some_method()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -363,7 +351,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_magic_method(self) -> None:
@@ -378,14 +366,10 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             inst = SomeClass()
             inst()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -393,7 +377,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_multiple_invs_first_violated(self) -> None:
@@ -406,13 +390,9 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = SomeClass()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -420,7 +400,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_multiple_invs_last_violated(self) -> None:
@@ -433,13 +413,9 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = SomeClass()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -447,7 +423,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.x was 100"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inv_violated_after_pre(self) -> None:
@@ -463,14 +439,10 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             inst = SomeClass()
             inst.some_method(y=-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -478,17 +450,13 @@ class TestViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 y was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
-        violation_error = None
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             inst = SomeClass()
             inst.some_method(y=100)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -496,7 +464,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inv_ok_but_post_violated(self) -> None:
@@ -513,14 +481,10 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             inst = SomeClass()
             inst.some_method()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -528,7 +492,7 @@ class TestViolation(unittest.TestCase):
                 result was -1
                 self was an instance of SomeClass"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inv_violated_but_post_ok(self) -> None:
@@ -545,14 +509,10 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             inst = SomeClass()
             inst.some_method()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -560,7 +520,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of SomeClass
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_inv_with_empty_arguments(self) -> None:
@@ -571,13 +531,9 @@ class TestViolation(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = A()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -585,7 +541,7 @@ class TestViolation(unittest.TestCase):
                 self was an instance of A
                 z was 42"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_condition_as_function(self) -> None:
@@ -607,16 +563,12 @@ class TestViolation(unittest.TestCase):
         a = A()
 
         # Invalid call
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.some_method()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "some_condition: self was A(x=-1)",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_condition_as_function_with_default_argument_value(self) -> None:
@@ -638,16 +590,12 @@ class TestViolation(unittest.TestCase):
         a = A()
 
         # Invalid call
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.some_method()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "some_condition: self was A(x=-1)",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -668,13 +616,9 @@ class TestProperty(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -682,7 +626,7 @@ class TestProperty(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_property_setter(self) -> None:
@@ -704,13 +648,9 @@ class TestProperty(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_inst.some_prop = 0
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -718,7 +658,7 @@ class TestProperty(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_property_deleter(self) -> None:
@@ -740,13 +680,9 @@ class TestProperty(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             del some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -754,7 +690,7 @@ class TestProperty(unittest.TestCase):
                 self was an instance of SomeClass
                 self.toggled was True"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -768,14 +704,10 @@ class TestError(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             _ = A()
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
+        self.assertIsInstance(context.exception, ValueError)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -783,7 +715,7 @@ class TestError(unittest.TestCase):
                 self was an instance of A
                 self.x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(value_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_as_function(self) -> None:
@@ -800,15 +732,11 @@ class TestError(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             _ = A()
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
-        self.assertEqual("x must be positive, but got: 0", str(value_error))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual("x must be positive, but got: 0", str(context.exception))
 
     def test_as_function_with_empty_args(self) -> None:
         @icontract.invariant(
@@ -821,15 +749,11 @@ class TestError(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             _ = A()
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
-        self.assertEqual("x must be positive", str(value_error))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual("x must be positive", str(context.exception))
 
 
 class TestToggling(unittest.TestCase):
@@ -842,6 +766,21 @@ class TestToggling(unittest.TestCase):
         inst = SomeClass()
         self.assertEqual(-1, inst.x)
 
+    def test_disabled_returns_the_class_unchanged(self) -> None:
+        class SomeClass:
+            def __init__(self) -> None:
+                self.x = -1
+
+        init = SomeClass.__init__
+
+        decorated = icontract.invariant(lambda self: self.x > 0, enabled=False)(
+            SomeClass
+        )
+
+        self.assertIs(SomeClass, decorated)
+        self.assertIs(init, SomeClass.__init__)
+        self.assertFalse(hasattr(SomeClass, "__invariants__"))
+
 
 class TestBenchmark(unittest.TestCase):
     @unittest.skip(
@@ -861,34 +800,27 @@ class TestBenchmark(unittest.TestCase):
             def __init__(self) -> None:
                 self.x = 100
 
-        start = time.time()
-        _ = SomeClass()
-        duration_with_inv = time.time() - start
+        number, duration = timeit.Timer(SomeClass).autorange()
+        duration_with_inv = duration / number
 
-        start = time.time()
-        _ = AnotherClass()
-        duration_wo_inv = time.time() - start
+        number, duration = timeit.Timer(AnotherClass).autorange()
+        duration_wo_inv = duration / number
 
         self.assertLess(duration_with_inv / duration_wo_inv, 1.2)
 
 
 class TestInvalid(unittest.TestCase):
     def test_with_invalid_arguments(self) -> None:
-        val_err = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
 
             @icontract.invariant(lambda self, z: self.x > z)
             class _:
                 def __init__(self) -> None:
                     self.x = 100
 
-        except ValueError as err:
-            val_err = err
-
-        self.assertIsNotNone(val_err)
         self.assertEqual(
             "Expected an invariant condition with at most an argument 'self', but got: ['self', 'z']",
-            str(val_err),
+            str(context.exception),
         )
 
     def test_no_boolyness(self) -> None:
@@ -897,16 +829,12 @@ class TestInvalid(unittest.TestCase):
             def __init__(self) -> None:
                 pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             _ = A()
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "Failed to negate the evaluation of the condition.",
-            tests.error.wo_mandatory_location(str(value_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     # noinspection PyUnusedLocal
@@ -937,16 +865,12 @@ class TestInvalid(unittest.TestCase):
         # This causes a ``ViolationError``, as invariants are copied by reference if
         # the ``Base`` does not inherit from ``icontract.DBC`` or uses
         # ``icontract.DBCMeta`` as the metaclass.
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = Base()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent("""False: self was an instance of Base"""),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -961,13 +885,9 @@ class TestCheckOn(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = A()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -975,7 +895,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_invariant_checked_in_init_if_call_flag_set(self) -> None:
@@ -989,13 +909,9 @@ class TestCheckOn(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = A()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1003,7 +919,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_invariant_checked_in_init_if_setattr_flag_set(self) -> None:
@@ -1019,13 +935,9 @@ class TestCheckOn(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = A(-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1033,7 +945,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_invariant_checked_in_init_if_all_flag_set(self) -> None:
@@ -1047,13 +959,9 @@ class TestCheckOn(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = A()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1061,7 +969,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_setattr_not_affected_when_flag_not_set(self) -> None:
@@ -1110,13 +1018,9 @@ class TestCheckOn(unittest.TestCase):
 
         a = A()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.x = -1
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1124,7 +1028,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_call_and_setattr_affected_when_flags_set(self) -> None:
@@ -1147,13 +1051,9 @@ class TestCheckOn(unittest.TestCase):
 
         that = A()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             that.x = -1
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1161,18 +1061,14 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
         other = A()
 
-        another_violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as another_context:
             other.do_something_bad()
-        except icontract.ViolationError as err:
-            another_violation_error = err
 
-        self.assertIsNotNone(another_violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1180,7 +1076,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(another_violation_error)),
+            tests.error.wo_mandatory_location(str(another_context.exception)),
         )
 
     def test_setattr_with_property(self) -> None:
@@ -1204,13 +1100,9 @@ class TestCheckOn(unittest.TestCase):
 
         a = A()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.x = -1
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1218,7 +1110,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_that_setattr_does_not_trigger_on_a_collection(self) -> None:
@@ -1268,15 +1160,11 @@ class TestCheckOn(unittest.TestCase):
         # changed, so no SETATTR event will be triggered.
         a.lst.append(1)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             # NOTE (mristin):
             # The violation must occur here as we check it *before* and *after* every method.
             a.do_something()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1286,7 +1174,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.lst was [-1, 1]"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_invariant_checked_on_setattr_if_all_flag_set(self) -> None:
@@ -1305,13 +1193,9 @@ class TestCheckOn(unittest.TestCase):
 
         a = A()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.do_something_wrong()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1319,7 +1203,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_invariant_checked_on_setattr_if_setattr_flag_set(self) -> None:
@@ -1335,13 +1219,9 @@ class TestCheckOn(unittest.TestCase):
 
         a = A()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.x = -1
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1349,7 +1229,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -7,7 +7,7 @@ import abc
 import functools
 import textwrap
 import unittest
-from typing import Optional, List, Type  # pylint: disable=unused-import
+from typing import List, Type  # pylint: disable=unused-import
 
 import icontract
 from icontract._globals import CallableT
@@ -31,13 +31,9 @@ class TestViolation(unittest.TestCase):
         def some_func(x: int, y: int = 5) -> int:
             return x - y
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -46,7 +42,7 @@ class TestViolation(unittest.TestCase):
                 x was 1
                 y was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_condition_as_function(self) -> None:
@@ -61,13 +57,9 @@ class TestViolation(unittest.TestCase):
         some_func(x=4)
 
         # Invalid call
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -75,7 +67,7 @@ class TestViolation(unittest.TestCase):
                 result was 1
                 x was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_condition_as_function_with_default_argument_value(self) -> None:
@@ -90,13 +82,9 @@ class TestViolation(unittest.TestCase):
         some_func(x=1)
 
         # Invalid call
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -104,7 +92,7 @@ class TestViolation(unittest.TestCase):
                 result was -1
                 x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_condition_as_function_with_default_argument_value_set(self) -> None:
@@ -119,13 +107,9 @@ class TestViolation(unittest.TestCase):
         some_func(x=-1, y=-2)
 
         # Invalid call
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=1, y=3)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -134,7 +118,7 @@ class TestViolation(unittest.TestCase):
                 x was 1
                 y was 3"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_description(self) -> None:
@@ -142,13 +126,9 @@ class TestViolation(unittest.TestCase):
         def some_func(x: int, y: int = 5) -> int:
             return x - y
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -157,7 +137,7 @@ class TestViolation(unittest.TestCase):
                 x was 1
                 y was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_stacked_decorators(self) -> None:
@@ -179,13 +159,9 @@ class TestViolation(unittest.TestCase):
         def some_func(x: int, y: int) -> int:
             return 100
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=0, y=10)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -195,7 +171,7 @@ class TestViolation(unittest.TestCase):
                 x was 0
                 y was 10"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_default_values_outer(self) -> None:
@@ -205,13 +181,9 @@ class TestViolation(unittest.TestCase):
             return a
 
         # Check first the outer post condition
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(a=13)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -221,17 +193,13 @@ class TestViolation(unittest.TestCase):
                 c was 2
                 result was 13"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
         # Check the inner post condition
-        violation_error = None
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(a=36)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -241,7 +209,7 @@ class TestViolation(unittest.TestCase):
                 c was 2
                 result was 36"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_only_result(self) -> None:
@@ -249,13 +217,9 @@ class TestViolation(unittest.TestCase):
         def some_func(x: int) -> int:
             return 0
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=10 * 1000)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -263,7 +227,7 @@ class TestViolation(unittest.TestCase):
                 result was 0
                 x was 10000"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -273,14 +237,10 @@ class TestError(unittest.TestCase):
         def some_func(x: int) -> int:
             return x
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=0)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
+        self.assertIsInstance(context.exception, ValueError)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -288,7 +248,7 @@ class TestError(unittest.TestCase):
                 result was 0
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(value_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_as_function(self) -> None:
@@ -299,15 +259,11 @@ class TestError(unittest.TestCase):
         def some_func(x: int) -> int:
             return x
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=0)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
-        self.assertEqual("result must be positive.", str(value_error))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual("result must be positive.", str(context.exception))
 
     def test_with_empty_args(self) -> None:
         @icontract.ensure(
@@ -317,15 +273,11 @@ class TestError(unittest.TestCase):
         def some_func(x: int) -> int:
             return x
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=0)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
-        self.assertEqual("result must be positive", str(value_error))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual("result must be positive", str(context.exception))
 
     def test_with_different_args_from_condition(self) -> None:
         @icontract.ensure(
@@ -337,15 +289,11 @@ class TestError(unittest.TestCase):
         def some_func(x: int) -> int:
             return x
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=0)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
-        self.assertEqual("x is 0, result is 0", str(value_error))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual("x is 0, result is 0", str(context.exception))
 
 
 class TestToggling(unittest.TestCase):
@@ -354,14 +302,20 @@ class TestToggling(unittest.TestCase):
         def some_func(x: int) -> int:
             return 123
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
-            result = some_func(x=1234)
-            self.assertEqual(123, result)
-        except icontract.ViolationError as err:
-            violation_error = err
+        result = some_func(x=1234)
+        self.assertEqual(123, result)
 
-        self.assertIsNone(violation_error)
+    def test_disabled_returns_the_function_unchanged(self) -> None:
+        def some_func(x: int) -> int:
+            return 123
+
+        decorated = icontract.snapshot(lambda x: x, enabled=False)(some_func)
+        decorated = icontract.ensure(lambda x, result: x > result, enabled=False)(
+            decorated
+        )
+
+        self.assertIs(some_func, decorated)
+        self.assertIsNone(icontract._checkers.find_checker(func=decorated))
 
 
 class TestInClass(unittest.TestCase):
@@ -375,13 +329,9 @@ class TestInClass(unittest.TestCase):
         result = SomeClass.some_func(x=1)
         self.assertEqual(1, result)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = SomeClass.some_func(x=0)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -389,7 +339,7 @@ class TestInClass(unittest.TestCase):
                 result was 0
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_postcondition_in_class_method(self) -> None:
@@ -402,13 +352,9 @@ class TestInClass(unittest.TestCase):
         result = SomeClass.some_func(x=1)
         self.assertEqual(1, result)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = SomeClass.some_func(x=0)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -416,7 +362,7 @@ class TestInClass(unittest.TestCase):
                 result was 0
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_postcondition_in_abstract_static_method(self) -> None:
@@ -435,13 +381,9 @@ class TestInClass(unittest.TestCase):
         result = SomeClass.some_func(x=1)
         self.assertEqual(1, result)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = SomeClass.some_func(x=0)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -449,7 +391,7 @@ class TestInClass(unittest.TestCase):
                 result was 0
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_postcondition_in_abstract_class_method(self) -> None:
@@ -468,13 +410,9 @@ class TestInClass(unittest.TestCase):
         result = SomeClass.some_func(x=1)
         self.assertEqual(1, result)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = SomeClass.some_func(x=0)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -482,7 +420,7 @@ class TestInClass(unittest.TestCase):
                 result was 0
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_getter(self) -> None:
@@ -500,13 +438,9 @@ class TestInClass(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -514,7 +448,7 @@ class TestInClass(unittest.TestCase):
                 result was -1
                 self was an instance of SomeClass"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_setter(self) -> None:
@@ -533,13 +467,9 @@ class TestInClass(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_inst.some_prop = -1
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -549,7 +479,7 @@ class TestInClass(unittest.TestCase):
                 self.some_prop was 0
                 value was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_deleter(self) -> None:
@@ -571,13 +501,9 @@ class TestInClass(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             del some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -586,7 +512,7 @@ class TestInClass(unittest.TestCase):
                 self was an instance of SomeClass
                 self.some_prop was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
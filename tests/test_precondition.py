@@ -5,10 +5,15 @@
 
 import functools
 import pathlib
+import re
 import textwrap
-import time
+import timeit
+import types
 import unittest
-from typing import Optional  # pylint: disable=unused-import
+from typing import Dict, List  # pylint: disable=unused-import
+
+import numpy
+from numpy.typing import NDArray
 
 import icontract
 from icontract._globals import CallableT
@@ -25,6 +30,63 @@ class TestOK(unittest.TestCase):
         some_func(x=5)
         some_func(x=5, y=10)
 
+    def test_truthy_result_which_is_not_a_boolean(self) -> None:
+        @icontract.require(lambda lst: lst)
+        def some_func(lst: List[int]) -> None:
+            pass
+
+        some_func(lst=[1])
+
+        with self.assertRaises(icontract.ViolationError):
+            some_func(lst=[])
+
+    def test_condition_with_keyword_only_argument(self) -> None:
+        def some_condition(x: int, *, y: int) -> bool:
+            return x < y
+
+        @icontract.require(some_condition)
+        def some_func(x: int, y: int) -> None:
+            pass
+
+        some_func(1, 2)
+
+        with self.assertRaises(icontract.ViolationError):
+            some_func(2, 1)
+
+    def test_conditions_sharing_code_with_different_defaults(self) -> None:
+        def some_condition(x: int, y: int) -> bool:
+            return x > y
+
+        # The two conditions share the code, but only the second one has a default value.
+        other_condition = types.FunctionType(
+            some_condition.__code__, some_condition.__globals__
+        )
+        other_condition.__defaults__ = (0,)
+
+        @icontract.require(some_condition)
+        def some_func(x: int) -> None:
+            pass
+
+        @icontract.require(other_condition)
+        def other_func(x: int) -> None:
+            pass
+
+        with self.assertRaises(TypeError):
+            some_func(x=1)
+
+        other_func(x=1)
+
+        with self.assertRaises(icontract.ViolationError):
+            other_func(x=-1)
+
+    def test_key_error_in_condition_is_not_masked(self) -> None:
+        @icontract.require(lambda x, y: x["some-key"] < y)
+        def some_func(x: Dict[str, int], y: int) -> None:
+            pass
+
+        with self.assertRaises(KeyError):
+            some_func({}, 1)
+
 
 class TestViolation(unittest.TestCase):
     def test_only_with_condition_arg(self) -> None:
@@ -32,13 +94,9 @@ class TestViolation(unittest.TestCase):
         def some_func(x: int, y: int = 5) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -46,7 +104,21 @@ class TestViolation(unittest.TestCase):
                 x was 1
                 y was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
+        )
+
+    def test_location(self) -> None:
+        @icontract.require(lambda x: x > 3)
+        def some_func(x: int) -> None:
+            pass
+
+        with self.assertRaises(icontract.ViolationError) as context:
+            some_func(x=1)
+
+        first_line = str(context.exception).splitlines()[0]
+        self.assertRegex(
+            first_line,
+            r"\AFile {}, line [0-9]+ in test_location:\Z".format(re.escape(__file__)),
         )
 
     def test_with_description(self) -> None:
@@ -54,13 +126,9 @@ class TestViolation(unittest.TestCase):
         def some_func(x: int, y: int = 5) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -68,7 +136,7 @@ class TestViolation(unittest.TestCase):
                 x was 1
                 y was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_condition_as_function(self) -> None:
@@ -79,13 +147,9 @@ class TestViolation(unittest.TestCase):
         def some_func(x: int, y: int = 5) -> str:
             return str(x)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -93,7 +157,7 @@ class TestViolation(unittest.TestCase):
                 x was 1
                 y was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_condition_as_function_with_default_argument_value(self) -> None:
@@ -108,16 +172,12 @@ class TestViolation(unittest.TestCase):
         some_func(x=1)
 
         # Invalid call
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "some_condition: x was -1",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_condition_as_function_with_default_argument_value_set(self) -> None:
@@ -132,13 +192,9 @@ class TestViolation(unittest.TestCase):
         some_func(x=3, y=1)
 
         # Invalid call
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=-1, y=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -146,7 +202,7 @@ class TestViolation(unittest.TestCase):
                 x was -1
                 y was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_pathlib(self) -> None:
@@ -154,16 +210,12 @@ class TestViolation(unittest.TestCase):
         def some_func(path: pathlib.Path) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(path=pathlib.Path("/doesnt/exist/test_contract"))
-        except icontract.ViolationError as err:
-            violation_error = err
 
         # This dummy path is necessary to obtain the class name.
         dummy_path = pathlib.Path("/also/doesnt/exist")
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -171,7 +223,7 @@ class TestViolation(unittest.TestCase):
                 path was {}('/doesnt/exist/test_contract')
                 path.exists() was False"""
             ).format(dummy_path.__class__.__name__),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_multiple_comparators(self) -> None:
@@ -179,16 +231,12 @@ class TestViolation(unittest.TestCase):
         def some_func(x: int) -> str:
             return str(x)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=10)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "0 < x < 3: x was 10",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_stacked_decorators(self) -> None:
@@ -210,13 +258,9 @@ class TestViolation(unittest.TestCase):
         def some_func(x: int) -> str:
             return str(x)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=0)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -224,7 +268,32 @@ class TestViolation(unittest.TestCase):
                 another_var was 0
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
+        )
+
+    def test_with_stacked_decorators_and_constants(self) -> None:
+        def mydecorator(f: CallableT) -> CallableT:
+            @functools.wraps(f)
+            def wrapped(*args, **kwargs):  # type: ignore
+                result = f(*args, **kwargs)
+                return result
+
+            return wrapped  # type: ignore
+
+        @mydecorator
+        @icontract.require(lambda x: x < 100)
+        @icontract.require(lambda x: x > 0)
+        @mydecorator
+        def some_func(x: int) -> str:
+            return str(x)
+
+        with self.assertRaises(icontract.ViolationError) as context:
+            some_func(x=0)
+
+        # The constants are not represented as they carry no information about the violation.
+        self.assertEqual(
+            "x > 0: x was 0",
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_default_values(self) -> None:
@@ -234,13 +303,9 @@ class TestViolation(unittest.TestCase):
         def some_func(a: int, b: int = 21, c: int = 22) -> int:
             return a + b
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(a=2)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -249,16 +314,12 @@ class TestViolation(unittest.TestCase):
                 b was 21
                 c was 22"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
-        violation_error = None
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(a=2, c=8)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -267,7 +328,7 @@ class TestViolation(unittest.TestCase):
                 b was 21
                 c was 8"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -290,18 +351,40 @@ class TestBenchmark(unittest.TestCase):
             assert isinstance(result, int)
             return result
 
-        start = time.time()
-        for i in range(5, 10 * 1000):
-            pow_with_pre(x=i, y=2)
-        duration_with_pre = time.time() - start
+        number, duration = timeit.Timer(lambda: pow_with_pre(x=5, y=2)).autorange()
+        duration_with_pre = duration / number
 
-        start = time.time()
-        for i in range(5, 10 * 1000):
-            pow_wo_pre(x=i, y=2)
-        duration_wo_pre = time.time() - start
+        number, duration = timeit.Timer(lambda: pow_wo_pre(x=5, y=2)).autorange()
+        duration_wo_pre = duration / number
 
         self.assertLess(duration_with_pre / duration_wo_pre, 6)
 
+    @unittest.skip(
+        "Skipped the benchmark, execute manually on a prepared benchmark machine."
+    )
+    def test_enabled_on_arrays(self) -> None:
+        # The contract is checked once per batch instead of once per element
+        # so that the overhead of the checker is amortized over the whole array.
+        @icontract.require(lambda xs: bool((xs > 3).all()))
+        def pow_with_pre(xs: "NDArray[numpy.int64]", y: int) -> "NDArray[numpy.int64]":
+            return numpy.power(xs, y)
+
+        def pow_wo_pre(xs: "NDArray[numpy.int64]", y: int) -> "NDArray[numpy.int64]":
+            if not (xs > 3).all():
+                raise ValueError("precondition")
+
+            return numpy.power(xs, y)
+
+        xs = numpy.arange(5, 1000 * 1000, dtype=numpy.int64)
+
+        number, duration = timeit.Timer(lambda: pow_with_pre(xs=xs, y=2)).autorange()
+        duration_with_pre = duration / number
+
+        number, duration = timeit.Timer(lambda: pow_wo_pre(xs=xs, y=2)).autorange()
+        duration_wo_pre = duration / number
+
+        self.assertLess(duration_with_pre / duration_wo_pre, 1.2)
+
     @unittest.skip(
         "Skipped the benchmark, execute manually on a prepared benchmark machine."
     )
@@ -317,15 +400,11 @@ class TestBenchmark(unittest.TestCase):
             assert isinstance(result, int)
             return result
 
-        start = time.time()
-        for i in range(5, 10 * 1000):
-            pow_with_pre(x=i, y=2)
-        duration_with_pre = time.time() - start
+        number, duration = timeit.Timer(lambda: pow_with_pre(x=5, y=2)).autorange()
+        duration_with_pre = duration / number
 
-        start = time.time()
-        for i in range(5, 10 * 1000):
-            pow_wo_pre(x=i, y=2)
-        duration_wo_pre = time.time() - start
+        number, duration = timeit.Timer(lambda: pow_wo_pre(x=5, y=2)).autorange()
+        duration_wo_pre = duration / number
 
         self.assertLess(duration_with_pre / duration_wo_pre, 1.2)
 
@@ -336,16 +415,12 @@ class TestError(unittest.TestCase):
         def some_func(x: int) -> int:
             return 0
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=0)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
+        self.assertIsInstance(context.exception, ValueError)
         self.assertEqual(
-            "x > 0: x was 0", tests.error.wo_mandatory_location(str(value_error))
+            "x > 0: x was 0", tests.error.wo_mandatory_location(str(context.exception))
         )
 
     def test_as_function(self) -> None:
@@ -355,15 +430,11 @@ class TestError(unittest.TestCase):
         def some_func(x: int) -> int:
             return 0
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=0)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
-        self.assertEqual("x non-negative", str(value_error))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual("x non-negative", str(context.exception))
 
     def test_as_function_with_outer_scope(self) -> None:
         z = 42
@@ -375,15 +446,11 @@ class TestError(unittest.TestCase):
         def some_func(x: int) -> int:
             return 0
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=0)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
-        self.assertEqual("x non-negative, z: 42", str(value_error))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual("x non-negative, z: 42", str(context.exception))
 
     def test_with_empty_args(self) -> None:
         @icontract.require(
@@ -392,15 +459,11 @@ class TestError(unittest.TestCase):
         def some_func(x: int) -> int:
             return 0
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=0)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
-        self.assertEqual("x must be positive", str(value_error))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual("x must be positive", str(context.exception))
 
     def test_with_different_args_from_condition(self) -> None:
         @icontract.require(
@@ -410,15 +473,11 @@ class TestError(unittest.TestCase):
         def some_func(x: int, y: int) -> int:
             return 0
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(x=0, y=10)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertIsInstance(value_error, ValueError)
-        self.assertEqual("x is 0, y is 10", str(value_error))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual("x is 0, y is 10", str(context.exception))
 
 
 class TestToggling(unittest.TestCase):
@@ -427,14 +486,17 @@ class TestToggling(unittest.TestCase):
         def some_func(x: int) -> int:
             return 123
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
-            result = some_func(x=0)
-            self.assertEqual(123, result)
-        except icontract.ViolationError as err:
-            violation_error = err
+        result = some_func(x=0)
+        self.assertEqual(123, result)
+
+    def test_disabled_returns_the_function_unchanged(self) -> None:
+        def some_func(x: int) -> int:
+            return 123
+
+        decorated = icontract.require(lambda x: x > 10, enabled=False)(some_func)
 
-        self.assertIsNone(violation_error)
+        self.assertIs(some_func, decorated)
+        self.assertIsNone(icontract._checkers.find_checker(func=decorated))
 
 
 class TestInClass(unittest.TestCase):
@@ -457,13 +519,9 @@ class TestInClass(unittest.TestCase):
         a = A()
 
         # Test method without self
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.some_method(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -471,17 +529,13 @@ class TestInClass(unittest.TestCase):
                 self was an instance of A
                 x was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
         # Test method with self
-        violation_error = None
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.some_method_with_self()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -489,7 +543,7 @@ class TestInClass(unittest.TestCase):
                 self was an instance of A
                 self.y was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_unbound_instance_method_with_self_as_kwarg(self) -> None:
@@ -508,13 +562,9 @@ class TestInClass(unittest.TestCase):
 
         func = a.some_method_with_self.__func__  # type: ignore
 
-        violation_error = None
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(self=a)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -522,7 +572,7 @@ class TestInClass(unittest.TestCase):
                 self was an instance of A
                 self.y was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_getter(self) -> None:
@@ -540,13 +590,9 @@ class TestInClass(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -554,7 +600,7 @@ class TestInClass(unittest.TestCase):
                 self was an instance of SomeClass
                 self._some_prop was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_setter(self) -> None:
@@ -573,13 +619,9 @@ class TestInClass(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_inst.some_prop = -1
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -587,7 +629,7 @@ class TestInClass(unittest.TestCase):
                 self was an instance of SomeClass
                 value was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_deleter(self) -> None:
@@ -609,13 +651,9 @@ class TestInClass(unittest.TestCase):
 
         some_inst = SomeClass()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             del some_inst.some_prop
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -623,7 +661,7 @@ class TestInClass(unittest.TestCase):
                 self was an instance of SomeClass
                 self.some_prop was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -633,17 +671,13 @@ class TestInvalid(unittest.TestCase):
         def some_function(a: int) -> None:  # pylint: disable=unused-variable
             pass
 
-        type_err = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             some_function(a=13)
-        except TypeError as err:
-            type_err = err
 
-        self.assertIsNotNone(type_err)
         self.assertEqual(
             "The argument(s) of the contract condition have not been set: ['b']. "
             "Does the original function define them? Did you supply them in the call?",
-            tests.error.wo_mandatory_location(str(type_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_error_with_invalid_arguments(self) -> None:
@@ -654,17 +688,13 @@ class TestInvalid(unittest.TestCase):
         def some_func(x: int, y: int) -> int:
             return 0
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             some_func(x=0, y=10)
-        except TypeError as err:
-            type_error = err
 
-        self.assertIsNotNone(type_error)
         self.assertEqual(
             "The argument(s) of the contract error have not been set: ['z']. "
             "Does the original function define them? Did you supply them in the call?",
-            tests.error.wo_mandatory_location(str(type_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_no_boolyness(self) -> None:
@@ -672,16 +702,12 @@ class TestInvalid(unittest.TestCase):
         def some_func() -> None:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func()
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "Failed to negate the evaluation of the condition.",
-            tests.error.wo_mandatory_location(str(value_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_unexpected_positional_argument(self) -> None:
@@ -689,15 +715,11 @@ class TestInvalid(unittest.TestCase):
         def some_func() -> None:
             pass
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             some_func(0)  # type: ignore
-        except TypeError as err:
-            type_error = err
 
-        self.assertIsNotNone(type_error)
         self.assertRegex(
-            str(type_error),
+            str(context.exception),
             r"^([a-zA-Z_0-9<>.]+\.)?some_func\(\) takes 0 positional arguments but 1 was given$",
         )
 
@@ -706,16 +728,12 @@ class TestInvalid(unittest.TestCase):
         def some_func() -> None:
             pass
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             # pylint: disable=unexpected-keyword-arg
             some_func(x=0)  # type: ignore
-        except TypeError as err:
-            type_error = err
 
-        self.assertIsNotNone(type_error)
         self.assertRegex(
-            str(type_error),
+            str(context.exception),
             r"^([a-zA-Z_0-9<>.]+\.)?some_func\(\) got an unexpected keyword argument 'x'$",
         )
 
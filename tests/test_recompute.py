@@ -32,14 +32,14 @@ class TestTranslationForTracingAll(unittest.TestCase):
         generator_exp = call_node.args[0]
         assert isinstance(generator_exp, ast.GeneratorExp)
 
-        # We set only SOME_GLOBAL_CONSTANT in ``name_to_value``. In ``_recompute`` module
-        # all the contract arguments will be set including also all the built-ins and other
-        # global variables.
+        # We set only SOME_GLOBAL_CONSTANT in ``arg_names``. In ``_recompute`` module
+        # all the names used by the generator expression will be set including also the built-ins and
+        # the global variables.
 
         module_node = icontract._recompute._translate_all_expression_to_a_module(
             generator_exp=generator_exp,
             generated_function_name="some_func",
-            name_to_value={"SOME_GLOBAL_CONSTANT": 10},
+            arg_names=("SOME_GLOBAL_CONSTANT",),
         )
 
         got = astor.to_source(module_node)
@@ -68,7 +68,7 @@ class TestTranslationForTracingAll(unittest.TestCase):
             input_source_code=input_source_code
         )
 
-        # Please see ``TestTranslationForTracingAll.translate_all_expression`` and the note about ``name_to_value``
+        # Please see ``TestTranslationForTracingAll.translate_all_expression`` and the note about ``arg_names``
         # if you wonder why ``lst`` is not in the arguments.
         self.assertEqual(
             textwrap.dedent(
@@ -106,7 +106,7 @@ class TestTranslationForTracingAll(unittest.TestCase):
             input_source_code=input_source_code
         )
 
-        # Please see ``TestTranslationForTracingAll.translate_all_expression`` and the note about ``name_to_value``
+        # Please see ``TestTranslationForTracingAll.translate_all_expression`` and the note about ``arg_names``
         # if you wonder why ``matrix`` is not in the arguments.
         self.assertEqual(
             textwrap.dedent(
@@ -148,7 +148,7 @@ class TestTranslationForTracingAll(unittest.TestCase):
             input_source_code=input_source_code
         )
 
-        # Please see ``TestTranslationForTracingAll.translate_all_expression`` and the note about ``name_to_value``
+        # Please see ``TestTranslationForTracingAll.translate_all_expression`` and the note about ``arg_names``
         # if you wonder why ``matrix`` is not in the arguments.
         self.assertEqual(
             textwrap.dedent(
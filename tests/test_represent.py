@@ -8,7 +8,7 @@ import re
 import reprlib
 import textwrap
 import unittest
-from typing import Optional, List, Tuple, Any  # pylint: disable=unused-import
+from typing import List, Tuple, Any  # pylint: disable=unused-import
 
 import numpy
 
@@ -23,15 +23,12 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=100)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
-            "x < 5: x was 100", tests.error.wo_mandatory_location(str(violation_error))
+            "x < 5: x was 100",
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_str(self) -> None:
@@ -39,16 +36,12 @@ class TestReprValues(unittest.TestCase):
         def func(x: str) -> str:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x="oi")
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             """x != "oi": x was 'oi'""",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_bytes(self) -> None:
@@ -56,16 +49,12 @@ class TestReprValues(unittest.TestCase):
         def func(x: bytes) -> bytes:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=b"oi")
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             """x != b"oi": x was b'oi'""",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_bool(self) -> None:
@@ -73,16 +62,12 @@ class TestReprValues(unittest.TestCase):
         def func(x: bool) -> bool:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=False)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "x is not False: x was False",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_list(self) -> None:
@@ -92,13 +77,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=3)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -107,7 +88,7 @@ class TestReprValues(unittest.TestCase):
                 x was 3
                 y was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_tuple(self) -> None:
@@ -117,13 +98,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=3)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -132,7 +109,7 @@ class TestReprValues(unittest.TestCase):
                 x was 3
                 y was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_set(self) -> None:
@@ -142,13 +119,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=3)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -157,7 +130,7 @@ class TestReprValues(unittest.TestCase):
                 x was 3
                 y was 2"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_dict(self) -> None:
@@ -167,13 +140,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: str) -> str:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x="oi")
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -182,7 +151,7 @@ class TestReprValues(unittest.TestCase):
                 x was 'oi'
                 y was 'someKey'"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_unary_op(self) -> None:
@@ -190,16 +159,12 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "not -x + 10 > 3: x was 1",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_binary_op(self) -> None:
@@ -207,16 +172,12 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "-x + x - x * x / x // x**x % x > 3: x was 1",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_binary_op_bit(self) -> None:
@@ -224,16 +185,12 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "~(x << x | x & x ^ x) >> x > x: x was 1",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_bool_op_single(self) -> None:
@@ -242,16 +199,12 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "x > 3 and x < 10: x was 1",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_bool_op_multiple(self) -> None:
@@ -260,16 +213,12 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "x > 3 and x < 10 and x % 2 == 0: x was 1",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_compare(self) -> None:
@@ -289,13 +238,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             """\
 0 < x < 3
@@ -306,7 +251,7 @@ class TestReprValues(unittest.TestCase):
     and x is not None
     and x in [1, 2, 3]
     and x not in [1, 2, 3]: x was 1""",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_call(self) -> None:
@@ -317,13 +262,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -331,7 +272,7 @@ class TestReprValues(unittest.TestCase):
                 x was 1
                 y() was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_if_exp_body(self) -> None:
@@ -341,13 +282,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -355,7 +292,7 @@ class TestReprValues(unittest.TestCase):
                 x was 1
                 y was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_if_exp_orelse(self) -> None:
@@ -365,13 +302,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -379,7 +312,7 @@ class TestReprValues(unittest.TestCase):
                 x was 1
                 y was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_attr(self) -> None:
@@ -396,13 +329,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -411,9 +340,62 @@ class TestReprValues(unittest.TestCase):
                 a.y was 3
                 x was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
+    def test_attr_on_repeated_violations(self) -> None:
+        class A:
+            def __init__(self, y: int) -> None:
+                self.y = y
+
+            def __repr__(self) -> str:
+                return "A(y={})".format(self.y)
+
+        @icontract.require(lambda a, x: x > a.y)
+        def func(a: A, x: int) -> int:
+            return x
+
+        messages = []  # type: List[str]
+        for y in [3, 4]:
+            with self.assertRaises(icontract.ViolationError) as context:
+                func(a=A(y=y), x=1)
+
+            messages.append(tests.error.wo_mandatory_location(str(context.exception)))
+
+        # The source code of the nodes is cached, but the values must be represented anew.
+        self.assertListEqual(
+            [
+                textwrap.dedent(
+                    """\
+                    x > a.y:
+                    a was A(y={0})
+                    a.y was {0}
+                    x was 1"""
+                ).format(y)
+                for y in [3, 4]
+            ],
+            messages,
+        )
+
+    def test_same_condition_on_different_functions(self) -> None:
+        @icontract.require(lambda x: x > 0)
+        def some_func(x: int) -> int:
+            return x
+
+        @icontract.require(lambda x: x > 0)
+        def another_func(x: int) -> int:
+            return x
+
+        messages = []  # type: List[str]
+        for func, x in [(some_func, -1), (another_func, -2)]:
+            with self.assertRaises(icontract.ViolationError) as context:
+                func(x)
+
+            messages.append(tests.error.wo_mandatory_location(str(context.exception)))
+
+        # The conditions have the same source code, but the values must be represented anew.
+        self.assertListEqual(["x > 0: x was -1", "x > 0: x was -2"], messages)
+
     def test_index(self) -> None:
         lst = [1, 2, 3]
 
@@ -421,13 +403,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -436,7 +414,7 @@ class TestReprValues(unittest.TestCase):
                 lst[1] was 2
                 x was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_slice(self) -> None:
@@ -446,13 +424,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -462,7 +436,7 @@ class TestReprValues(unittest.TestCase):
                 sum(lst[1:2:1]) was 2
                 x was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_ext_slice(self) -> None:
@@ -477,14 +451,10 @@ class TestReprValues(unittest.TestCase):
         def func(something: SomeClass) -> None:
             pass
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             an_instance = SomeClass()
             func(something=an_instance)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -492,7 +462,7 @@ class TestReprValues(unittest.TestCase):
                 something was <instance of SomeClass>
                 something[1, 2:3] was (1, slice(2, 3, None))"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_lambda(self) -> None:
@@ -500,17 +470,13 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        runtime_error = None  # type: Optional[RuntimeError]
-        try:
+        with self.assertRaises(RuntimeError) as context:
             func(x=1)
-        except RuntimeError as err:
-            runtime_error = err
 
-        assert runtime_error is not None
-        assert runtime_error.__cause__ is not None
-        assert isinstance(runtime_error.__cause__, NotImplementedError)
+        assert context.exception.__cause__ is not None
+        assert isinstance(context.exception.__cause__, NotImplementedError)
 
-        not_implemented_error = runtime_error.__cause__
+        not_implemented_error = context.exception.__cause__
 
         self.assertEqual(
             "Re-computation of in-line lambda functions is not supported since it is quite tricky to implement and "
@@ -528,16 +494,12 @@ class TestGeneratorExpr(unittest.TestCase):
         def some_func() -> List[Tuple[pathlib.Path, pathlib.Path]]:
             return [(pathlib.Path("/home/file1"), pathlib.Path("home/file2"))]
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
         # This dummy path is necessary to obtain the class name.
         dummy_path = pathlib.Path("/also/doesnt/exist")
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -546,7 +508,7 @@ class TestGeneratorExpr(unittest.TestCase):
                   single_res = ({0}('/home/file1'), {0}('home/file2'))
                 result was [({0}('/home/file1'), {0}('home/file2'))]"""
             ).format(dummy_path.__class__.__name__),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_multiple_for(self) -> None:
@@ -560,13 +522,8 @@ class TestGeneratorExpr(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=0)
-        except icontract.ViolationError as err:
-            violation_error = err
-
-        self.assertIsNotNone(violation_error)
 
         self.assertEqual(
             textwrap.dedent(
@@ -578,7 +535,7 @@ class TestGeneratorExpr(unittest.TestCase):
                 lst was [[1, 2], [3]]
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_zip_and_multiple_for(self) -> None:
@@ -601,18 +558,13 @@ class TestGeneratorExpr(unittest.TestCase):
 
         layout = [["L", ".", "#"], [".", "#", "#"]]
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _, _ = apply(layout=layout)
-        except icontract.ViolationError as err:
-            violation_error = err
-
-        self.assertIsNotNone(violation_error)
 
         text = re.sub(
             r"<zip object at 0x[0-9a-fA-F]+>",
             "<zip object at some address>",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
         self.assertEqual(
@@ -651,13 +603,9 @@ class TestListComprehension(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=2)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -666,7 +614,49 @@ class TestListComprehension(unittest.TestCase):
                 lst was [1, 2, 3]
                 x was 2"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
+        )
+
+    def test_repeated_violations(self) -> None:
+        @icontract.require(lambda lst, x: [item for item in lst if item > x] == [])
+        def func(lst: List[int], x: int) -> int:
+            return x
+
+        # The comprehension is compiled only once, but must be re-computed on each violation.
+        for lst in [[1, 2, 3], [4, 5]]:
+            with self.assertRaises(icontract.ViolationError) as context:
+                func(lst=lst, x=1)
+
+            self.assertEqual(
+                textwrap.dedent(
+                    """\
+                    [item for item in lst if item > x] == []:
+                    [item for item in lst if item > x] was {}
+                    lst was {}
+                    x was 1"""
+                ).format([item for item in lst if item > 1], lst),
+                tests.error.wo_mandatory_location(str(context.exception)),
+            )
+
+    def test_with_global_and_builtin(self) -> None:
+        @icontract.require(
+            lambda lst: [abs(item) for item in lst if item > SOME_GLOBAL_CONSTANT] == []
+        )
+        def func(lst: List[int]) -> None:
+            pass
+
+        with self.assertRaises(icontract.ViolationError) as context:
+            func(lst=[1, 20])
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                [abs(item) for item in lst if item > SOME_GLOBAL_CONSTANT] == []:
+                SOME_GLOBAL_CONSTANT was 10
+                [abs(item) for item in lst if item > SOME_GLOBAL_CONSTANT] was [20]
+                lst was [1, 20]"""
+            ),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_nested(self) -> None:
@@ -684,13 +674,9 @@ class TestListComprehension(unittest.TestCase):
         def func() -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -704,7 +690,7 @@ class TestListComprehension(unittest.TestCase):
                     ] was [[1, 2, 3]]
                 lst_of_lsts was [[1, 2, 3]]"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -718,13 +704,9 @@ class TestSetComprehension(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=2)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -734,7 +716,7 @@ class TestSetComprehension(unittest.TestCase):
                 x was 2
                 {item < x for item in lst if item % x == 0} was {False}"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_nested(self) -> None:
@@ -752,13 +734,9 @@ class TestSetComprehension(unittest.TestCase):
         def func() -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -773,7 +751,7 @@ class TestSetComprehension(unittest.TestCase):
                         for lst in lst_of_lsts
                     } was {3}"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -783,13 +761,9 @@ class TestDictComprehension(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=2)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -799,7 +773,7 @@ class TestDictComprehension(unittest.TestCase):
                 x was 2
                 {i: i**2 for i in range(x)} was {0: 0, 1: 1}"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_nested(self) -> None:
@@ -817,13 +791,9 @@ class TestDictComprehension(unittest.TestCase):
         def func() -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -841,7 +811,7 @@ class TestDictComprehension(unittest.TestCase):
                         for lst in lst_of_lsts
                     } was {3: {1: 1, 2: 2, 3: 3}}"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -856,15 +826,11 @@ class TestConditionAsText(unittest.TestCase):
 
         # fmt: on
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=0)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
-            "x > 3: x was 0", tests.error.wo_mandatory_location(str(violation_err))
+            "x > 3: x was 0", tests.error.wo_mandatory_location(str(context.exception))
         )
 
     def test_condition_on_next_line(self) -> None:
@@ -876,15 +842,11 @@ class TestConditionAsText(unittest.TestCase):
 
         # fmt: on
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=0)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
-            "x > 3: x was 0", tests.error.wo_mandatory_location(str(violation_err))
+            "x > 3: x was 0", tests.error.wo_mandatory_location(str(context.exception))
         )
 
     def test_condition_on_multiple_lines(self) -> None:
@@ -899,13 +861,9 @@ class TestConditionAsText(unittest.TestCase):
 
         # fmt: on
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=0)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -913,7 +871,7 @@ class TestConditionAsText(unittest.TestCase):
                     >
                     3: x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_multiple_lambdas_on_a_line(self) -> None:
@@ -928,44 +886,37 @@ class TestConditionAsText(unittest.TestCase):
 
         # fmt: on
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             func(x=101)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertEqual("x < 100, but got: 101", str(value_error))
+        self.assertEqual("x < 100, but got: 101", str(context.exception))
 
-        value_error = None
-        try:
+        with self.assertRaises(ValueError) as context:
             func(x=-1)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
-        self.assertEqual("x > 0, but got: -1", str(value_error))
+        self.assertEqual("x > 0, but got: -1", str(context.exception))
 
 
 SOME_GLOBAL_CONSTANT = 10
 
 
+# The representation is shared among the tests as it is never modified.
+SHORT_REPR = reprlib.Repr()
+SHORT_REPR.maxlist = 3
+
+
 class TestRepr(unittest.TestCase):
-    def test_repr(self) -> None:
-        a_repr = reprlib.Repr()
-        a_repr.maxlist = 3
+    # We construct the long list only once, when the test case is defined, as its content is never modified.
+    long_list = list(range(10 * 1000))
 
-        @icontract.require(lambda x: len(x) < 10, a_repr=a_repr)
+    def test_repr(self) -> None:
+        @icontract.require(lambda x: len(x) < 10, a_repr=SHORT_REPR)
         def some_func(x: List[int]) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
-            some_func(x=list(range(10 * 1000)))
-        except icontract.ViolationError as err:
-            violation_error = err
+        with self.assertRaises(icontract.ViolationError) as context:
+            some_func(x=self.long_list)
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -973,7 +924,26 @@ class TestRepr(unittest.TestCase):
                 len(x) was 10000
                 x was [0, 1, 2, ...]"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
+        )
+
+    def test_repr_in_postcondition(self) -> None:
+        @icontract.ensure(lambda result: len(result) < 10, a_repr=SHORT_REPR)
+        def some_func(x: List[int]) -> List[int]:
+            return x
+
+        with self.assertRaises(icontract.ViolationError) as context:
+            some_func(x=self.long_list)
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                len(result) < 10:
+                len(result) was 10000
+                result was [0, 1, 2, ...]
+                x was [0, 1, 2, ...]"""
+            ),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -1002,13 +972,9 @@ class TestClass(unittest.TestCase):
 
         a = A()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.some_func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1017,7 +983,7 @@ class TestClass(unittest.TestCase):
                 self.b was B(x=0)
                 self.b.x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_nested_method(self) -> None:
@@ -1059,16 +1025,12 @@ class TestClass(unittest.TestCase):
 
         a = A()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.some_func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
         # This dummy path is necessary to obtain the class name.
         dummy_path = pathlib.Path("/just/a/dummy/path")
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1083,7 +1045,7 @@ class TestClass(unittest.TestCase):
                 str(gt_zero(self.b.c(x=0).x() + 12.2 * z)) was 'True'
                 z was 10"""
             ).format(dummy_path.__class__.__name__),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -1096,13 +1058,9 @@ class TestClosures(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=100)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1111,7 +1069,7 @@ class TestClosures(unittest.TestCase):
                 y was 4
                 z was 5"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_global(self) -> None:
@@ -1119,13 +1077,9 @@ class TestClosures(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=100)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1133,7 +1087,7 @@ class TestClosures(unittest.TestCase):
                 SOME_GLOBAL_CONSTANT was 10
                 x was 100"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_closure_and_global(self) -> None:
@@ -1143,13 +1097,9 @@ class TestClosures(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=100)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1158,7 +1108,43 @@ class TestClosures(unittest.TestCase):
                 x was 100
                 y was 4"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
+        )
+
+    def test_closure_changed_between_violations(self) -> None:
+        y = 4
+
+        @icontract.require(lambda x: x < y)
+        def some_func(x: int) -> None:
+            pass
+
+        with self.assertRaises(icontract.ViolationError) as context:
+            some_func(x=100)
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                x < y:
+                x was 100
+                y was 4"""
+            ),
+            tests.error.wo_mandatory_location(str(context.exception)),
+        )
+
+        # The inspection of the condition is cached, but the values need to be re-computed.
+        y = 5
+
+        with self.assertRaises(icontract.ViolationError) as context:
+            some_func(x=100)
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                x < y:
+                x was 100
+                y was 5"""
+            ),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -1166,16 +1152,13 @@ class TestWithNumpyMock(unittest.TestCase):
     def test_that_mock_works(self) -> None:
         arr = tests.mock.NumpyArray(values=[-3, 3])
 
-        value_err = None  # type: Optional[ValueError]
-        try:
-            not (arr > 0)  # pylint: disable=superfluous-parens,unneeded-not
-        except ValueError as err:
-            value_err = err
+        with self.assertRaises(ValueError) as context:
+            # pylint: disable=superfluous-parens,unneeded-not,pointless-statement
+            not (arr > 0)
 
-        self.assertIsNotNone(value_err)
         self.assertEqual(
             "The truth value of an array with more than one element is ambiguous.",
-            str(value_err),
+            str(context.exception),
         )
 
     def test_that_single_comparator_works(self) -> None:
@@ -1183,13 +1166,9 @@ class TestWithNumpyMock(unittest.TestCase):
         def some_func(arr: tests.mock.NumpyArray) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(arr=tests.mock.NumpyArray(values=[-3, 3]))
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1197,7 +1176,7 @@ class TestWithNumpyMock(unittest.TestCase):
                 (arr > 0).all() was False
                 arr was NumpyArray([-3, 3])"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_that_multiple_comparators_fail(self) -> None:
@@ -1224,16 +1203,12 @@ class TestWithNumpyMock(unittest.TestCase):
         def some_func(arr: tests.mock.NumpyArray) -> None:
             pass
 
-        value_err = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func(arr=tests.mock.NumpyArray(values=[-10, -1]))
-        except ValueError as err:
-            value_err = err
 
-        self.assertIsNotNone(value_err)
         self.assertEqual(
             "The truth value of an array with more than one element is ambiguous.",
-            str(value_err),
+            str(context.exception),
         )
 
 
@@ -1246,13 +1221,9 @@ class TestNumpyArrays(unittest.TestCase):
         def some_func(arr: Any) -> None:
             return
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(arr=numpy.arange(2))
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1260,7 +1231,7 @@ class TestNumpyArrays(unittest.TestCase):
                 arr was array([0, 1])
                 len(arr) was 2"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_arange_in_kwargs_values(self) -> None:
@@ -1274,13 +1245,9 @@ class TestNumpyArrays(unittest.TestCase):
         def some_func(arr: Any) -> None:
             return
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(arr=numpy.arange(2))
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1288,7 +1255,7 @@ class TestNumpyArrays(unittest.TestCase):
                 arr was array([0, 1])
                 custom_len(arr=arr) was 2"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -1310,13 +1277,8 @@ class TestRecomputationFailure(unittest.TestCase):
         def some_func() -> None:
             pass
 
-        runtime_error = None  # type: Optional[RuntimeError]
-        try:
+        with self.assertRaises(RuntimeError) as context:
             some_func()
-        except RuntimeError as err:
-            runtime_error = err
-
-        assert runtime_error is not None
 
         lines = [
             re.sub(
@@ -1324,7 +1286,7 @@ class TestRecomputationFailure(unittest.TestCase):
                 "File <erased path>, line <erased line> in <erased function>:",
                 line,
             )
-            for line in str(runtime_error).splitlines()
+            for line in str(context.exception).splitlines()
         ]
         text = "\n".join(lines)
 
@@ -1353,15 +1315,10 @@ class TestTracingAll(unittest.TestCase):
         def func(lst: List[int]) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(lst=[-1, -2])
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
-
-        got = tests.error.wo_mandatory_location(str(violation_error))
+        got = tests.error.wo_mandatory_location(str(context.exception))
 
         self.assertEqual(
             textwrap.dedent(
@@ -1381,6 +1338,34 @@ class TestTracingAll(unittest.TestCase):
             got,
         )
 
+    def test_repeated_violations(self) -> None:
+        @icontract.require(lambda lst, x: all(value > x for value in lst))
+        def func(lst: List[int], x: int) -> None:
+            pass
+
+        messages = []  # type: List[str]
+        for lst, x in [([1, 2], 1), ([3, 4], 5)]:
+            with self.assertRaises(icontract.ViolationError) as context:
+                func(lst=lst, x=x)
+
+            messages.append(tests.error.wo_mandatory_location(str(context.exception)))
+
+        # The tracing function is compiled only once, but it needs to be executed on the new values.
+        self.assertListEqual(
+            [
+                textwrap.dedent(
+                    """\
+                    all(value > x for value in lst):
+                    all(value > x for value in lst) was False, e.g., with
+                      value = {}
+                    lst was {}
+                    x was {}"""
+                ).format(value, lst, x)
+                for value, lst, x in [(1, [1, 2], 1), (3, [3, 4], 5)]
+            ],
+            messages,
+        )
+
     def test_formatted_string(self) -> None:
         # fmt: off
         @icontract.require(
@@ -1394,15 +1379,10 @@ class TestTracingAll(unittest.TestCase):
         def func(lst: List[str]) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(lst=["y"])
-        except icontract.ViolationError as err:
-            violation_error = err
-
-        self.assertIsNotNone(violation_error)
 
-        got = tests.error.wo_mandatory_location(str(violation_error))
+        got = tests.error.wo_mandatory_location(str(context.exception))
 
         self.assertEqual(
             textwrap.dedent(
@@ -1437,18 +1417,13 @@ class TestTracingAll(unittest.TestCase):
         def func(matrix: List[List[int]]) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(matrix=[[-1, -1], [-1, -1]])
-        except icontract.ViolationError as err:
-            violation_error = err
-
-        self.assertIsNotNone(violation_error)
 
         got = re.sub(
             r"<enumerate object at 0x[0-9A-Za-z]+>",
             "<enumerate object at 0x...>",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
         self.assertEqual(
@@ -1494,13 +1469,9 @@ class TestTracingAll(unittest.TestCase):
         def func(lst_of_lsts: List[List[int]]) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(lst_of_lsts=[[-1, -1]])
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1515,7 +1486,7 @@ class TestTracingAll(unittest.TestCase):
                   sublst = [-1, -1]
                 lst_of_lsts was [[-1, -1]]"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_property_of_an_object_represented(self) -> None:
@@ -1538,13 +1509,8 @@ class TestTracingAll(unittest.TestCase):
         def func(something: Something, lst: List[int]) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(something=Something(), lst=[-1])
-        except icontract.ViolationError as err:
-            violation_error = err
-
-        self.assertIsNotNone(violation_error)
 
         self.assertEqual(
             textwrap.dedent(
@@ -1562,7 +1528,7 @@ class TestTracingAll(unittest.TestCase):
                 something was Something()
                 something.some_property was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_shadows_in_targets(self) -> None:
@@ -1578,13 +1544,9 @@ class TestTracingAll(unittest.TestCase):
         def func(lst_of_lsts: List[List[int]]) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(lst_of_lsts=[[-1, -1]])
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -1599,7 +1561,7 @@ class TestTracingAll(unittest.TestCase):
                   item = [-1, -1]
                 lst_of_lsts was [[-1, -1]]"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -5,7 +5,7 @@
 
 import textwrap
 import unittest
-from typing import List, Optional  # pylint: disable=unused-import
+from typing import List  # pylint: disable=unused-import
 
 import icontract
 import tests.error
@@ -51,6 +51,15 @@ class TestOK(unittest.TestCase):
         # Expected to pass
         some_func(lst_a=[1, 2], lst_b=[3, 4])
 
+    def test_with_postcondition_which_always_holds(self) -> None:
+        @icontract.snapshot(lambda lst: lst[:])
+        @icontract.ensure(lambda OLD, lst: True)
+        def some_func(lst: List[int], val: int) -> None:
+            lst.append(val)
+
+        # Expected to pass
+        some_func([1], 2)
+
 
 class TestViolation(unittest.TestCase):
     def test_with_name_same_as_argument(self) -> None:
@@ -60,13 +69,9 @@ class TestViolation(unittest.TestCase):
             lst.append(val)
             lst.append(1984)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func([1], 2)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -77,7 +82,7 @@ class TestViolation(unittest.TestCase):
                 result was None
                 val was 2"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_custom_name(self) -> None:
@@ -87,13 +92,9 @@ class TestViolation(unittest.TestCase):
             lst.append(val)
             lst.append(1984)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func([1], 2)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -105,7 +106,7 @@ class TestViolation(unittest.TestCase):
                 result was None
                 val was 2"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_multiple_arguments(self) -> None:
@@ -116,13 +117,9 @@ class TestViolation(unittest.TestCase):
         def some_func(lst_a: List[int], lst_b: List[int]) -> None:
             lst_a.append(1984)  # bug
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(lst_a=[1, 2], lst_b=[3, 4])
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -135,7 +132,7 @@ class TestViolation(unittest.TestCase):
                 set(lst_a) was {1, 2, 1984}
                 set(lst_a).union(lst_b) was {1, 2, 3, 4, 1984}"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -145,23 +142,18 @@ class TestInvalid(unittest.TestCase):
         def some_func(lst: List[int], val: int) -> None:
             lst.append(val)
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             some_func([1], 2)
-        except TypeError as err:
-            type_error = err
 
-        self.assertIsNotNone(type_error)
         self.assertEqual(
             "The argument(s) of the contract condition have not been set: ['OLD']. "
             "Does the original function define them? Did you supply them in the call? "
             "Did you decorate the function with a snapshot to capture OLD values?",
-            tests.error.wo_mandatory_location(str(type_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_conflicting_snapshots_with_argument_name(self) -> None:
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             # pylint: disable=unused-variable
 
             @icontract.snapshot(lambda lst: lst[:])
@@ -170,17 +162,13 @@ class TestInvalid(unittest.TestCase):
             def some_func(lst: List[int], val: int) -> None:
                 lst.append(val)
 
-        except ValueError as err:
-            value_error = err
-
-        self.assertIsNotNone(value_error)
         self.assertEqual(
-            "There are conflicting snapshots with the name: 'lst'", str(value_error)
+            "There are conflicting snapshots with the name: 'lst'",
+            str(context.exception),
         )
 
     def test_conflicting_snapshots_with_custom_name(self) -> None:
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             # pylint: disable=unused-variable
 
             @icontract.snapshot(lambda lst: len(lst), name="len_lst")
@@ -189,18 +177,14 @@ class TestInvalid(unittest.TestCase):
             def some_func(lst: List[int], val: int) -> None:
                 lst.append(val)
 
-        except ValueError as err:
-            value_error = err
-
-        self.assertIsNotNone(value_error)
         self.assertEqual(
-            "There are conflicting snapshots with the name: 'len_lst'", str(value_error)
+            "There are conflicting snapshots with the name: 'len_lst'",
+            str(context.exception),
         )
 
     def test_with_invalid_argument(self) -> None:
         # lst versus a_list
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
 
             @icontract.snapshot(lambda lst: len(lst), name="len_lst")
             @icontract.ensure(lambda OLD, val, a_list: OLD.len_lst + 1 == len(a_list))
@@ -208,21 +192,17 @@ class TestInvalid(unittest.TestCase):
                 a_list.append(val)
 
             some_func([1], 2)
-        except TypeError as err:
-            type_error = err
 
-        self.assertIsNotNone(type_error)
         self.assertEqual(
             "The argument(s) of the snapshot have not been set: ['lst']. "
             "Does the original function define them? Did you supply them in the call?",
-            tests.error.wo_mandatory_location(str(type_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_with_no_arguments_and_no_name(self) -> None:
         z = [1]
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             # pylint: disable=unused-variable
 
             @icontract.snapshot(lambda: z[:])
@@ -230,18 +210,13 @@ class TestInvalid(unittest.TestCase):
             def some_func(val: int) -> None:
                 z.append(val)
 
-        except ValueError as err:
-            value_error = err
-
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "You must name a snapshot if no argument was given in the capture function.",
-            str(value_error),
+            str(context.exception),
         )
 
     def test_with_multiple_arguments_and_no_name(self) -> None:
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             # pylint: disable=unused-variable
 
             @icontract.snapshot(lambda lst_a, lst_b: set(lst_a).union(lst_b))
@@ -251,32 +226,23 @@ class TestInvalid(unittest.TestCase):
             def some_func(lst_a: List[int], lst_b: List[int]) -> None:
                 pass
 
-        except ValueError as err:
-            value_error = err
-
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "You must name a snapshot if multiple arguments were given in the capture function.",
-            str(value_error),
+            str(context.exception),
         )
 
     def test_with_no_postcondition(self) -> None:
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             # pylint: disable=unused-variable
 
             @icontract.snapshot(lambda lst: lst[:])
             def some_func(lst: List[int]) -> None:
                 return
 
-        except ValueError as err:
-            value_error = err
-
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "You are decorating a function with a snapshot, "
             "but no postcondition was defined on the function before.",
-            str(value_error),
+            str(context.exception),
         )
 
     def test_missing_old_attribute(self) -> None:
@@ -287,19 +253,13 @@ class TestInvalid(unittest.TestCase):
         def some_func(lst: List[int]) -> None:
             return
 
-        attribute_error = None  # type: Optional[AttributeError]
-
-        try:
+        with self.assertRaises(AttributeError) as context:
             some_func(lst=[1, 2, 3])
-        except AttributeError as error:
-            attribute_error = error
-
-        assert attribute_error is not None
 
         self.assertEqual(
             "The snapshot with the name 'len_list' is not available in the OLD of a postcondition. "
             "Have you decorated the function with a corresponding snapshot decorator?",
-            str(attribute_error),
+            str(context.exception),
         )
 
 
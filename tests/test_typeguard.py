@@ -4,7 +4,6 @@
 
 import textwrap
 import unittest
-from typing import Optional
 
 import typeguard
 
@@ -36,13 +35,8 @@ class TestPrecondition(unittest.TestCase):
             pass
 
         b = B()
-        type_check_error = None  # type: Optional[typeguard.TypeCheckError]
-        try:
+        with self.assertRaises(typeguard.TypeCheckError):
             some_func(b)  # type: ignore
-        except typeguard.TypeCheckError as err:
-            type_check_error = err
-
-        self.assertIsNotNone(type_check_error)
 
     def test_precondition_fails_and_typeguard_ok(self) -> None:
         @icontract.require(lambda x: x > 0)
@@ -50,15 +44,12 @@ class TestPrecondition(unittest.TestCase):
         def some_func(x: int) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(-10)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
-            "x > 0: x was -10", tests.error.wo_mandatory_location(str(violation_error))
+            "x > 0: x was -10",
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -93,13 +84,8 @@ class TestInvariant(unittest.TestCase):
 
         b = B()
 
-        type_check_error = None  # type: Optional[typeguard.TypeCheckError]
-        try:
+        with self.assertRaises(typeguard.TypeCheckError):
             _ = C(a=b)  # type: ignore
-        except typeguard.TypeCheckError as err:
-            type_check_error = err
-
-        self.assertIsNotNone(type_check_error)
 
     def test_invariant_fails_and_typeguard_ok(self) -> None:
         @icontract.invariant(lambda self: self.x > 0)
@@ -111,13 +97,9 @@ class TestInvariant(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = A(-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -125,7 +107,7 @@ class TestInvariant(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -166,13 +148,8 @@ class TestInheritance(unittest.TestCase):
 
         b = B()
 
-        type_check_error = None  # type: Optional[typeguard.TypeCheckError]
-        try:
+        with self.assertRaises(typeguard.TypeCheckError):
             _ = D(a=b)  # type: ignore
-        except typeguard.TypeCheckError as err:
-            type_check_error = err
-
-        self.assertIsNotNone(type_check_error)
 
     def test_invariant_fails_and_typeguard_ok(self) -> None:
         @icontract.invariant(lambda self: self.x > 0)
@@ -188,13 +165,9 @@ class TestInheritance(unittest.TestCase):
             def __repr__(self) -> str:
                 return "an instance of {}".format(self.__class__.__name__)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = B(-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -202,7 +175,7 @@ class TestInheritance(unittest.TestCase):
                 self was an instance of B
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
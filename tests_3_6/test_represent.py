@@ -4,7 +4,6 @@
 
 import textwrap
 import unittest
-from typing import Optional  # pylint: disable=unused-import
 
 import icontract._represent
 import tests.error
@@ -18,13 +17,9 @@ class TestLiteralStringInterpolation(unittest.TestCase):
         def func(x: float) -> float:
             return x
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=0)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -32,7 +27,7 @@ class TestLiteralStringInterpolation(unittest.TestCase):
                 f"something" was 'something'
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_simple_interpolation(self) -> None:
@@ -40,13 +35,9 @@ class TestLiteralStringInterpolation(unittest.TestCase):
         def func(x: float) -> float:
             return x
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=0)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -54,7 +45,7 @@ class TestLiteralStringInterpolation(unittest.TestCase):
                 f"{x}" was '0'
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_string_formatting(self) -> None:
@@ -62,13 +53,9 @@ class TestLiteralStringInterpolation(unittest.TestCase):
         def func(x: float) -> float:
             return x
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1.984)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -76,7 +63,7 @@ class TestLiteralStringInterpolation(unittest.TestCase):
                 f"{x!s}" was '1.984'
                 x was 1.984"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_repr_formatting(self) -> None:
@@ -84,13 +71,9 @@ class TestLiteralStringInterpolation(unittest.TestCase):
         def func(x: float) -> float:
             return x
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1.984)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -98,7 +81,7 @@ class TestLiteralStringInterpolation(unittest.TestCase):
                 f"{x!r}" was '1.984'
                 x was 1.984"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_ascii_formatting(self) -> None:
@@ -106,13 +89,9 @@ class TestLiteralStringInterpolation(unittest.TestCase):
         def func(x: float) -> float:
             return x
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1.984)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -120,7 +99,7 @@ class TestLiteralStringInterpolation(unittest.TestCase):
                 f"{x!a}" was '1.984'
                 x was 1.984"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_format_spec(self) -> None:
@@ -128,13 +107,9 @@ class TestLiteralStringInterpolation(unittest.TestCase):
         def func(x: float) -> float:
             return x
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1.984)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -142,7 +117,7 @@ class TestLiteralStringInterpolation(unittest.TestCase):
                 f"{x:.3}" was '1.98'
                 x was 1.984"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_conversion_and_format_spec(self) -> None:
@@ -150,13 +125,9 @@ class TestLiteralStringInterpolation(unittest.TestCase):
         def func(x: float) -> float:
             return x
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=1.984)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -164,7 +135,7 @@ class TestLiteralStringInterpolation(unittest.TestCase):
                 f"{x!r:.3}" was '1.9'
                 x was 1.984"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -5,7 +5,7 @@
 import dataclasses
 import textwrap
 import unittest
-from typing import NamedTuple, Optional  # pylint: disable=unused-import
+from typing import NamedTuple  # pylint: disable=unused-import
 
 import icontract
 import tests.error
@@ -44,13 +44,9 @@ class TestViolation(unittest.TestCase):
             first: int
             second: int
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = RightHalfPlanePoint(1, -1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -58,7 +54,7 @@ class TestViolation(unittest.TestCase):
             self was TestViolation.test_on_dataclass.<locals>.RightHalfPlanePoint(first=1, second=-1)
             self.second was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_on_dataclass_with_field(self) -> None:
@@ -67,13 +63,9 @@ class TestViolation(unittest.TestCase):
         class Foo:
             x: int = dataclasses.field(default=-1)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = Foo(3)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -81,7 +73,7 @@ class TestViolation(unittest.TestCase):
             self was TestViolation.test_on_dataclass_with_field.<locals>.Foo(x=3)
             self.x was 3"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     def test_on_dataclass_with_field_default_violating(self) -> None:
@@ -90,13 +82,9 @@ class TestViolation(unittest.TestCase):
         class Foo:
             x: int = dataclasses.field(default=42)
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = Foo()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -104,7 +92,7 @@ class TestViolation(unittest.TestCase):
             self was TestViolation.test_on_dataclass_with_field_default_violating.<locals>.Foo(x=42)
             self.x was 42"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -122,13 +110,9 @@ class TestCheckOn(unittest.TestCase):
 
         a = A()
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             a.x = -1
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -136,7 +120,7 @@ class TestCheckOn(unittest.TestCase):
                 self was an instance of A
                 self.x was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -85,13 +85,9 @@ class TestArgs(unittest.IsolatedAsyncioTestCase):
         async def some_func(*args: Any) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             await some_func(3)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        assert violation_error is not None
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -100,7 +96,7 @@ class TestArgs(unittest.IsolatedAsyncioTestCase):
                 args was 3
                 len(_ARGS) was 1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -180,13 +176,9 @@ class TestKwargs(unittest.IsolatedAsyncioTestCase):
         async def some_func(**kwargs: Any) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             await some_func(y=3)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        assert violation_error is not None
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -194,7 +186,7 @@ class TestKwargs(unittest.IsolatedAsyncioTestCase):
                 _KWARGS was {'y': 3}
                 y was 3"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -252,17 +244,13 @@ class TestConflictOnARGSReported(unittest.IsolatedAsyncioTestCase):
         async def some_func(*args, **kwargs) -> None:  # type: ignore
             pass
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             await some_func(_ARGS="something")
-        except TypeError as error:
-            type_error = error
 
-        assert type_error is not None
         self.assertEqual(
             'The arguments of the function call include "_ARGS" '
             "which is a placeholder for positional arguments in a condition.",
-            str(type_error),
+            str(context.exception),
         )
 
 
@@ -272,17 +260,13 @@ class TestConflictOnKWARGSReported(unittest.IsolatedAsyncioTestCase):
         async def some_func(*args, **kwargs) -> None:  # type: ignore
             pass
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             await some_func(_KWARGS="something")
-        except TypeError as error:
-            type_error = error
 
-        assert type_error is not None
         self.assertEqual(
             'The arguments of the function call include "_KWARGS" '
             "which is a placeholder for keyword arguments in a condition.",
-            str(type_error),
+            str(context.exception),
         )
 
 
@@ -3,7 +3,7 @@
 
 # pylint: disable=missing-docstring, invalid-name, unnecessary-lambda
 import unittest
-from typing import Optional, List
+from typing import List
 
 import icontract
 
@@ -17,15 +17,11 @@ class TestSyncFunctionAsyncConditionFail(unittest.IsolatedAsyncioTestCase):
         def some_func(x: int) -> int:
             return x * 10
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             _ = some_func(100)
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"^Unexpected coroutine \(async\) condition <.*> for a sync function <.*\.some_func at .*>.",
         )
 
@@ -37,15 +33,11 @@ class TestSyncFunctionAsyncConditionFail(unittest.IsolatedAsyncioTestCase):
         def some_func() -> int:
             return 100
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             _ = some_func()
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"^Unexpected coroutine \(async\) condition <.*> for a sync function <.*\.some_func at .*>.",
         )
 
@@ -58,15 +50,11 @@ class TestSyncFunctionAsyncConditionFail(unittest.IsolatedAsyncioTestCase):
         def some_func(lst: List[int]) -> None:
             lst.append(1984)
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func([1])
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"^Unexpected coroutine \(async\) snapshot capture <function .*\.capture_len_lst at .*> "
             r"for a sync function <function .*\.some_func at .*>\.",
         )
@@ -81,16 +69,11 @@ class TestSyncFunctionConditionCoroutineFail(unittest.IsolatedAsyncioTestCase):
         def some_func(x: int) -> int:
             return x * 10
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             _ = some_func(100)
-        except ValueError as err:
-            value_error = err
-
-        assert value_error is not None
 
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"^Unexpected coroutine resulting from the condition <function .*> for a sync function <function .*>\.$",
         )
 
@@ -102,16 +85,11 @@ class TestSyncFunctionConditionCoroutineFail(unittest.IsolatedAsyncioTestCase):
         def some_func() -> int:
             return 100
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             _ = some_func()
-        except ValueError as err:
-            value_error = err
-
-        assert value_error is not None
 
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"^Unexpected coroutine resulting from the condition <function .*> for a sync function <function .*>\.$",
         )
 
@@ -124,15 +102,11 @@ class TestSyncFunctionConditionCoroutineFail(unittest.IsolatedAsyncioTestCase):
         def some_func(lst: List[int]) -> None:
             lst.append(1984)
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             some_func([1])
-        except ValueError as err:
-            value_error = err
 
-        assert value_error is not None
         self.assertRegex(
-            str(value_error),
+            str(context.exception),
             r"^Unexpected coroutine resulting "
             r"from the snapshot capture <function .*> of a sync function <function .*>.$",
         )
@@ -143,22 +117,16 @@ class TestAsyncInvariantsFail(unittest.IsolatedAsyncioTestCase):
         async def some_async_invariant(self: "A") -> bool:
             return self.x > 0
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             # pylint: disable=unused-variable
             @icontract.invariant(some_async_invariant)
             class A:
                 def __init__(self) -> None:
                     self.x = 100
 
-        except ValueError as error:
-            value_error = error
-
-        assert value_error is not None
-
         self.assertEqual(
             "Async conditions are not possible in invariants as sync methods such as __init__ have to be wrapped.",
-            str(value_error),
+            str(context.exception),
         )
 
 
@@ -2,7 +2,6 @@
 # pylint: disable=invalid-name
 
 import unittest
-from typing import Optional
 
 import icontract
 
@@ -41,15 +40,11 @@ class TestAsyncMethod(unittest.IsolatedAsyncioTestCase):
                 self.x = -1
 
         a = A()
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             await a.some_func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertTrue(
-            tests.error.wo_mandatory_location(str(violation_error)).startswith(
+            tests.error.wo_mandatory_location(str(context.exception)).startswith(
                 "self.x > 0"
             )
         )
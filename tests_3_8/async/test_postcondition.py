@@ -4,7 +4,7 @@
 # pylint: disable=unnecessary-lambda
 
 import unittest
-from typing import Optional, List
+from typing import List
 
 import icontract
 
@@ -36,16 +36,12 @@ class TestAsyncFunctionSyncCondition(unittest.IsolatedAsyncioTestCase):
         async def some_func() -> int:
             return -100
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = await some_func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "result > 0: result was -100",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -82,16 +78,12 @@ class TestAsyncFunctionAsyncCondition(unittest.IsolatedAsyncioTestCase):
         async def some_func() -> int:
             return -100
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = await some_func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "result_greater_zero: result was -100",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -116,14 +108,10 @@ class TestCoroutine(unittest.IsolatedAsyncioTestCase):
         async def some_func() -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             await some_func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
-        self.assertEqual("hihi", str(violation_error))
+        self.assertEqual("hihi", str(context.exception))
 
     async def test_reported_if_no_error_is_specified_as_we_can_not_recompute_coroutine_functions(
         self,
@@ -135,17 +123,13 @@ class TestCoroutine(unittest.IsolatedAsyncioTestCase):
         async def some_func() -> None:
             pass
 
-        runtime_error = None  # type: Optional[RuntimeError]
-        try:
+        with self.assertRaises(RuntimeError) as context:
             await some_func()
-        except RuntimeError as err:
-            runtime_error = err
 
-        assert runtime_error is not None
-        assert runtime_error.__cause__ is not None
-        assert isinstance(runtime_error.__cause__, ValueError)
+        assert context.exception.__cause__ is not None
+        assert isinstance(context.exception.__cause__, ValueError)
 
-        value_error = runtime_error.__cause__
+        value_error = context.exception.__cause__
 
         self.assertRegex(
             str(value_error),
@@ -171,17 +155,13 @@ class TestInvalid(unittest.IsolatedAsyncioTestCase):
         async def some_function(a: int) -> None:  # pylint: disable=unused-variable
             pass
 
-        type_err = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             await some_function(a=13)
-        except TypeError as err:
-            type_err = err
 
-        self.assertIsNotNone(type_err)
         self.assertEqual(
             "The argument(s) of the contract condition have not been set: ['b']. "
             "Does the original function define them? Did you supply them in the call?",
-            tests.error.wo_mandatory_location(str(type_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     async def test_conflicting_result_argument(self) -> None:
@@ -191,16 +171,12 @@ class TestInvalid(unittest.IsolatedAsyncioTestCase):
         ) -> None:  # pylint: disable=unused-variable
             pass
 
-        type_err = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             await some_function(a=13, result=2)
-        except TypeError as err:
-            type_err = err
 
-        self.assertIsNotNone(type_err)
         self.assertEqual(
             "Unexpected argument 'result' in a function decorated with postconditions.",
-            str(type_err),
+            str(context.exception),
         )
 
     async def test_conflicting_OLD_argument(self) -> None:
@@ -211,16 +187,12 @@ class TestInvalid(unittest.IsolatedAsyncioTestCase):
         ) -> None:  # pylint: disable=unused-variable
             pass
 
-        type_err = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             await some_function(a=[13], OLD=2)
-        except TypeError as err:
-            type_err = err
 
-        self.assertIsNotNone(type_err)
         self.assertEqual(
             "Unexpected argument 'OLD' in a function decorated with postconditions.",
-            str(type_err),
+            str(context.exception),
         )
 
     async def test_error_with_invalid_arguments(self) -> None:
@@ -233,17 +205,13 @@ class TestInvalid(unittest.IsolatedAsyncioTestCase):
         async def some_func(x: int) -> int:
             return x
 
-        type_error = None  # type: Optional[TypeError]
-        try:
+        with self.assertRaises(TypeError) as context:
             await some_func(x=0)
-        except TypeError as err:
-            type_error = err
 
-        self.assertIsNotNone(type_error)
         self.assertEqual(
             "The argument(s) of the contract error have not been set: ['z']. "
             "Does the original function define them? Did you supply them in the call?",
-            tests.error.wo_mandatory_location(str(type_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
     async def test_no_boolyness(self) -> None:
@@ -251,16 +219,12 @@ class TestInvalid(unittest.IsolatedAsyncioTestCase):
         async def some_func() -> None:
             pass
 
-        value_error = None  # type: Optional[ValueError]
-        try:
+        with self.assertRaises(ValueError) as context:
             await some_func()
-        except ValueError as err:
-            value_error = err
 
-        self.assertIsNotNone(value_error)
         self.assertEqual(
             "Failed to negate the evaluation of the condition.",
-            tests.error.wo_mandatory_location(str(value_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
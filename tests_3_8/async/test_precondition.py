@@ -4,7 +4,6 @@
 # pylint: disable=unnecessary-lambda
 
 import unittest
-from typing import Optional
 
 import icontract
 import tests.error
@@ -24,15 +23,11 @@ class TestAsyncFunctionSyncCondition(unittest.IsolatedAsyncioTestCase):
         async def some_func(x: int) -> int:
             return x * 10
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = await some_func(-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
-            "x > 0: x was -1", tests.error.wo_mandatory_location(str(violation_error))
+            "x > 0: x was -1", tests.error.wo_mandatory_location(str(context.exception))
         )
 
 
@@ -56,16 +51,12 @@ class TestAsyncFunctionAsyncCondition(unittest.IsolatedAsyncioTestCase):
         async def some_func(x: int) -> int:
             return x * 10
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = await some_func(-1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             "x_greater_zero: x was -1",
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
@@ -90,14 +81,10 @@ class TestCoroutine(unittest.IsolatedAsyncioTestCase):
         async def some_func() -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             await some_func()
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
-        self.assertEqual("hihi", str(violation_error))
+        self.assertEqual("hihi", str(context.exception))
 
     async def test_reported_if_no_error_is_specified_as_we_can_not_recompute_coroutine_functions(
         self,
@@ -109,17 +96,13 @@ class TestCoroutine(unittest.IsolatedAsyncioTestCase):
         async def some_func() -> None:
             pass
 
-        runtime_error = None  # type: Optional[RuntimeError]
-        try:
+        with self.assertRaises(RuntimeError) as context:
             await some_func()
-        except RuntimeError as err:
-            runtime_error = err
 
-        assert runtime_error is not None
-        assert runtime_error.__cause__ is not None
-        assert isinstance(runtime_error.__cause__, ValueError)
+        assert context.exception.__cause__ is not None
+        assert isinstance(context.exception.__cause__, ValueError)
 
-        value_error = runtime_error.__cause__
+        value_error = context.exception.__cause__
 
         self.assertRegex(
             str(value_error),
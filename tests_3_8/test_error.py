@@ -5,7 +5,6 @@
 
 import textwrap
 import unittest
-from typing import Optional
 
 import icontract
 
@@ -22,13 +21,9 @@ class TestNoneSpecified(unittest.TestCase):
         def some_func(x: int, y: int) -> None:
             pass
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             some_func(x=-1, y=-1000)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        assert violation_error is not None
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -37,7 +32,7 @@ class TestNoneSpecified(unittest.TestCase):
                 x was -1
                 y was 2"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
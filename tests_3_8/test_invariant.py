@@ -4,7 +4,7 @@
 
 import textwrap
 import unittest
-from typing import NamedTuple, Optional  # pylint: disable=unused-import
+from typing import NamedTuple  # pylint: disable=unused-import
 
 import icontract
 import tests.error
@@ -41,13 +41,9 @@ class TestViolation(unittest.TestCase):
             first: int
             second: int
 
-        violation_error = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             _ = RightHalfPlanePoint(1, -1)
-        except icontract.ViolationError as err:
-            violation_error = err
 
-        self.assertIsNotNone(violation_error)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -55,7 +51,7 @@ class TestViolation(unittest.TestCase):
                 self was RightHalfPlanePoint(first=1, second=-1)
                 self.second was -1"""
             ),
-            tests.error.wo_mandatory_location(str(violation_error)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 
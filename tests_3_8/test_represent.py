@@ -3,7 +3,6 @@
 # pylint: disable=unused-argument
 import textwrap
 import unittest
-from typing import Optional  # pylint: disable=unused-import
 
 import icontract._recompute
 import icontract._represent
@@ -19,13 +18,9 @@ class TestReprValues(unittest.TestCase):
         def func(x: int) -> int:
             return x
 
-        violation_err = None  # type: Optional[icontract.ViolationError]
-        try:
+        with self.assertRaises(icontract.ViolationError) as context:
             func(x=0)
-        except icontract.ViolationError as err:
-            violation_err = err
 
-        self.assertIsNotNone(violation_err)
         self.assertEqual(
             textwrap.dedent(
                 """\
@@ -33,7 +28,7 @@ class TestReprValues(unittest.TestCase):
                 t was 1
                 x was 0"""
             ),
-            tests.error.wo_mandatory_location(str(violation_err)),
+            tests.error.wo_mandatory_location(str(context.exception)),
         )
 
 